@@ -7,24 +7,108 @@ customised via environment variables:
 - ``MCP_LOG_LEVEL`` sets the minimum log level (default: ``INFO``).
 - ``MCP_LOG_FILE``  if set, log output will also be written to this file
   in addition to stderr.
+- ``MCP_LOG_PAYLOAD_MAX`` caps how many characters of a request or response
+  payload are logged (default: ``2000``).
+- ``MCP_LOG_PAYLOAD_SAMPLE`` is the fraction of payload records that are
+  kept, between ``0`` and ``1`` (default: ``1``).
+
+Records are handed to a :class:`~logging.handlers.QueueHandler` and written
+to stderr and the log file by a background
+:class:`~logging.handlers.QueueListener`, so slow log I/O never blocks a
+request. Large objects should be logged through :func:`payload`, which is
+only rendered when the record passes the level check and the sampler.
 """
 
 from __future__ import annotations
 
+import atexit
 import logging
 import os
+import queue
+import random
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any
 
 _LOG_LEVEL = os.getenv("MCP_LOG_LEVEL", "INFO").upper()
 _LOG_FORMAT = (
     "%(asctime)s [%(levelname)s] %(filename)s:%(funcName)s - %(message)s"
 )
 _LOG_FILE = os.getenv("MCP_LOG_FILE")
+PAYLOAD_MAX_CHARS = int(os.getenv("MCP_LOG_PAYLOAD_MAX", "2000"))
+PAYLOAD_SAMPLE_RATE = float(os.getenv("MCP_LOG_PAYLOAD_SAMPLE", "1"))
+
+
+class Payload:
+    """A logged object rendered lazily and truncated to ``max_chars``."""
+
+    __slots__ = ("value", "max_chars")
+
+    def __init__(self, value: Any, max_chars: int | None = None):
+        self.value = value
+        self.max_chars = PAYLOAD_MAX_CHARS if max_chars is None else max_chars
+
+    def __str__(self) -> str:
+        text = str(self.value)
+        if self.max_chars and len(text) > self.max_chars:
+            return f"{text[:self.max_chars]}... [{len(text) - self.max_chars} more chars]"
+        return text
+
+
+def payload(value: Any, max_chars: int | None = None) -> Payload:
+    """Wrap ``value`` for use as a logging argument.
+
+    ``str()`` is only called when a handler formats the record, so payloads
+    filtered out by level or sampling cost nothing beyond this wrapper.
+    """
+    return Payload(value, max_chars)
+
+
+class PayloadSampler(logging.Filter):
+    """Keep only ``rate`` of the records that carry a :class:`Payload`."""
+
+    def __init__(self, rate: float = PAYLOAD_SAMPLE_RATE):
+        super().__init__()
+        self.rate = rate
+        self.dropped = 0
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        args = record.args if isinstance(record.args, tuple) else ()
+        if self.rate >= 1 or not any(isinstance(arg, Payload) for arg in args):
+            return True
+        if random.random() < self.rate:
+            return True
+        self.dropped += 1
+        return False
+
 
 _handlers: list[logging.Handler] = [logging.StreamHandler()]
 if _LOG_FILE:
     _handlers.append(logging.FileHandler(_LOG_FILE, encoding="utf-8"))
+for _handler in _handlers:
+    _handler.setFormatter(logging.Formatter(_LOG_FORMAT))
+
+_queue: queue.SimpleQueue = queue.SimpleQueue()
+_queue_handler = QueueHandler(_queue)
+_queue_handler.addFilter(PayloadSampler())
+_listener: QueueListener | None = QueueListener(
+    _queue, *_handlers, respect_handler_level=True
+)
+
+_root = logging.getLogger()
+_root.setLevel(_LOG_LEVEL)
+_root.addHandler(_queue_handler)
+_listener.start()
+
+
+def stop_logging() -> None:
+    """Write out queued records and stop the background listener."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
 
-logging.basicConfig(level=_LOG_LEVEL, format=_LOG_FORMAT, handlers=_handlers)
+atexit.register(stop_logging)
 
 
 def get_logger(name: str | None = None) -> logging.Logger:
@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import threading
+import time
+from typing import Callable
+
+from mcp_logging import get_logger
+from mcp_spotify.auth.store import TokenStore
+from mcp_spotify.auth.tokens import (
+    Tokens,
+    needs_refresh,
+    refresh_tokens,
+    request_token_refresh,
+)
+from mcp_spotify.errors import InvalidTokenFileError
+from mcp_spotify_player.config import Config
+
+logger = get_logger(__name__)
+
+Refresher = Callable[[Tokens], Tokens]
+
+
+def _default_refresher(tokens: Tokens) -> Tokens:
+    return refresh_tokens(tokens, Config.SPOTIFY_CLIENT_ID, Config.SPOTIFY_CLIENT_SECRET)
+
+
+def _request_refresh(tokens: Tokens) -> Tokens:
+    return request_token_refresh(
+        tokens, Config.SPOTIFY_CLIENT_ID, Config.SPOTIFY_CLIENT_SECRET
+    )
+
+
+class TokenManager:
+    """Own the current :class:`Tokens` and keep them fresh.
+
+    Refreshed tokens replace the current ones atomically, so every caller of
+    :meth:`get` sees them. Only one refresh runs at a time: callers that were
+    waiting on it reuse its result instead of refreshing again. An optional
+    background thread renews the access token ``renew_margin`` seconds before
+    ``expires_at``.
+
+    With a :class:`TokenStore` the tokens are also shared with other processes:
+    a newer ``tokens.json`` written elsewhere is adopted, and refreshes happen
+    under the store's file lock.
+    """
+
+    def __init__(
+        self,
+        tokens: Tokens | None = None,
+        refresher: Refresher | None = None,
+        *,
+        store: TokenStore | None = None,
+        renew_margin: float | None = None,
+    ):
+        self._tokens = tokens
+        self._store = store
+        if refresher is None:
+            # The store persists refreshed tokens itself, under its lock
+            refresher = _request_refresh if store is not None else _default_refresher
+        self._refresher = refresher
+        self.renew_margin = (
+            Config.TOKEN_RENEW_MARGIN if renew_margin is None else renew_margin
+        )
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self.refresh_count = 0
+
+    def get(self) -> Tokens | None:
+        """Return the current tokens, adopting newer ones from the store."""
+        if self._store is not None and self._store.changed():
+            self._adopt_stored()
+        with self._lock:
+            return self._tokens
+
+    __call__ = get
+
+    def _adopt_stored(self) -> None:
+        try:
+            stored = self._store.load()
+        except InvalidTokenFileError as e:
+            logger.warning("Ignoring unreadable tokens file: %s", e)
+            return
+        if stored is None:
+            return
+        with self._lock:
+            current = self._tokens
+            if current is None or stored.expires_at >= current.expires_at:
+                self._tokens = stored
+
+    def set(self, tokens: Tokens | None) -> None:
+        """Replace the current tokens, e.g. after a new OAuth login."""
+        with self._lock:
+            self._tokens = tokens
+
+    def refresh(self, stale: Tokens | None = None) -> Tokens:
+        """Refresh the access token, at most once for a given ``stale`` token.
+
+        If another thread already replaced ``stale`` while this one waited,
+        its tokens are returned without contacting Spotify again.
+        """
+        with self._refresh_lock:
+            current = self.get()
+            if (
+                current is not None
+                and stale is not None
+                and current.access_token != stale.access_token
+                and not needs_refresh(current)
+            ):
+                return current
+            base = current or stale
+            if base is None:
+                raise ValueError("No tokens to refresh")
+            if self._store is not None:
+                refreshed = self._store.refresh(base, self._refresher)
+            else:
+                refreshed = self._refresher(base)
+            self.set(refreshed)
+            self.refresh_count += 1
+            logger.debug("Access token refreshed (expires_at=%s)", refreshed.expires_at)
+            return refreshed
+
+    def start(self) -> None:
+        """Start renewing the access token in the background."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._renew_loop, name="mcp-token-renewal", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the background renewal thread."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=1)
+            self._thread = None
+
+    def _renew_loop(self) -> None:
+        while not self._stop.is_set():
+            tokens = self.get()
+            if tokens is None or not tokens.refresh_token:
+                self._stop.wait(60)
+                continue
+            delay = tokens.expires_at - self.renew_margin - time.time()
+            if delay > 0:
+                self._stop.wait(min(delay, 3600))
+                continue
+            try:
+                self.refresh(tokens)
+            except Exception as e:
+                logger.warning("Background token renewal failed: %s", e)
+                self._stop.wait(30)
@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Iterator
+
+from mcp_logging import get_logger
+from mcp_spotify.auth.tokens import Tokens, load_tokens, needs_refresh, write_tokens
+
+logger = get_logger(__name__)
+
+if os.name == "nt":  # pragma: no cover - exercised on Windows only
+    import msvcrt
+
+    def _lock_file(handle) -> None:
+        while True:
+            try:
+                msvcrt.locking(handle.fileno(), msvcrt.LK_LOCK, 1)
+                return
+            except OSError:
+                time.sleep(0.05)
+
+    def _unlock_file(handle) -> None:
+        handle.seek(0)
+        msvcrt.locking(handle.fileno(), msvcrt.LK_UNLCK, 1)
+
+else:
+    import fcntl
+
+    def _lock_file(handle) -> None:
+        fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+
+    def _unlock_file(handle) -> None:
+        fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+
+
+_Signature = tuple[int, int, int]
+
+
+class TokenStore:
+    """``tokens.json`` shared safely between several server processes.
+
+    Refresh-and-persist happens under an advisory lock on ``tokens.json.lock``
+    so only one process talks to the token endpoint at a time. Writes by other
+    processes are noticed through the file's mtime, inode and size; the file
+    is parsed again only when one of them changes.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.lock_path = path.with_suffix(path.suffix + ".lock")
+        self._signature: _Signature | None = None
+        self._tokens: Tokens | None = None
+        self._mutex = threading.Lock()
+
+    def _stat(self) -> _Signature | None:
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
+            return None
+        return (st.st_mtime_ns, st.st_ino, st.st_size)
+
+    def changed(self) -> bool:
+        """Return ``True`` if the file differs from the last one read or written."""
+        return self._stat() != self._signature
+
+    def load(self) -> Tokens | None:
+        """Return the stored tokens, re-reading the file only if it changed.
+
+        Raises ``InvalidTokenFileError`` if the file exists but is invalid.
+        """
+        with self._mutex:
+            signature = self._stat()
+            if signature is None:
+                self._signature, self._tokens = None, None
+            elif signature != self._signature:
+                self._tokens = load_tokens(self.path)
+                self._signature = signature
+            return self._tokens
+
+    def save(self, tokens: Tokens) -> None:
+        """Atomically persist ``tokens``. Call while holding :meth:`lock`."""
+        with self._mutex:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            write_tokens(tokens, self.path)
+            self._tokens = tokens
+            self._signature = self._stat()
+
+    @contextmanager
+    def lock(self) -> Iterator[None]:
+        """Hold the cross-process advisory lock."""
+        self.lock_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.lock_path, "a+") as handle:
+            _lock_file(handle)
+            try:
+                yield
+            finally:
+                _unlock_file(handle)
+
+    def refresh(self, stale: Tokens, refresher: Callable[[Tokens], Tokens]) -> Tokens:
+        """Refresh ``stale`` unless another process already did.
+
+        ``refresher`` must only contact Spotify; persisting is done here while
+        the lock is held so a rotated refresh token is never lost.
+        """
+        with self.lock():
+            latest = self.load()
+            if (
+                latest is not None
+                and latest.access_token != stale.access_token
+                and not needs_refresh(latest)
+            ):
+                logger.debug("Adopting tokens refreshed by another process")
+                return latest
+            refreshed = refresher(latest or stale)
+            self.save(refreshed)
+            return refreshed
@@ -6,7 +6,6 @@ from dataclasses import asdict, dataclass, field
 from pathlib import Path
 from typing import Any
 
-import requests
 import time
 
 from mcp_spotify.errors import (
@@ -15,6 +14,7 @@ from mcp_spotify.errors import (
     RefreshNotPossibleError,
 )
 from mcp_spotify_player.config import Config, resolve_tokens_path
+from mcp_spotify_player.http_pool import get_http_pool
 from mcp_logging import get_logger
 
 logger = get_logger(__name__)
@@ -74,8 +74,8 @@ def has_refresh_token(tokens: Tokens | dict[str, Any]) -> bool:
     return bool(tokens.get("refresh_token"))
 
 
-def refresh_tokens(tokens: Tokens, client_id: str, client_secret: str) -> Tokens:
-    """Refresh ``tokens`` using Spotify's OAuth refresh flow and persist them."""
+def request_token_refresh(tokens: Tokens, client_id: str, client_secret: str) -> Tokens:
+    """Exchange ``tokens.refresh_token`` for new tokens without persisting them."""
 
     if not tokens.refresh_token:
         raise RefreshNotPossibleError(
@@ -88,27 +88,37 @@ def refresh_tokens(tokens: Tokens, client_id: str, client_secret: str) -> Tokens
         "client_id": client_id,
         "client_secret": client_secret,
     }
-    response = requests.post(Config.SPOTIFY_TOKEN_URL, data=data)
+    response = get_http_pool().post(Config.SPOTIFY_TOKEN_URL, data=data)
     if response.status_code != 200:
         raise RefreshNotPossibleError(
             f"Token refresh failed: {response.status_code}"
         )
     payload: dict[str, Any] = response.json()
-    refreshed = Tokens(
+    return Tokens(
         access_token=payload["access_token"],
         refresh_token=payload.get("refresh_token", tokens.refresh_token),
         expires_at=int(time.time()) + int(payload["expires_in"]) - 60,
         scopes=tokens.scopes,
     )
 
-    path = resolve_tokens_path()
-    data = asdict(refreshed)
+
+def write_tokens(tokens: Tokens, path: Path) -> None:
+    """Atomically write ``tokens`` to ``path``."""
+
+    data = asdict(tokens)
     data.pop("scopes", None)
-    if refreshed.scopes:
-        data["scopes"] = sorted(refreshed.scopes)
+    if tokens.scopes:
+        data["scopes"] = sorted(tokens.scopes)
     tmp = path.with_suffix(path.suffix + ".tmp")
     tmp.write_text(json.dumps(data))
     os.replace(tmp, path)
+
+
+def refresh_tokens(tokens: Tokens, client_id: str, client_secret: str) -> Tokens:
+    """Refresh ``tokens`` using Spotify's OAuth refresh flow and persist them."""
+
+    refreshed = request_token_refresh(tokens, client_id, client_secret)
+    write_tokens(refreshed, resolve_tokens_path())
     return refreshed
 
 
@@ -151,7 +161,7 @@ def load_tokens(path: Path) -> Tokens:
     invalid: list[str] = []
 
     for key, typ in required:
-        logger.info("Checking key '%s' of type %s. Value: %s", key, typ.__name__, data.get(key))
+        logger.debug("Checking key '%s' of type %s", key, typ.__name__)
         if key not in data:
             missing.append(key)
         elif not isinstance(data[key], typ):
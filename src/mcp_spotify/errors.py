@@ -41,3 +41,11 @@ class PremiumRequiredError(McpUserError):
 class NoActiveDeviceError(McpUserError):
     """Raised when there is no active playback device."""
 
+
+
+class DeadlineExceededError(McpUserError):
+    """Raised when a tool call runs out of its time budget."""
+
+
+class RateLimitedError(McpUserError):
+    """Raised when Spotify's rate limit leaves no time to retry a request."""
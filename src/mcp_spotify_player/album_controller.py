@@ -2,6 +2,7 @@ from typing import Any, Dict, List
 
 from mcp_logging import get_logger
 from mcp_spotify_player.mcp_models import AlbumInfo, TrackInfo
+from mcp_spotify_player.paginator import Limit
 from mcp_spotify_player.spotify_client import SpotifyClient
 
 logger = get_logger(__name__)
@@ -37,7 +38,7 @@ class AlbumController:
         except Exception as e:
             return {"success": False, "message": f"Error: {str(e)}"}
 
-    def get_album_tracks(self, album_id: str, limit: int = 20) -> Dict[str, Any]:
+    def get_album_tracks(self, album_id: str, limit: Limit = 20) -> Dict[str, Any]:
         """Retrieve tracks from an album."""
         try:
             if not self._validate_spotify_id(album_id):
@@ -95,7 +96,7 @@ class AlbumController:
         except Exception as e:
             return {"success": False, "message": f"Error: {str(e)}"}
 
-    def get_saved_albums(self, limit: int = 20) -> Dict[str, Any]:
+    def get_saved_albums(self, limit: Limit = 20) -> Dict[str, Any]:
         """Retrieve albums saved in the user's library."""
         try:
             saved = self.albums_client.get_saved_albums(limit)
@@ -151,10 +152,10 @@ class AlbumController:
                     "success": False,
                     "message": "Invalid album IDs. Provide valid Spotify IDs.",
                 }
-            result = self.albums_client.save_albums(album_ids)
-            if result:
+            failed = self.albums_client.save_albums(album_ids)
+            if not failed:
                 return {"success": True, "message": "Albums saved successfully"}
-            return {"success": False, "message": "Could not save albums"}
+            return self._partial_write("save", "saved", album_ids, failed)
         except Exception as e:
             return {"success": False, "message": f"Error: {str(e)}"}
 
@@ -166,13 +167,28 @@ class AlbumController:
                     "success": False,
                     "message": "Invalid album IDs. Provide valid Spotify IDs.",
                 }
-            result = self.albums_client.delete_saved_albums(album_ids)
-            if result:
+            failed = self.albums_client.delete_saved_albums(album_ids)
+            if not failed:
                 return {"success": True, "message": "Albums deleted successfully"}
-            return {"success": False, "message": "Could not delete albums"}
+            return self._partial_write("delete", "deleted", album_ids, failed)
         except Exception as e:
             return {"success": False, "message": f"Error: {str(e)}"}
 
+    @staticmethod
+    def _partial_write(
+        verb: str, past: str, album_ids: List[str], failed: List[str]
+    ) -> Dict[str, Any]:
+        """Describe a library write where some chunks failed."""
+        done = len(album_ids) - len(failed)
+        if done == 0:
+            return {"success": False, "message": f"Could not {verb} albums", "failed_ids": failed}
+        return {
+            "success": False,
+            "message": f"{done} of {len(album_ids)} albums {past}; "
+            f"could not {verb} {len(failed)}",
+            "failed_ids": failed,
+        }
+
     def _validate_spotify_id(self, id_string: str) -> bool:
         """Validates if the string is a valid Spotify ID"""
         return bool(id_string) and len(id_string) > 10 and id_string.isalnum()
@@ -2,6 +2,7 @@ from typing import Any, Dict, List
 
 from mcp_logging import get_logger
 from mcp_spotify_player.mcp_models import AlbumInfo, ArtistInfo, TrackInfo
+from mcp_spotify_player.paginator import Limit
 from mcp_spotify_player.spotify_client import SpotifyClient
 
 logger = get_logger(__name__)
@@ -42,7 +43,7 @@ class ArtistsController:
     def get_artist_albums(
         self,
         artist_id: str,
-        limit: int = 20,
+        limit: Limit = 20,
         include_groups: str | None = None,
     ) -> Dict[str, Any]:
         """Retrieve albums for a specific artist."""
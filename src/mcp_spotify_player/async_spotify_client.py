@@ -0,0 +1,440 @@
+"""Asynchronous counterpart of :class:`SpotifyClient` built on ``httpx``.
+
+All sub-clients share the pool's ``httpx.AsyncClient`` with HTTP/2 enabled,
+so many concurrent requests are multiplexed over a single connection to
+``api.spotify.com``. Sub-client methods have the same names and arguments as
+their synchronous versions but must be awaited. Close the pool's client with
+``await get_http_pool().aclose()`` before the event loop ends.
+"""
+
+import asyncio
+import time
+from typing import Any, Dict, List, Optional
+
+import httpx
+
+from mcp_spotify.auth.manager import TokenManager
+from mcp_spotify.auth.tokens import (
+    REQUIRED_SCOPES,
+    Tokens,
+    check_scopes,
+    has_refresh_token,
+    needs_refresh,
+)
+from mcp_spotify.errors import DeadlineExceededError, NotAuthenticatedError, RateLimitedError
+from mcp_spotify_player.config import Config
+from mcp_spotify_player.http_pool import HttpPool, get_http_pool
+from mcp_spotify_player.rate_limiter import RateLimiter, endpoint_group, get_rate_limiter
+from mcp_spotify_player.spotify_client import TokensProvider, handle_response
+from mcp_spotify_player.timeouts import bound, deadline_exceeded, request_timeout
+
+
+class AsyncSpotifyPlaybackClient:
+    """Async client specialized in playback-related operations."""
+
+    def __init__(self, requester):
+        """Initialise with an object providing an async ``_make_request``."""
+        self.requester = requester
+
+    async def play(
+        self, context_uri: Optional[str] = None, uris: Optional[List[str]] = None
+    ):
+        """Starts playback and returns True if successful, or the error message if it fails"""
+        data = {}
+        if context_uri:
+            data["context_uri"] = context_uri
+        elif uris:
+            data["uris"] = uris
+        result = await self.requester._make_request(
+            "PUT", "/me/player/play", feature="playback", json=data
+        )
+        if result is not None:
+            return result
+        return {"error": "Playback failed. Please check that you have an active device on Spotify."}
+
+    async def pause(self) -> bool:
+        """Pause playback"""
+        result = await self.requester._make_request("PUT", "/me/player/pause", feature="playback")
+        return result is not None
+
+    async def skip_next(self) -> bool:
+        """Skip to the next song"""
+        result = await self.requester._make_request("POST", "/me/player/next", feature="playback")
+        return result is not None
+
+    async def skip_previous(self) -> bool:
+        """Skip to the previous song"""
+        result = await self.requester._make_request(
+            "POST", "/me/player/previous", feature="playback"
+        )
+        return result is not None
+
+    async def set_volume(self, volume_percent: int) -> bool:
+        """Sets the volume (0-100)"""
+        if not 0 <= volume_percent <= 100:
+            return False
+        result = await self.requester._make_request(
+            "PUT", f"/me/player/volume?volume_percent={volume_percent}", feature="playback"
+        )
+        return result is not None
+
+    async def set_repeat(self, state: str, device_id: Optional[str] = None) -> bool:
+        """Sets repeat mode: 'track', 'context', or 'off'"""
+        if state not in {"track", "context", "off"}:
+            return False
+        params = {"state": state}
+        if device_id:
+            params["device_id"] = device_id
+        result = await self.requester._make_request(
+            "PUT", "/me/player/repeat", feature="playback", params=params
+        )
+        return result is not None
+
+    async def add_to_queue(self, uri: str, device_id: str | None = None) -> None:
+        """Add a track or episode to the user's queue."""
+        params = {"uri": uri}
+        if device_id:
+            params["device_id"] = device_id
+        result = await self.requester._make_request(
+            "POST", "/me/player/queue", feature="playback", params=params
+        )
+        if result is not True:
+            raise RuntimeError("Failed to add item to queue")
+
+    async def get_queue(self, limit: int | None = None) -> dict:
+        """Fetch the current queue."""
+        try:
+            data = await self.requester._make_request("GET", "/me/player/queue")
+            queue = data.get("queue") or []
+            if limit is not None:
+                queue = queue[: int(limit)]
+            return {
+                "success": True,
+                "currently_playing": data.get("currently_playing"),
+                "queue": queue,
+            }
+        except Exception as e:
+            return {"success": False, "message": f"Error fetching queue: {e}"}
+
+    async def get_current_playing(self) -> Optional[Dict[str, Any]]:
+        """Gets the information of the currently playing song"""
+        return await self.requester._make_request(
+            "GET", "/me/player/currently-playing", feature="playback"
+        )
+
+    async def get_playback_state(self) -> Optional[Dict[str, Any]]:
+        """Gets the current playback status"""
+        return await self.requester._make_request("GET", "/me/player", feature="playback")
+
+    async def get_devices(self) -> Optional[Dict[str, Any]]:
+        """Get available playback devices"""
+        return await self.requester._make_request("GET", "/me/player/devices", feature="playback")
+
+    async def _search(
+        self,
+        query: str,
+        type_: str,
+        limit: int = 10,
+        offset: int = 0,
+        market: str | None = None,
+    ) -> Optional[Dict[str, Any]]:
+        """Internal helper to perform a search request against Spotify."""
+        params = {"q": query, "type": type_, "limit": limit, "offset": offset}
+        if market:
+            params["market"] = market
+        return await self.requester._make_request(
+            "GET", "/search", params=params, feature="playback"
+        )
+
+    async def search(self, query: str, type_: str, limit: int = 10) -> Optional[Dict[str, Any]]:
+        """Search for any supported type on Spotify (track, artist, album, etc.)."""
+        return await self._search(query, type_, limit)
+
+    async def search_tracks(self, query: str, limit: int = 10) -> Optional[Dict[str, Any]]:
+        """Search for songs on Spotify."""
+        return await self._search(query, "track", limit)
+
+    async def search_artists(self, query: str, limit: int = 10) -> Optional[Dict[str, Any]]:
+        """Search for artists on Spotify."""
+        return await self._search(query, "artist", limit)
+
+    async def search_collections(
+        self, q: str, type: str, limit: int = 20, offset: int = 0, market: str | None = None
+    ):
+        """Search for playlists or albums on Spotify."""
+        return await self._search(q, type, limit, offset, market)
+
+
+class AsyncSpotifyPlaylistsClient:
+    """Async client specialized in playlist-related operations."""
+
+    def __init__(self, requester):
+        """Initialise with an object providing an async ``_make_request``."""
+        self.requester = requester
+
+    async def get_user_playlists(self, limit: int = 20) -> Optional[Dict[str, Any]]:
+        """Gets the user's playlists"""
+        return await self.requester._make_request(
+            "GET", "/me/playlists", feature="playlists", params={"limit": limit}
+        )
+
+    async def create_playlist(
+        self, playlist_name: str, description: str = "", public: bool = False
+    ) -> Optional[Dict[str, Any]]:
+        """Create a new playlist for the current user."""
+        user_profile = await self.requester._make_request("GET", "/me")
+        if not user_profile or "id" not in user_profile:
+            return None
+        payload = {"name": playlist_name, "description": description, "public": public}
+        return await self.requester._make_request(
+            "POST", f"/users/{user_profile['id']}/playlists", feature="playlists", json=payload
+        )
+
+    async def get_playlist_tracks(
+        self, playlist_id: str, limit: int = 20
+    ) -> Optional[Dict[str, Any]]:
+        """Gets songs from a playlist"""
+        return await self.requester._make_request(
+            "GET", f"/playlists/{playlist_id}/tracks", feature="playlists", params={"limit": limit}
+        )
+
+    async def rename_playlist(self, playlist_id: str, playlist_name: str) -> bool:
+        """Rename a playlist from the user's library"""
+        result = await self.requester._make_request(
+            "PUT", f"/playlists/{playlist_id}", feature="playlists", json={"name": playlist_name}
+        )
+        return result is not None
+
+    async def clear_playlist(self, playlist_id: str) -> bool:
+        """Remove all tracks from a playlist"""
+        result = await self.requester._make_request(
+            "PUT", f"/playlists/{playlist_id}/tracks", feature="playlists", json={"uris": []}
+        )
+        return result is not None
+
+    async def add_tracks_to_playlist(self, playlist_id: str, track_uris: List[str]) -> bool:
+        """Add tracks to a playlist"""
+        result = await self.requester._make_request(
+            "POST", f"/playlists/{playlist_id}/tracks", feature="playlists", json={"uris": track_uris}
+        )
+        return result is not None
+
+
+class AsyncSpotifyAlbumsClient:
+    """Async client specialized in album-related operations."""
+
+    def __init__(self, requester):
+        """Initialise with an object providing an async ``_make_request``."""
+        self.requester = requester
+
+    async def get_album(self, album_id: str) -> Optional[Dict[str, Any]]:
+        """Retrieve a single album by its Spotify ID."""
+        return await self.requester._make_request("GET", f"/albums/{album_id}")
+
+    async def get_albums(self, album_ids: List[str]) -> Optional[Dict[str, Any]]:
+        """Retrieve multiple albums by their Spotify IDs."""
+        return await self.requester._make_request(
+            "GET", "/albums", params={"ids": ",".join(album_ids)}
+        )
+
+    async def get_album_tracks(self, album_id: str, limit: int = 20) -> Optional[Dict[str, Any]]:
+        """Retrieve tracks for a specific album."""
+        return await self.requester._make_request(
+            "GET", f"/albums/{album_id}/tracks", params={"limit": limit}
+        )
+
+    async def get_saved_albums(self, limit: int = 20) -> Optional[Dict[str, Any]]:
+        """Retrieve albums saved in the user's library."""
+        return await self.requester._make_request(
+            "GET", "/me/albums", feature="albums", params={"limit": limit}
+        )
+
+    async def check_saved_albums(self, album_ids: List[str]) -> Optional[List[bool]]:
+        """Check if the specified albums are saved in the user's library."""
+        return await self.requester._make_request(
+            "GET", "/me/albums/contains", feature="albums", params={"ids": ",".join(album_ids)}
+        )
+
+    async def save_albums(self, album_ids: List[str]) -> bool:
+        """Save one or more albums to the user's library."""
+        result = await self.requester._make_request(
+            "PUT", "/me/albums", feature="albums", json={"ids": album_ids}
+        )
+        return result is not None
+
+    async def delete_saved_albums(self, album_ids: List[str]) -> bool:
+        """Remove one or more albums from the user's library."""
+        result = await self.requester._make_request(
+            "DELETE", "/me/albums", feature="albums", json={"ids": album_ids}
+        )
+        return result is not None
+
+
+class AsyncSpotifyArtistsClient:
+    """Async client specialized in artist-related operations."""
+
+    def __init__(self, requester):
+        """Initialise with an object providing an async ``_make_request``."""
+        self.requester = requester
+
+    async def get_artist(self, artist_id: str) -> Optional[Dict[str, Any]]:
+        """Retrieve a single artist by its Spotify ID."""
+        return await self.requester._make_request("GET", f"/artists/{artist_id}")
+
+    async def get_artist_albums(
+        self, artist_id: str, *, include_groups: Optional[str] = None, limit: int = 20
+    ) -> Optional[Dict[str, Any]]:
+        """Retrieve albums of a specific artist."""
+        params: Dict[str, Any] = {"limit": limit}
+        if include_groups:
+            params["include_groups"] = include_groups
+        return await self.requester._make_request(
+            "GET", f"/artists/{artist_id}/albums", params=params
+        )
+
+    async def get_artist_top_tracks(
+        self, artist_id: str, *, market: str = "US"
+    ) -> Optional[Dict[str, Any]]:
+        """Retrieve top tracks for a specific artist."""
+        return await self.requester._make_request(
+            "GET", f"/artists/{artist_id}/top-tracks", params={"market": market}
+        )
+
+
+class AsyncSpotifyClient:
+    """Unified async interface to the Spotify Web API.
+
+    Requests go through the process-wide :class:`HttpPool`'s async client and
+    :class:`RateLimiter`, and token refreshes through a :class:`TokenManager`,
+    so async and sync callers share connections, the rate budget and tokens.
+    """
+
+    def __init__(
+        self,
+        tokens_provider: TokensProvider | None = None,
+        *,
+        verify_scopes: bool = False,
+        http_client: httpx.AsyncClient | None = None,
+        token_manager: TokenManager | None = None,
+        http_pool: HttpPool | None = None,
+        rate_limiter: RateLimiter | None = None,
+    ):
+        self.token_manager = token_manager
+        # Without a shared manager a private one still makes concurrent
+        # refreshes of the same stale token single-flight
+        self._refresher = token_manager or TokenManager()
+        if tokens_provider is None and token_manager is not None:
+            tokens_provider = token_manager.get
+        self.tokens_provider: TokensProvider = tokens_provider or (lambda: None)
+        self.config = Config()
+        self.verify_scopes = verify_scopes
+        self._http = http_client
+        self.pool = http_pool or get_http_pool()
+        self.rate_limiter = rate_limiter or get_rate_limiter()
+        self.playback = AsyncSpotifyPlaybackClient(self)
+        self.playlists = AsyncSpotifyPlaylistsClient(self)
+        self.albums = AsyncSpotifyAlbumsClient(self)
+        self.artists = AsyncSpotifyArtistsClient(self)
+
+    @property
+    def http(self) -> httpx.AsyncClient:
+        """Return the injected client, or the pool's client for this event loop."""
+        if self._http is not None:
+            return self._http
+        return self.pool.async_client()
+
+    async def _refresh(self, tokens: Tokens) -> Tokens:
+        return await asyncio.to_thread(self._refresher.refresh, tokens)
+
+    async def _acquire(self, group: str, deadline: float) -> bool:
+        """Wait, without blocking the loop, for a rate-limiter slot."""
+        while True:
+            wait = self.rate_limiter.reserve(group)
+            if wait <= 0:
+                return True
+            if time.monotonic() + wait > deadline:
+                return False
+            await asyncio.sleep(wait)
+
+    async def _send(self, method: str, endpoint: str, url: str, headers: dict, kwargs: dict):
+        """Send a request through the rate limiter, retrying 429 responses.
+
+        Mirrors :meth:`SpotifyClient._send`: a 429 pauses the endpoint group
+        for ``Retry-After`` seconds and the request is sent again while that
+        fits within ``RATE_LIMIT_MAX_WAIT``.
+        """
+        group = endpoint_group(endpoint)
+        deadline = bound(time.monotonic() + self.config.RATE_LIMIT_MAX_WAIT)
+        response = None
+        while True:
+            if not await self._acquire(group, deadline):
+                if response is not None:
+                    return response
+                if deadline_exceeded():
+                    raise DeadlineExceededError("Tool deadline exceeded.")
+                retry_in = self.rate_limiter.retry_in(group)
+                raise RateLimitedError(
+                    f"Spotify rate limit reached; try again in {retry_in:.0f}s."
+                )
+            request_kwargs = dict(kwargs)
+            request_kwargs.setdefault("timeout", request_timeout(method, url))
+            try:
+                response = await self.http.request(
+                    method, url, headers=headers, **request_kwargs
+                )
+            except httpx.TimeoutException as exc:
+                if deadline_exceeded():
+                    raise DeadlineExceededError("Tool deadline exceeded.") from exc
+                raise
+            self.rate_limiter.record(
+                group, response.status_code, response.headers.get("Retry-After")
+            )
+            if response.status_code != 429:
+                return response
+
+    async def _make_request(
+        self, method: str, endpoint: str, *, feature: str | None = None, **kwargs
+    ):
+        tokens = self.tokens_provider()
+        if tokens is None or not has_refresh_token(tokens):
+            raise NotAuthenticatedError("User token missing. Run /auth.")
+        if needs_refresh(tokens):
+            tokens = await self._refresh(tokens)
+
+        if feature and self.verify_scopes:
+            check_scopes(tokens, REQUIRED_SCOPES[feature])
+
+        headers = {
+            "Authorization": f"Bearer {tokens.access_token}",
+            "Content-Type": "application/json",
+        }
+        url = f"{self.config.SPOTIFY_API_BASE}{endpoint}"
+        response = await self._send(method, endpoint, url, headers, kwargs)
+
+        if response.status_code == 401:
+            if has_refresh_token(tokens):
+                tokens = await self._refresh(tokens)
+                headers["Authorization"] = f"Bearer {tokens.access_token}"
+                response = await self._send(method, endpoint, url, headers, kwargs)
+            else:
+                raise NotAuthenticatedError("User token missing. Run /auth.")
+
+        return handle_response(response, method, endpoint, tokens, feature=feature)
+
+    async def aclose(self) -> None:
+        """Close an injected HTTP client; the pool's client stays open for others."""
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+
+    async def __aenter__(self) -> "AsyncSpotifyClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    def __getattr__(self, name):
+        for client in (self.playback, self.playlists, self.albums, self.artists):
+            if hasattr(client, name):
+                return getattr(client, name)
+        raise AttributeError(f"{self.__class__.__name__} object has no attribute {name}")
@@ -0,0 +1,121 @@
+"""Automatic batching of single-ID lookups.
+
+Lookups arriving within a short window are merged into one call of a
+multi-get function (``/albums?ids=``, ``/artists?ids=``) and each caller gets
+its own item back. The first caller of a window waits for it to close (or for
+the batch to fill up) and then fetches for everyone.
+
+The batch runs under the latest tool deadline among its callers, so a caller
+with a short budget cannot make the others fail; each caller still stops
+waiting, with ``DeadlineExceededError``, once its own deadline passes.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any, Callable, Dict, List, Sequence
+
+from mcp_spotify.errors import DeadlineExceededError
+from mcp_spotify_player.timeouts import current_deadline, remaining, replace_deadline
+
+LoadMany = Callable[[Sequence[str]], Dict[str, Any]]
+
+
+class _Pending:
+    __slots__ = ("done", "result", "error", "deadlines")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+        # Tool deadline of every caller waiting on this key (None: unbounded)
+        self.deadlines: List[float | None] = []
+
+
+def _latest(deadlines: List[float | None]) -> float | None:
+    if not deadlines or None in deadlines:
+        return None
+    return max(deadlines)
+
+
+class BatchLoader:
+    """Collect ``load(id)`` calls and resolve them with ``load_many``.
+
+    ``load_many`` receives at most ``max_batch`` distinct IDs and returns a
+    mapping from ID to item. With ``window`` set to ``0`` every lookup is
+    sent on its own.
+    """
+
+    def __init__(self, load_many: LoadMany, max_batch: int, window: float):
+        self.load_many = load_many
+        self.max_batch = max_batch
+        self.window = window
+        self._cond = threading.Condition()
+        self._pending: Dict[str, _Pending] = {}
+        self._collecting = False
+        self.batches = 0
+        self.loaded = 0
+
+    def load(self, key: str) -> Any:
+        """Return the item for ``key``, batched with concurrent lookups."""
+        if self.window <= 0:
+            return self._run([key])[key]
+
+        with self._cond:
+            pending = self._pending.get(key)
+            if pending is None:
+                pending = self._pending[key] = _Pending()
+            pending.deadlines.append(current_deadline())
+            leader = not self._collecting
+            if leader:
+                self._collecting = True
+            elif len(self._pending) >= self.max_batch:
+                self._cond.notify_all()
+
+        if leader:
+            self._collect()
+
+        if not pending.done.wait(remaining()):
+            raise DeadlineExceededError("Tool deadline exceeded.")
+        if pending.error is not None:
+            raise pending.error
+        return pending.result
+
+    def _collect(self) -> None:
+        deadline = time.monotonic() + self.window
+        with self._cond:
+            while len(self._pending) < self.max_batch:
+                left = deadline - time.monotonic()
+                if left <= 0:
+                    break
+                self._cond.wait(left)
+            batch, self._pending = self._pending, {}
+            self._collecting = False
+
+        keys = list(batch)
+        for start in range(0, len(keys), self.max_batch):
+            chunk = keys[start:start + self.max_batch]
+            deadline = _latest([d for key in chunk for d in batch[key].deadlines])
+            try:
+                with replace_deadline(deadline):
+                    results = self._run(chunk)
+            except BaseException as exc:
+                for key in chunk:
+                    batch[key].error = exc
+                    batch[key].done.set()
+                continue
+            for key in chunk:
+                batch[key].result = results.get(key)
+                batch[key].done.set()
+
+    def _run(self, keys: List[str]) -> Dict[str, Any]:
+        with self._cond:
+            self.batches += 1
+            self.loaded += len(keys)
+        return self.load_many(keys)
+
+    def stats(self) -> Dict[str, int]:
+        """Return how many IDs were loaded in how many upstream calls."""
+        with self._cond:
+            return {"batches": self.batches, "loaded": self.loaded}
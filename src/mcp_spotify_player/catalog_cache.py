@@ -0,0 +1,180 @@
+"""In-process cache for immutable catalog reads.
+
+Albums, their tracks and artists rarely change, yet the same ones are asked
+for again and again within a session. Responses are kept for a per-endpoint
+TTL and evicted least-recently-used first once the cache holds more than
+``max_entries`` entries or ``max_bytes`` bytes of JSON. An optional
+:class:`~mcp_spotify_player.disk_cache.DiskCache` tier keeps entries across
+restarts.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Mapping, Tuple
+
+from mcp_spotify_player.config import Config, get_tokens_path
+from mcp_spotify_player.disk_cache import DiskCache, spotify_id_for
+
+# Seconds a response stays fresh, per endpoint kind. Album data is fixed
+# once released; artist data carries popularity and follower counts.
+DEFAULT_TTLS: Dict[str, float] = {
+    "album": 24 * 3600,
+    "albums": 24 * 3600,
+    "album_tracks": 24 * 3600,
+    "artist": 3600,
+    "artist_albums": 3600,
+    "artist_top_tracks": 3600,
+}
+
+MISS = object()
+
+CacheKey = Tuple[Hashable, ...]
+
+
+def _size_of(value: Any) -> int:
+    try:
+        return len(json.dumps(value, separators=(",", ":")))
+    except (TypeError, ValueError):
+        return 0
+
+
+def is_cacheable(value: Any) -> bool:
+    """Only successful JSON payloads are cached, never error bodies."""
+    if isinstance(value, dict):
+        return "error" not in value
+    return isinstance(value, list)
+
+
+class CatalogCache:
+    """Thread-safe TTL + LRU cache bounded by entry count and size."""
+
+    def __init__(
+        self,
+        max_entries: int | None = None,
+        max_bytes: int | None = None,
+        ttls: Mapping[str, float] | None = None,
+        disk: DiskCache | None = None,
+    ):
+        self.max_entries = max_entries or Config.CACHE_MAX_ENTRIES
+        self.max_bytes = max_bytes or Config.CACHE_MAX_BYTES
+        self.ttls = dict(DEFAULT_TTLS if ttls is None else ttls)
+        self.disk = disk
+        self._entries: OrderedDict[CacheKey, Tuple[float, int, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def key(kind: str, endpoint: str, params: Mapping[str, Any] | None = None) -> CacheKey:
+        """Build a key from the endpoint and its query params (``market`` included)."""
+        items = tuple(sorted((str(k), str(v)) for k, v in (params or {}).items()))
+        return (kind, endpoint, items)
+
+    def get(self, key: CacheKey) -> Any:
+        """Return the cached value, or :data:`MISS` if absent or expired.
+
+        Memory misses fall back to the disk tier; disk hits are promoted to
+        memory for the rest of their lifetime.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires, size, value = entry
+                if expires > time.monotonic():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._entries[key]
+                self.bytes -= size
+        if self.disk is not None:
+            stored = self.disk.get(key, spotify_id_for(key[1], dict(key[2])))
+            if stored is not None:
+                value, expires_at = stored
+                self._store(key, value, expires_at - time.time())
+                with self._lock:
+                    self.hits += 1
+                return value
+        with self._lock:
+            self.misses += 1
+        return MISS
+
+    def put(self, key: CacheKey, value: Any) -> None:
+        """Store ``value`` under ``key`` with the TTL of the key's kind."""
+        ttl = self.ttls.get(key[0], 0)
+        if ttl <= 0:
+            return
+        self._store(key, value, ttl)
+        if self.disk is not None:
+            self.disk.put(key, spotify_id_for(key[1], dict(key[2])), value, ttl)
+
+    def _store(self, key: CacheKey, value: Any, ttl: float) -> None:
+        size = _size_of(value)
+        if ttl <= 0 or size > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.bytes -= old[1]
+            self._entries[key] = (time.monotonic() + ttl, size, value)
+            self.bytes += size
+            while self._entries and (
+                len(self._entries) > self.max_entries or self.bytes > self.max_bytes
+            ):
+                _, (_, evicted_size, _) = self._entries.popitem(last=False)
+                self.bytes -= evicted_size
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """Drop every entry, keeping the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Return size and hit/miss counters."""
+        with self._lock:
+            data = {
+                "entries": len(self._entries),
+                "bytes": self.bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+        if self.disk is not None:
+            data["disk_hits"] = self.disk.hits
+            data["disk_bytes"] = self.disk.size()
+        return data
+
+
+_CACHE: CatalogCache | None = None
+_CACHE_LOCK = threading.Lock()
+
+
+def get_catalog_cache() -> CatalogCache:
+    """Return the process-wide :class:`CatalogCache`, creating it on first use."""
+    global _CACHE
+    with _CACHE_LOCK:
+        if _CACHE is None:
+            disk = None
+            if Config.CACHE_DISK:
+                disk = DiskCache(
+                    get_tokens_path().parent / "catalog_cache.sqlite3",
+                    Config.CACHE_DISK_MAX_BYTES,
+                )
+            _CACHE = CatalogCache(disk=disk)
+        return _CACHE
+
+
+def close_catalog_cache() -> None:
+    """Close the process-wide cache's disk tier, if it was ever opened."""
+    global _CACHE
+    with _CACHE_LOCK:
+        if _CACHE is not None and _CACHE.disk is not None:
+            _CACHE.disk.close()
+        _CACHE = None
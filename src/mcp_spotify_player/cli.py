@@ -2,7 +2,7 @@ import argparse
 import sys
 
 from mcp_logging import get_logger
-from .mcp_stdio_server import MCPServer
+from .config import Config
 
 logger = get_logger(__name__)
 
@@ -11,7 +11,20 @@ def main(argv: list[str] | None = None) -> None:
     """Start the MCP Spotify Player stdio server."""
     parser = argparse.ArgumentParser(description="MCP Spotify Player stdio server")
     parser.add_argument("--version", action="version", version="0.1.0")
-    parser.parse_args(argv)
+    parser.add_argument(
+        "--async",
+        dest="use_async",
+        action="store_true",
+        default=Config.MCP_ASYNC,
+        help="serve requests on an asyncio loop and run tool calls concurrently",
+    )
+    parser.add_argument(
+        "--max-concurrency",
+        type=int,
+        default=None,
+        help="maximum number of tool calls running at once in --async mode",
+    )
+    args = parser.parse_args(argv)
 
     logger.info("MCP Spotify Player - stdio server")
     logger.info("=" * 50)
@@ -20,9 +33,17 @@ def main(argv: list[str] | None = None) -> None:
     logger.info("Do not open browser, this server is not using HTTP")
     logger.info("=" * 50)
 
+    # Imported here so --help and --version stay instant
+    from .mcp_stdio_server import MCPServer
+
     try:
         server = MCPServer()
-        server.run()
+        if args.use_async:
+            import asyncio
+
+            asyncio.run(server.run_async(args.max_concurrency))
+        else:
+            server.run()
     except KeyboardInterrupt:
         logger.info("\nServer stopped by user")
     except Exception as e:  # pragma: no cover - defensive
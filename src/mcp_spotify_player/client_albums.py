@@ -1,30 +1,60 @@
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Sequence
 
-from mcp_logging import get_logger
+from mcp_logging import get_logger, payload
+from mcp_spotify_player.fanout import chunked, fan_out
+from mcp_spotify_player.paginator import Limit, collect, single_page
 
 logger = get_logger(__name__)
 
+# Maximum number of IDs accepted per request by the album endpoints
+ALBUM_IDS_LIMIT = 20
+
+# Largest page served by /albums/{id}/tracks and /me/albums
+ALBUM_TRACKS_PAGE_SIZE = 50
+SAVED_ALBUMS_PAGE_SIZE = 50
+
+
+def _is_error(result: Any) -> bool:
+    return result is None or (isinstance(result, dict) and "error" in result)
+
+
+def _first_error(results: List[Any]) -> Optional[Dict[str, Any]]:
+    for result in results:
+        if _is_error(result):
+            return result
+    return None
+
 
 class SpotifyAlbumsClient:
     """Client specialized in album-related operations."""
 
     def __init__(self, requester):
-        """Initialise with an object providing ``_make_request``."""
+        """Initialise with a requester such as :class:`SpotifyClient`."""
         self.requester = requester
 
     def get_album(self, album_id: str) -> Optional[Dict[str, Any]]:
         """Retrieve a single album by its Spotify ID."""
         logger.info("spotify_client -- Getting album with id %s", album_id)
-        result = self.requester._make_request("GET", f"/albums/{album_id}")
-        logger.debug("Response getting album by id %s: %s", album_id, result)
+        result = self.requester._load("album", album_id)
+        logger.debug("Response getting album by id %s: %s", album_id, payload(result))
         return result
 
     def get_albums(self, album_ids: List[str]) -> Optional[Dict[str, Any]]:
-        """Retrieve multiple albums by their Spotify IDs."""
+        """Retrieve multiple albums by their Spotify IDs.
+
+        Lists longer than :data:`ALBUM_IDS_LIMIT` are fetched in parallel
+        chunks and the albums returned in input order.
+        """
+        if len(album_ids) > ALBUM_IDS_LIMIT:
+            results = fan_out(self.get_albums, chunked(album_ids, ALBUM_IDS_LIMIT))
+            error = _first_error(results)
+            if error is not None or not all(isinstance(r, dict) for r in results):
+                return error
+            return {"albums": [album for r in results for album in r.get("albums", [])]}
         ids_param = ",".join(album_ids)
         logger.info("spotify_client -- Getting albums with ids %s", ids_param)
-        result = self.requester._make_request(
-            "GET",
+        result = self.requester._cached_request(
+            "albums",
             "/albums",
             params={"ids": ids_param},
         )
@@ -35,37 +65,65 @@ class SpotifyAlbumsClient:
         )
         return result
 
-    def get_album_tracks(self, album_id: str, limit: int = 20) -> Optional[Dict[str, Any]]:
-        """Retrieve tracks for a specific album."""
+    def get_album_tracks(self, album_id: str, limit: Limit = 20) -> Optional[Dict[str, Any]]:
+        """Retrieve tracks for a specific album, up to ``limit`` or ``"all"``."""
         logger.info(
             "spotify_client -- Getting tracks for album id %s", album_id
         )
-        params = {"limit": limit}
-        result = self.requester._make_request(
-            "GET", f"/albums/{album_id}/tracks", params=params
-        )
+
+        def fetch(offset: int, page_limit: int) -> Optional[Dict[str, Any]]:
+            params = {"limit": page_limit}
+            if offset:
+                params["offset"] = offset
+            return self.requester._cached_request(
+                "album_tracks", f"/albums/{album_id}/tracks", params=params
+            )
+
+        if single_page(limit, ALBUM_TRACKS_PAGE_SIZE):
+            result = fetch(0, limit)
+        else:
+            result = collect(fetch, ALBUM_TRACKS_PAGE_SIZE, limit)
         logger.debug(
-            "Response getting tracks for album id %s: %s", album_id, result
+            "Response getting tracks for album id %s: %s", album_id, payload(result)
         )
         return result
 
-    def get_saved_albums(self, limit: int = 20) -> Optional[Dict[str, Any]]:
-        """Retrieve albums saved in the user's library."""
-        params = {"limit": limit}
+    def get_saved_albums(self, limit: Limit = 20) -> Optional[Dict[str, Any]]:
+        """Retrieve albums saved in the user's library, up to ``limit`` or ``"all"``."""
         logger.info(
             "spotify_client -- Getting user saved albums with limit %s", limit
         )
-        result = self.requester._make_request(
-            "GET",
-            "/me/albums",
-            feature="albums",
-            params=params,
-        )
-        logger.debug("Response getting user saved albums: %s", result)
+
+        def fetch(offset: int, page_limit: int) -> Optional[Dict[str, Any]]:
+            params = {"limit": page_limit}
+            if offset:
+                params["offset"] = offset
+            return self.requester._make_request(
+                "GET",
+                "/me/albums",
+                feature="albums",
+                params=params,
+            )
+
+        if single_page(limit, SAVED_ALBUMS_PAGE_SIZE):
+            result = fetch(0, limit)
+        else:
+            result = collect(fetch, SAVED_ALBUMS_PAGE_SIZE, limit)
+        logger.debug("Response getting user saved albums: %s", payload(result))
         return result
 
     def check_saved_albums(self, album_ids: List[str]) -> Optional[List[bool]]:
-        """Check if the specified albums are saved in the user's library."""
+        """Check if the specified albums are saved in the user's library.
+
+        Lists longer than :data:`ALBUM_IDS_LIMIT` are checked in parallel
+        chunks and the flags returned in input order.
+        """
+        if len(album_ids) > ALBUM_IDS_LIMIT:
+            results = fan_out(self.check_saved_albums, chunked(album_ids, ALBUM_IDS_LIMIT))
+            error = _first_error(results)
+            if error is not None or not all(isinstance(r, list) for r in results):
+                return error
+            return [saved for r in results for saved in r]
         ids_param = ",".join(album_ids)
         logger.info(
             "spotify_client -- Checking if albums are saved with ids %s", ids_param
@@ -77,12 +135,44 @@ class SpotifyAlbumsClient:
             params={"ids": ids_param},
         )
         logger.debug(
-            "Response checking if albums %s are saved: %s", ids_param, result
+            "Response checking if albums %s are saved: %s", ids_param, payload(result)
         )
         return result
 
-    def save_albums(self, album_ids: List[str]) -> bool:
-        """Save one or more albums to the user's library."""
+    def save_albums(self, album_ids: List[str]) -> List[str]:
+        """Save one or more albums to the user's library, in parallel chunks.
+
+        Returns the IDs whose chunk failed; an empty list means all were saved.
+        """
+        return self._write_chunks(self._save_chunk, album_ids)
+
+    def delete_saved_albums(self, album_ids: List[str]) -> List[str]:
+        """Remove one or more albums from the user's library, in parallel chunks.
+
+        Returns the IDs whose chunk failed; an empty list means all were removed.
+        """
+        return self._write_chunks(self._delete_chunk, album_ids)
+
+    @staticmethod
+    def _write_chunks(write: Callable[[Sequence[str]], bool], album_ids: List[str]) -> List[str]:
+        """Run ``write`` on every chunk and return the IDs of the chunks that failed.
+
+        A chunk fails when Spotify answers with an error or when ``write``
+        raises; the other chunks are still written and reported as done.
+        """
+
+        def attempt(chunk: Sequence[str]) -> bool:
+            try:
+                return write(chunk)
+            except Exception as exc:
+                logger.warning("Album chunk %s failed: %s", ",".join(chunk), exc)
+                return False
+
+        chunks = chunked(album_ids, ALBUM_IDS_LIMIT)
+        results = fan_out(attempt, chunks)
+        return [aid for chunk, ok in zip(chunks, results) if not ok for aid in chunk]
+
+    def _save_chunk(self, album_ids: Sequence[str]) -> bool:
         ids_param = ",".join(album_ids)
         logger.info(
             "spotify_client -- Saving albums with ids %s", ids_param
@@ -91,13 +181,12 @@ class SpotifyAlbumsClient:
             "PUT",
             "/me/albums",
             feature="albums",
-            json={"ids": album_ids},
+            json={"ids": list(album_ids)},
         )
-        logger.debug("Response saving albums %s: %s", ids_param, result)
-        return result is not None
+        logger.debug("Response saving albums %s: %s", ids_param, payload(result))
+        return not _is_error(result)
 
-    def delete_saved_albums(self, album_ids: List[str]) -> bool:
-        """Remove one or more albums from the user's library."""
+    def _delete_chunk(self, album_ids: Sequence[str]) -> bool:
         ids_param = ",".join(album_ids)
         logger.info(
             "spotify_client -- Deleting albums with ids %s", ids_param
@@ -106,7 +195,7 @@ class SpotifyAlbumsClient:
             "DELETE",
             "/me/albums",
             feature="albums",
-            json={"ids": album_ids},
+            json={"ids": list(album_ids)},
         )
-        logger.debug("Response deleting albums %s: %s", ids_param, result)
-        return result is not None
+        logger.debug("Response deleting albums %s: %s", ids_param, payload(result))
+        return not _is_error(result)
@@ -1,22 +1,27 @@
 from typing import Any, Dict, Optional
 
-from mcp_logging import get_logger
+from mcp_logging import get_logger, payload
+
+from mcp_spotify_player.paginator import Limit, collect, single_page
 
 logger = get_logger(__name__)
 
+# Largest page served by /artists/{id}/albums
+ARTIST_ALBUMS_PAGE_SIZE = 50
+
 
 class SpotifyArtistsClient:
     """Client specialized in artist-related operations."""
 
     def __init__(self, requester):
-        """Initialise with an object providing ``_make_request``."""
+        """Initialise with a requester such as :class:`SpotifyClient`."""
         self.requester = requester
 
     def get_artist(self, artist_id: str) -> Optional[Dict[str, Any]]:
         """Retrieve a single artist by its Spotify ID."""
         logger.info("spotify_client -- Getting artist with id %s", artist_id)
-        result = self.requester._make_request("GET", f"/artists/{artist_id}")
-        logger.debug("Response getting artist by id %s: %s", artist_id, result)
+        result = self.requester._load("artist", artist_id)
+        logger.debug("Response getting artist by id %s: %s", artist_id, payload(result))
         return result
 
     def get_artist_albums(
@@ -24,20 +29,29 @@ class SpotifyArtistsClient:
         artist_id: str,
         *,
         include_groups: Optional[str] = None,
-        limit: int = 20,
+        limit: Limit = 20,
     ) -> Optional[Dict[str, Any]]:
-        """Retrieve albums of a specific artist."""
+        """Retrieve albums of a specific artist, up to ``limit`` or ``"all"``."""
         logger.info(
             "spotify_client -- Getting albums for artist id %s", artist_id
         )
-        params: Dict[str, Any] = {"limit": limit}
-        if include_groups:
-            params["include_groups"] = include_groups
-        result = self.requester._make_request(
-            "GET", f"/artists/{artist_id}/albums", params=params
-        )
+
+        def fetch(offset: int, page_limit: int) -> Optional[Dict[str, Any]]:
+            params: Dict[str, Any] = {"limit": page_limit}
+            if offset:
+                params["offset"] = offset
+            if include_groups:
+                params["include_groups"] = include_groups
+            return self.requester._cached_request(
+                "artist_albums", f"/artists/{artist_id}/albums", params=params
+            )
+
+        if single_page(limit, ARTIST_ALBUMS_PAGE_SIZE):
+            result = fetch(0, limit)
+        else:
+            result = collect(fetch, ARTIST_ALBUMS_PAGE_SIZE, limit)
         logger.debug(
-            "Response getting albums for artist id %s: %s", artist_id, result
+            "Response getting albums for artist id %s: %s", artist_id, payload(result)
         )
         return result
 
@@ -49,10 +63,10 @@ class SpotifyArtistsClient:
             "spotify_client -- Getting top tracks for artist id %s", artist_id
         )
         params: Dict[str, Any] = {"market": market}
-        result = self.requester._make_request(
-            "GET", f"/artists/{artist_id}/top-tracks", params=params
+        result = self.requester._cached_request(
+            "artist_top_tracks", f"/artists/{artist_id}/top-tracks", params=params
         )
         logger.debug(
-            "Response getting top tracks for artist id %s: %s", artist_id, result
+            "Response getting top tracks for artist id %s: %s", artist_id, payload(result)
         )
         return result
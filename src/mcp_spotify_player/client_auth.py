@@ -12,11 +12,12 @@ import socket
 from typing import Any, Dict, Optional
 from urllib.parse import parse_qs, urlencode, urlparse, quote
 
-import requests
-
+from mcp_spotify.auth.store import TokenStore
 from mcp_spotify.auth.tokens import Tokens, load_tokens, needs_refresh
 from mcp_spotify.errors import InvalidTokenFileError
 from mcp_spotify_player.config import Config, get_tokens_path
+from mcp_spotify_player import json_codec
+from mcp_spotify_player.http_pool import get_http_pool
 from mcp_spotify_player.mcp_manifest import MANIFEST
 from mcp_logging import get_logger
 
@@ -102,7 +103,7 @@ def exchange_code_for_tokens(code: str) -> dict:
     else:
         data["client_id"] = Config.SPOTIFY_CLIENT_ID
         data["code_verifier"] = _CODE_VERIFIER or ""
-    response = requests.post(Config.SPOTIFY_TOKEN_URL, data=data, auth=auth)
+    response = get_http_pool().post(Config.SPOTIFY_TOKEN_URL, data=data, auth=auth)
     response.raise_for_status()
     return response.json()
 
@@ -117,12 +118,15 @@ def save_tokens_minimal(tokens: dict) -> None:
     path = get_tokens_path()
     path.parent.mkdir(parents=True, exist_ok=True)
     tmp = path.with_suffix(path.suffix + ".tmp")
-    tmp.write_text(json.dumps(data))
-    try:
-        os.replace(tmp, path)
-    except Exception:
-        tmp.unlink(missing_ok=True)
-        raise
+    # Hold the store lock so a concurrent refresh in another process
+    # cannot overwrite the freshly authorized tokens
+    with TokenStore(path).lock():
+        tmp.write_text(json.dumps(data))
+        try:
+            os.replace(tmp, path)
+        except Exception:
+            tmp.unlink(missing_ok=True)
+            raise
 
 
 def _wait_for_server(host: str, port: int, timeout: float = 5.0) -> None:
@@ -142,79 +146,187 @@ def _wait_for_server(host: str, port: int, timeout: float = 5.0) -> None:
     raise RuntimeError("Local auth server did not start in time")
 
 
-def ensure_user_tokens() -> None:
-    path = get_tokens_path()
-    tokens: Tokens | None
+# Seconds the callback server waits for the user to finish logging in
+AUTH_TIMEOUT = 120.0
+
+AUTH_IDLE = "idle"
+AUTH_PENDING = "pending"
+AUTH_COMPLETE = "complete"
+AUTH_FAILED = "failed"
+
+
+def _has_user_tokens() -> bool:
     try:
-        tokens = load_tokens(path)
+        tokens = load_tokens(get_tokens_path())
     except (InvalidTokenFileError, FileNotFoundError):
-        tokens = None
-    if tokens and tokens.refresh_token:
-        return
+        return False
+    return bool(tokens.refresh_token)
 
-    logger.info("No user token found. Launching browser for Spotify OAuth…")
-    state = secrets.token_urlsafe(16)
-    pkce = not Config.SPOTIFY_CLIENT_SECRET
-    url = build_authorize_url(Config.SPOTIFY_SCOPES, state, pkce)
 
-    parsed = urlparse(Config.SPOTIFY_REDIRECT_URI)
-    host = parsed.hostname or "127.0.0.1"
-    port = parsed.port or 80
-    callback_path = parsed.path
+class AuthFlow:
+    """The browser OAuth login, run in the background.
 
-    event = threading.Event()
-    code_holder: dict[str, str] = {}
+    :meth:`start` binds the local callback server, opens the authorization
+    URL and returns at once; the flow moves from ``idle`` to ``pending``. The
+    callback server's own thread receives the code, exchanges it for tokens
+    and saves them, ending in ``complete``. A login not finished within
+    ``timeout`` seconds, or a failed exchange, ends in ``failed`` and the
+    flow can be started again.
+    """
 
-    class Handler(BaseHTTPRequestHandler):
-        def do_GET(self):  # noqa: N802
-            parsed_qs = urlparse(self.path)
-            if parsed_qs.path != callback_path:
-                self.send_response(404)
-                self.end_headers()
-                return
-            params = parse_qs(parsed_qs.query)
-            if params.get("state", [""])[0] != state or "code" not in params:
-                self.send_response(400)
+    def __init__(self, timeout: float = AUTH_TIMEOUT):
+        self.timeout = timeout
+        self.state = AUTH_IDLE
+        self.authorize_url: str | None = None
+        self.error: BaseException | None = None
+        self._lock = threading.Lock()
+        self._done = threading.Event()
+        self._httpd: HTTPServer | None = None
+        self._timer: threading.Timer | None = None
+
+    def start(self) -> str:
+        """Start the login unless one is pending and return its authorize URL."""
+        with self._lock:
+            if self.state == AUTH_PENDING:
+                return self.authorize_url
+            logger.info("No user token found. Launching browser for Spotify OAuth…")
+            state = secrets.token_urlsafe(16)
+            pkce = not Config.SPOTIFY_CLIENT_SECRET
+            url = build_authorize_url(Config.SPOTIFY_SCOPES, state, pkce)
+
+            parsed = urlparse(Config.SPOTIFY_REDIRECT_URI)
+            host = parsed.hostname or "127.0.0.1"
+            port = parsed.port or 80
+            httpd = HTTPServer((host, port), self._handler(state, parsed.path))
+            httpd.code = None
+            thread = threading.Thread(
+                target=self._serve, args=(httpd,), name="mcp-auth-callback", daemon=True
+            )
+            thread.start()
+            try:
+                _wait_for_server(host, port)
+                webbrowser.open(url)
+            except Exception:
+                httpd.shutdown()
+                thread.join()
+                raise
+
+            self.state, self.authorize_url, self.error = AUTH_PENDING, url, None
+            self._done.clear()
+            self._httpd = httpd
+            self._timer = threading.Timer(self.timeout, self._expire, args=(httpd,))
+            self._timer.daemon = True
+            self._timer.start()
+            return url
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """Block until the pending login ends; ``False`` if ``timeout`` ran out."""
+        return self._done.wait(timeout)
+
+    def cancel(self) -> None:
+        """Stop a pending login and its callback server."""
+        with self._lock:
+            httpd = self._httpd
+        if httpd is not None:
+            self._expire(httpd, "Authorization cancelled.")
+
+    def status(self) -> Dict[str, Any]:
+        """Return the flow state and the URL of the current login, if any."""
+        return {"state": self.state, "authorize_url": self.authorize_url}
+
+    def _handler(self, state: str, callback_path: str) -> type[BaseHTTPRequestHandler]:
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):  # noqa: N802
+                parsed_qs = urlparse(self.path)
+                if parsed_qs.path != callback_path:
+                    self.send_response(404)
+                    self.end_headers()
+                    return
+                params = parse_qs(parsed_qs.query)
+                if params.get("state", [""])[0] != state or "code" not in params:
+                    self.send_response(400)
+                    self.end_headers()
+                    return
+                self.server.code = params["code"][0]
+                self.send_response(200)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
                 self.end_headers()
-                return
-            code_holder["code"] = params["code"][0]
-            self.send_response(200)
-            self.send_header("Content-Type", "text/html; charset=utf-8")
-            self.end_headers()
-            html = build_success_page()
-            self.wfile.write(html.encode("utf-8"))
-            event.set()
-            threading.Thread(target=self.server.shutdown, daemon=True).start()
-
-        def log_message(self, *args, **kwargs):  # noqa: D401
-            """Silence logging."""
-            return
+                html = build_success_page()
+                self.wfile.write(html.encode("utf-8"))
+                threading.Thread(target=self.server.shutdown, daemon=True).start()
 
-    httpd = HTTPServer((host, port), Handler)
-    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
-    thread.start()
+            def log_message(self, *args, **kwargs):  # noqa: D401
+                """Silence logging."""
+                return
 
-    try:
-        _wait_for_server(host, port)
-    except RuntimeError:
-        httpd.shutdown()
-        thread.join()
-        raise
+        return Handler
 
-    webbrowser.open(url)
+    def _serve(self, httpd: HTTPServer) -> None:
+        """Answer callbacks until one carries a code, then finish the flow."""
+        httpd.serve_forever()
+        httpd.server_close()
+        if httpd.code is None:
+            return
+        try:
+            save_tokens_minimal(exchange_code_for_tokens(httpd.code))
+        except Exception as e:
+            logger.error("Spotify authorization failed: %s", e)
+            self._finish(httpd, AUTH_FAILED, e)
+        else:
+            logger.info("Spotify authorization complete. Tokens saved.")
+            self._finish(httpd, AUTH_COMPLETE)
 
-    if not event.wait(120):
+    def _expire(self, httpd: HTTPServer, message: str | None = None) -> None:
+        if httpd.code is not None:
+            return
+        # Free the callback port before anyone waiting can start a new login
         httpd.shutdown()
-        thread.join()
-        raise TimeoutError(
-            "Authorization not completed within timeout. Please try /auth again."
+        httpd.server_close()
+        error = TimeoutError(
+            message or "Authorization not completed within timeout. Please try /auth again."
         )
-    thread.join()
+        self._finish(httpd, AUTH_FAILED, error)
+
+    def _finish(
+        self, httpd: HTTPServer, state: str, error: BaseException | None = None
+    ) -> bool:
+        with self._lock:
+            if self._httpd is not httpd:
+                return False
+            self.state, self.error, self._httpd = state, error, None
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            self._done.set()
+            return True
+
+
+_AUTH_FLOW: AuthFlow | None = None
+_AUTH_FLOW_LOCK = threading.Lock()
+
 
-    token_payload = exchange_code_for_tokens(code_holder["code"])
-    save_tokens_minimal(token_payload)
+def get_auth_flow() -> AuthFlow:
+    """Return the process-wide :class:`AuthFlow`."""
+    global _AUTH_FLOW
+    with _AUTH_FLOW_LOCK:
+        if _AUTH_FLOW is None:
+            _AUTH_FLOW = AuthFlow()
+        return _AUTH_FLOW
 
 
+def ensure_user_tokens() -> None:
+    """Run the browser login and wait for it unless user tokens already exist."""
+    if _has_user_tokens():
+        return
+    flow = get_auth_flow()
+    flow.start()
+    if not flow.wait(flow.timeout + 5):
+        flow.cancel()
+    if flow.state != AUTH_COMPLETE:
+        raise flow.error or TimeoutError(
+            "Authorization not completed within timeout. Please try /auth again."
+        )
+
 
 def try_load_tokens() -> Optional[Tokens]:
     """Attempt to load tokens from disk.
@@ -277,7 +389,7 @@ class SpotifyAuthClient:
             "client_id": self.config.SPOTIFY_CLIENT_ID,
             "client_secret": self.config.SPOTIFY_CLIENT_SECRET,
         }
-        response = requests.post(self.config.SPOTIFY_TOKEN_URL, data=data)
+        response = get_http_pool().post(self.config.SPOTIFY_TOKEN_URL, data=data)
         if response.status_code == 200:
             token_data = response.json()
             self.access_token = token_data["access_token"]
@@ -298,7 +410,7 @@ class SpotifyAuthClient:
             "client_id": self.config.SPOTIFY_CLIENT_ID,
             "client_secret": self.config.SPOTIFY_CLIENT_SECRET,
         }
-        response = requests.post(self.config.SPOTIFY_TOKEN_URL, data=data)
+        response = get_http_pool().post(self.config.SPOTIFY_TOKEN_URL, data=data)
         if response.status_code == 200:
             token_data = response.json()
             self.access_token = token_data["access_token"]
@@ -369,24 +481,25 @@ class SpotifyAuthClient:
         if "params" in kwargs:
             params_str = f" with params : {kwargs['params']}"
         logger.debug("Making request %s to %s%s", method, endpoint, params_str)
-        response = requests.request(method, url, headers=headers, **kwargs)
+        response = get_http_pool().request(method, url, headers=headers, **kwargs)
         logger.debug("Response %s for %s", response.status_code, endpoint)
         if response.status_code in [200, 201, 204]:
             if method == "PUT" and endpoint == "/me/player/repeat":
                 return True
             try:
-                return response.json() if response.text else True
+                data = json_codec.decode(response)
             except ValueError:
                 return True
+            return True if data is json_codec.EMPTY else data
         else:
             logger.debug(
                 "Error %s for %s: %s", response.status_code, endpoint, response.text
             )
             try:
-                logger.debug(
-                    "Trying to parse JSON response for %s. Response: %s", endpoint, response.json()
-                )
-                return response.json()
+                data = json_codec.decode(response)
             except Exception:
+                data = json_codec.EMPTY
+            if data is json_codec.EMPTY:
                 logger.debug("Error for %s: %s", endpoint, response)
                 return {"error": response.text}
+            return data
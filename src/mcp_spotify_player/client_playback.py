@@ -1,6 +1,6 @@
 from typing import Any, Dict, List, Optional
 
-from mcp_logging import get_logger
+from mcp_logging import get_logger, payload
 
 logger = get_logger(__name__)
 
@@ -22,7 +22,7 @@ class SpotifyPlaybackClient:
         result = self.requester._make_request(
             'PUT', '/me/player/play', feature='playback', json=data
         )
-        logger.debug("Received response: %s", result)
+        logger.debug("Received response: %s", payload(result))
         if result is not None:
             return result
         else:
@@ -1,9 +1,46 @@
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
 
-from mcp_logging import get_logger
+from mcp_logging import get_logger, payload
+
+from mcp_spotify_player.mcp_models import TrackInfo
+from mcp_spotify_player.paginator import Limit, collect, paginate, single_page
 
 logger = get_logger(__name__)
 
+# Maximum number of URIs Spotify accepts per add-items request
+ADD_TRACKS_LIMIT = 100
+
+# Largest page served by /me/playlists and /playlists/{id}/tracks
+PLAYLISTS_PAGE_SIZE = 50
+PLAYLIST_TRACKS_PAGE_SIZE = 100
+
+# Called after each written chunk with (added, total, snapshot_id)
+ProgressCallback = Callable[[int, int, Optional[str]], None]
+
+
+def fields_filter(paths: Iterable[str]) -> str:
+    """Build a Web API ``fields`` filter from dotted paths.
+
+    ``["album.name", "album.uri", "total"]`` gives ``album(name,uri),total``.
+    """
+    tree: Dict[str, Dict] = {}
+    for path in paths:
+        node = tree
+        for part in path.split('.'):
+            node = node.setdefault(part, {})
+
+    def render(node: Dict[str, Dict]) -> str:
+        return ','.join(f'{name}({render(child)})' if child else name for name, child in node.items())
+
+    return render(tree)
+
+
+# Only the parts of each playlist item that TrackInfo is built from, plus paging
+PLAYLIST_TRACKS_FIELDS = fields_filter(
+    [f'items.track.{path}' for path in TrackInfo.spotify_paths.values()]
+    + ['total', 'next', 'offset', 'limit']
+)
+
 
 class SpotifyPlaylistsClient:
     """Client specialized in playlist-related operations."""
@@ -12,9 +49,19 @@ class SpotifyPlaylistsClient:
         """Initialise with an object providing ``_make_request``."""
         self.requester = requester
 
-    def get_user_playlists(self, limit: int = 20) -> Optional[Dict[str, Any]]:
-        """Gets the user's playlists"""
-        params = {'limit': limit}
+    def get_user_playlists(self, limit: Limit = 20) -> Optional[Dict[str, Any]]:
+        """Gets the user's playlists, following pages up to ``limit`` or ``"all"``"""
+        if single_page(limit, PLAYLISTS_PAGE_SIZE):
+            params = {'limit': limit}
+            return self.requester._make_request('GET', '/me/playlists', feature='playlists', params=params)
+        return collect(self._fetch_playlists, PLAYLISTS_PAGE_SIZE, limit)
+
+    def iter_user_playlists(self, limit: Limit = "all") -> Iterator[Dict[str, Any]]:
+        """Yield the user's playlists lazily, one page at a time."""
+        return paginate(self._fetch_playlists, PLAYLISTS_PAGE_SIZE, limit)
+
+    def _fetch_playlists(self, offset: int, limit: int) -> Optional[Dict[str, Any]]:
+        params = {'limit': limit, 'offset': offset}
         return self.requester._make_request('GET', '/me/playlists', feature='playlists', params=params)
 
     def create_playlist(
@@ -30,21 +77,33 @@ class SpotifyPlaylistsClient:
         user_profile = self.requester._make_request('GET', '/me')
         if not user_profile or 'id' not in user_profile:
             return None
-        payload = {
+        body = {
             'name': playlist_name,
             'description': description,
             'public': public,
         }
         result = self.requester._make_request(
-            'POST', f"/users/{user_profile['id']}/playlists", feature='playlists', json=payload
+            'POST', f"/users/{user_profile['id']}/playlists", feature='playlists', json=body
         )
-        logger.debug("Response creating playlist %s: %s", playlist_name, result)
+        logger.debug("Response creating playlist %s: %s", playlist_name, payload(result))
         return result
 
-    def get_playlist_tracks(self, playlist_id: str, limit: int = 20) -> Optional[Dict[str, Any]]:
-        """Gets songs from a playlist"""
-        params = {'limit': limit}
-        return self.requester._make_request('GET', f'/playlists/{playlist_id}/tracks', feature='playlists', params=params)
+    def get_playlist_tracks(self, playlist_id: str, limit: Limit = 20) -> Optional[Dict[str, Any]]:
+        """Gets songs from a playlist, following pages up to ``limit`` or ``"all"``
+
+        Only the fields listed in :data:`PLAYLIST_TRACKS_FIELDS` are requested.
+        """
+        if single_page(limit, PLAYLIST_TRACKS_PAGE_SIZE):
+            params = {'limit': limit, 'fields': PLAYLIST_TRACKS_FIELDS}
+            return self.requester._make_request('GET', f'/playlists/{playlist_id}/tracks', feature='playlists', params=params)
+
+        def fetch(offset: int, page_limit: int) -> Optional[Dict[str, Any]]:
+            params = {'limit': page_limit, 'offset': offset, 'fields': PLAYLIST_TRACKS_FIELDS}
+            return self.requester._make_request(
+                'GET', f'/playlists/{playlist_id}/tracks', feature='playlists', params=params
+            )
+
+        return collect(fetch, PLAYLIST_TRACKS_PAGE_SIZE, limit)
 
     def rename_playlist(self, playlist_id: str, playlist_name: str) -> bool:
         """Rename a playlist from the user's library"""
@@ -55,7 +114,7 @@ class SpotifyPlaylistsClient:
             feature='playlists',
             json={"name": playlist_name}
         )
-        logger.debug("Response renaming playlist by id %s: %s", playlist_id, result)
+        logger.debug("Response renaming playlist by id %s: %s", playlist_id, payload(result))
         return result is not None
 
     def clear_playlist(self, playlist_id: str) -> bool:
@@ -67,17 +126,57 @@ class SpotifyPlaylistsClient:
             feature='playlists',
             json={"uris": []}
         )
-        logger.debug("Response clearing playlist by id %s: %s", playlist_id, result)
+        logger.debug("Response clearing playlist by id %s: %s", playlist_id, payload(result))
         return result is not None
 
-    def add_tracks_to_playlist(self, playlist_id: str, track_uris: List[str]) -> bool:
-        """Add tracks to a playlist"""
-        logger.info("spotify_client -- Adding tracks to playlist %s", playlist_id)
-        result = self.requester._make_request(
-            'POST',
-            f'/playlists/{playlist_id}/tracks',
-            feature='playlists',
-            json={'uris': track_uris},
+    def add_tracks_to_playlist(
+        self,
+        playlist_id: str,
+        track_uris: List[str],
+        position: Optional[int] = None,
+        progress: Optional[ProgressCallback] = None,
+    ) -> Dict[str, Any]:
+        """Add tracks to a playlist in chunks of :data:`ADD_TRACKS_LIMIT`.
+
+        Chunks are written one after another so they keep their order; with
+        ``position`` each chunk is inserted right after the previous one.
+        Stops at the first failed chunk, whether Spotify answers with an error
+        or the request raises (connection failure, tool deadline, rate-limit
+        wait). Returns the number of tracks ``added``, the playlist
+        ``snapshot_id`` after the last write and, on failure, the ``error``:
+        Spotify's error object, or a message when the write raised.
+        """
+        logger.info(
+            "spotify_client -- Adding %d tracks to playlist %s", len(track_uris), playlist_id
         )
-        logger.debug("Response adding tracks to playlist %s: %s", playlist_id, result)
-        return result is not None
+        total = len(track_uris)
+        added = 0
+        snapshot_id = None
+        for start in range(0, total, ADD_TRACKS_LIMIT):
+            chunk = track_uris[start:start + ADD_TRACKS_LIMIT]
+            body: Dict[str, Any] = {'uris': chunk}
+            if position is not None:
+                body['position'] = position + start
+            try:
+                result = self.requester._make_request(
+                    'POST',
+                    f'/playlists/{playlist_id}/tracks',
+                    feature='playlists',
+                    json=body,
+                )
+            except Exception as exc:
+                logger.warning(
+                    "Stopped adding tracks to playlist %s after %d of %d: %s",
+                    playlist_id, added, total, exc,
+                )
+                return {'added': added, 'snapshot_id': snapshot_id, 'error': str(exc)}
+            logger.debug("Response adding tracks to playlist %s: %s", playlist_id, payload(result))
+            if result is None or (isinstance(result, dict) and 'error' in result):
+                error = result.get('error') if isinstance(result, dict) else None
+                return {'added': added, 'snapshot_id': snapshot_id, 'error': error or 'no response'}
+            added += len(chunk)
+            if isinstance(result, dict):
+                snapshot_id = result.get('snapshot_id', snapshot_id)
+            if progress is not None:
+                progress(added, total, snapshot_id)
+        return {'added': added, 'snapshot_id': snapshot_id}
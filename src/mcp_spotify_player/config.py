@@ -1,10 +1,33 @@
+from __future__ import annotations
+
 import os
+import sys
 from pathlib import Path
 
-from dotenv import load_dotenv
 
-# Load environment variables
-load_dotenv()
+def _find_dotenv() -> Path | None:
+    """Return the ``.env`` file ``load_dotenv()`` would pick, if there is one.
+
+    Like python-dotenv, the search walks up from the working directory in an
+    interactive session and from this package otherwise.
+    """
+    if hasattr(sys.modules.get("__main__"), "__file__"):
+        start = Path(__file__).resolve().parent
+    else:
+        start = Path.cwd()
+    for directory in (start, *start.parents):
+        candidate = directory / ".env"
+        if candidate.is_file():
+            return candidate
+    return None
+
+
+# Load environment variables; python-dotenv is only imported when there is a .env file
+_DOTENV_PATH = _find_dotenv()
+if _DOTENV_PATH is not None:
+    from dotenv import load_dotenv
+
+    load_dotenv(_DOTENV_PATH)
 
 
 def get_tokens_path() -> Path:
@@ -41,6 +64,61 @@ class Config:
     # MCP Configuration
     MCP_SERVER_NAME = os.getenv("MCP_SERVER_NAME", "spotify-player")
     MCP_SERVER_VERSION = os.getenv("MCP_SERVER_VERSION", "1.0.0")
+    MCP_ASYNC = os.getenv("MCP_ASYNC", "False").lower() == "true"
+    MCP_MAX_CONCURRENCY = int(os.getenv("MCP_MAX_CONCURRENCY", 4))
+    MCP_BATCH_WORKERS = int(os.getenv("MCP_BATCH_WORKERS", 8))
+    MCP_BATCH_TIMEOUT = float(os.getenv("MCP_BATCH_TIMEOUT", 30))
+    # Resolve, pre-connect and pre-refresh in the background after initialize
+    MCP_WARMUP = os.getenv("MCP_WARMUP", "True").lower() == "true"
+    # End-to-end budget (seconds) shared by every request a tool call makes
+    MCP_TOOL_TIMEOUT = float(os.getenv("MCP_TOOL_TIMEOUT", 30))
+    # Budget (seconds) replacing MCP_TOOL_TIMEOUT for chunked bulk writes
+    MCP_BULK_TIMEOUT = float(os.getenv("MCP_BULK_TIMEOUT", 300))
+    # Milliseconds single-ID album/artist lookups wait to be merged into one
+    # multi-get request (0 disables batching)
+    BATCH_WINDOW_MS = float(os.getenv("MCP_BATCH_WINDOW_MS", 5))
+    # Concurrent chunk requests when a multi-ID operation exceeds the
+    # endpoint's ID limit
+    FANOUT_WORKERS = int(os.getenv("MCP_FANOUT_WORKERS", 4))
+
+    # Seconds before expiry at which the access token is renewed in background
+    TOKEN_RENEW_MARGIN = float(os.getenv("MCP_TOKEN_RENEW_MARGIN", 120))
+
+    # HTTP connection pool
+    HTTP_POOL_SIZE = int(os.getenv("MCP_HTTP_POOL_SIZE", 10))
+    HTTP_KEEPALIVE = os.getenv("MCP_HTTP_KEEPALIVE", "True").lower() == "true"
+    HTTP_IDLE_TIMEOUT = float(os.getenv("MCP_HTTP_IDLE_TIMEOUT", 90))
+
+    # Request timeouts (seconds) per endpoint class: player control calls,
+    # paginated library reads, accounts service, everything else
+    TIMEOUT_CONTROL = float(os.getenv("MCP_TIMEOUT_CONTROL", 5))
+    TIMEOUT_LIBRARY = float(os.getenv("MCP_TIMEOUT_LIBRARY", 20))
+    TIMEOUT_AUTH = float(os.getenv("MCP_TIMEOUT_AUTH", 10))
+    TIMEOUT_DEFAULT = float(os.getenv("MCP_TIMEOUT_DEFAULT", 10))
+
+    # Client-side rate limiting: requests per second, burst size, and the
+    # longest a request may wait for a slot or a Retry-After before failing
+    RATE_LIMIT_RPS = float(os.getenv("MCP_RATE_LIMIT_RPS", 20))
+    RATE_LIMIT_BURST = int(os.getenv("MCP_RATE_LIMIT_BURST", 40))
+    RATE_LIMIT_MAX_WAIT = float(os.getenv("MCP_RATE_LIMIT_MAX_WAIT", 10))
+
+    # In-memory cache of catalog reads (albums, artists)
+    CACHE_ENABLED = os.getenv("MCP_CACHE_ENABLED", "True").lower() == "true"
+    CACHE_MAX_ENTRIES = int(os.getenv("MCP_CACHE_MAX_ENTRIES", 512))
+    CACHE_MAX_BYTES = int(os.getenv("MCP_CACHE_MAX_BYTES", 8 * 1024 * 1024))
+    # Persistent SQLite tier stored next to tokens.json
+    CACHE_DISK = os.getenv("MCP_CACHE_DISK", "False").lower() == "true"
+    CACHE_DISK_MAX_BYTES = int(os.getenv("MCP_CACHE_DISK_MAX_BYTES", 64 * 1024 * 1024))
+
+    # ETag / Cache-Control aware cache of GET responses
+    HTTP_CACHE_ENABLED = os.getenv("MCP_HTTP_CACHE_ENABLED", "True").lower() == "true"
+    HTTP_CACHE_MAX_ENTRIES = int(os.getenv("MCP_HTTP_CACHE_MAX_ENTRIES", 256))
+
+    # Retries of idempotent requests after connection errors, timeouts and
+    # 5xx responses: attempts per request, first backoff and total budget
+    RETRY_MAX_ATTEMPTS = int(os.getenv("MCP_RETRY_MAX_ATTEMPTS", 3))
+    RETRY_BASE_DELAY = float(os.getenv("MCP_RETRY_BASE_DELAY", 0.2))
+    RETRY_BUDGET = float(os.getenv("MCP_RETRY_BUDGET", 5))
 
     # Spotify API URLs
     SPOTIFY_AUTH_URL = "https://accounts.spotify.com/authorize"
@@ -0,0 +1,156 @@
+"""Optional on-disk tier for the catalog cache.
+
+MCP clients start a fresh server for every session, so the in-memory
+:class:`~mcp_spotify_player.catalog_cache.CatalogCache` always starts cold.
+This tier keeps the same entries in a SQLite database (WAL mode) next to
+``tokens.json``: values are zlib-compressed JSON, every row carries its own
+expiry, and the least recently used rows are pruned once the database holds
+more than ``max_bytes`` of values. Lookups go through an index on the
+Spotify ID the entry describes.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Any, Hashable, Mapping, Tuple
+
+from mcp_logging import get_logger
+
+logger = get_logger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS catalog (
+    key TEXT PRIMARY KEY,
+    spotify_id TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    expires_at REAL NOT NULL,
+    accessed_at REAL NOT NULL,
+    size INTEGER NOT NULL,
+    value BLOB NOT NULL
+);
+CREATE UNIQUE INDEX IF NOT EXISTS catalog_spotify_id ON catalog (spotify_id, key);
+CREATE INDEX IF NOT EXISTS catalog_accessed_at ON catalog (accessed_at);
+"""
+
+# Marks a row that holds no usable value
+_MISSING = object()
+
+
+def spotify_id_for(endpoint: str, params: Mapping[str, Any] | None = None) -> str:
+    """Return the Spotify ID(s) an endpoint reads.
+
+    ``/albums/{id}/tracks`` gives ``{id}``; ``/albums?ids=a,b`` gives ``a,b``.
+    """
+    if params and "ids" in params:
+        return str(params["ids"])
+    parts = [part for part in endpoint.split("?", 1)[0].split("/") if part]
+    return parts[1] if len(parts) > 1 else endpoint
+
+
+class DiskCache:
+    """SQLite-backed store of compressed catalog responses."""
+
+    def __init__(self, path: Path, max_bytes: int):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self._lock = threading.Lock()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Imported here so the server never loads sqlite3 without a disk tier
+        import sqlite3
+
+        self._conn = sqlite3.connect(str(path), check_same_thread=False, timeout=5)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+    @staticmethod
+    def _key(key: Tuple[Hashable, ...]) -> str:
+        return json.dumps(key, separators=(",", ":"))
+
+    def get(self, key: Tuple[Hashable, ...], spotify_id: str) -> Tuple[Any, float] | None:
+        """Return ``(value, expires_at)`` for a live entry, else ``None``.
+
+        Expired and unreadable rows are deleted and count as misses.
+        """
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires_at FROM catalog WHERE spotify_id = ? AND key = ?",
+                (spotify_id, self._key(key)),
+            ).fetchone()
+            if row is None:
+                return None
+            blob, expires_at = row
+            value = _MISSING
+            if expires_at > now:
+                try:
+                    value = json.loads(zlib.decompress(blob))
+                except (zlib.error, ValueError):
+                    logger.warning("Dropping unreadable disk cache entry for %s", spotify_id)
+            if value is _MISSING:
+                self._conn.execute(
+                    "DELETE FROM catalog WHERE spotify_id = ? AND key = ?",
+                    (spotify_id, self._key(key)),
+                )
+                self._conn.commit()
+                return None
+            self._conn.execute(
+                "UPDATE catalog SET accessed_at = ? WHERE key = ?",
+                (now, self._key(key)),
+            )
+            self._conn.commit()
+            self.hits += 1
+        return value, expires_at
+
+    def put(
+        self, key: Tuple[Hashable, ...], spotify_id: str, value: Any, ttl: float
+    ) -> None:
+        """Store ``value`` for ``ttl`` seconds and prune if over size."""
+        blob = zlib.compress(json.dumps(value, separators=(",", ":")).encode("utf-8"))
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO catalog "
+                "(key, spotify_id, kind, expires_at, accessed_at, size, value) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (self._key(key), spotify_id, str(key[0]), now + ttl, now, len(blob), blob),
+            )
+            self._prune(now)
+            self._conn.commit()
+
+    def _prune(self, now: float) -> None:
+        self._conn.execute("DELETE FROM catalog WHERE expires_at <= ?", (now,))
+        (total,) = self._conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM catalog"
+        ).fetchone()
+        if total <= self.max_bytes:
+            return
+        excess = total - self.max_bytes
+        rows = self._conn.execute(
+            "SELECT key, size FROM catalog ORDER BY accessed_at"
+        ).fetchall()
+        doomed = []
+        for key, size in rows:
+            if excess <= 0:
+                break
+            doomed.append((key,))
+            excess -= size
+        self._conn.executemany("DELETE FROM catalog WHERE key = ?", doomed)
+
+    def size(self) -> int:
+        """Total compressed size of the stored values, in bytes."""
+        with self._lock:
+            (total,) = self._conn.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM catalog"
+            ).fetchone()
+        return total
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
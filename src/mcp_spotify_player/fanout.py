@@ -0,0 +1,39 @@
+"""Concurrent execution of independent sub-requests.
+
+Used to split large multi-ID operations into endpoint-sized chunks and send
+them in parallel. Each task runs in a copy of the caller's context, so the
+active tool deadline applies to it, and every request still passes through
+the shared rate limiter.
+"""
+
+from __future__ import annotations
+
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Sequence, TypeVar
+
+from mcp_spotify_player.config import Config
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def chunked(items: Sequence[T], size: int) -> List[Sequence[T]]:
+    """Split ``items`` into consecutive slices of at most ``size`` elements."""
+    return [items[start:start + size] for start in range(0, len(items), size)]
+
+
+def fan_out(fn: Callable[[T], R], items: Sequence[T], max_workers: int | None = None) -> List[R]:
+    """Return ``[fn(item) for item in items]``, computed concurrently.
+
+    Results keep the order of ``items``. The first exception raised by a task
+    is re-raised once all tasks have finished.
+    """
+    if len(items) <= 1:
+        return [fn(item) for item in items]
+    workers = min(len(items), max_workers or Config.FANOUT_WORKERS)
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="mcp-fanout") as executor:
+        futures = [
+            executor.submit(contextvars.copy_context().run, fn, item) for item in items
+        ]
+    return [future.result() for future in futures]
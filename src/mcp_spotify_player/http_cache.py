@@ -0,0 +1,207 @@
+"""HTTP-semantics cache for Web API GET requests.
+
+Only catalog reads (albums, artists, tracks) and playlist metadata are
+cached; user state such as ``/me/player`` or saved albums, and playlist
+items, change too often. Responses carrying an ``ETag`` or a positive
+``max-age`` are kept as their encoded body. While ``max-age`` has not
+elapsed the body is served without a request; afterwards the request is
+revalidated with ``If-None-Match`` and a ``304 Not Modified`` answer reuses
+the stored body, saving the download. ``no-store`` responses are never kept.
+
+Every hit decodes a fresh copy, so callers may mutate what they receive. A
+write (any other method) to a resource evicts the cached reads of it, e.g.
+renaming or adding tracks to ``/playlists/{id}`` drops that playlist.
+"""
+
+from __future__ import annotations
+
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Mapping, Tuple
+from urllib.parse import urlsplit
+
+from mcp_spotify_player import json_codec
+from mcp_spotify_player.config import Config
+
+MISS = object()
+
+CacheKey = Tuple[Hashable, ...]
+
+# API paths whose GET responses may be cached
+_CACHEABLE_PATHS = re.compile(r"^/(?:(?:albums|artists|tracks)(?:/|$)|playlists/[^/]+$)")
+
+
+def _api_path(url: str) -> str:
+    """Return ``url``'s path relative to ``SPOTIFY_API_BASE``."""
+    path = urlsplit(url).path
+    base = urlsplit(Config.SPOTIFY_API_BASE).path
+    if base and path.startswith(base):
+        path = path[len(base):]
+    return path
+
+
+def is_cacheable_url(url: str) -> bool:
+    """Return whether GETs of ``url`` go through the cache."""
+    return bool(_CACHEABLE_PATHS.match(_api_path(url)))
+
+
+def resource_url(url: str) -> str:
+    """Return the resource a request targets: ``/playlists/{id}/tracks`` gives
+    ``/playlists/{id}``, under ``SPOTIFY_API_BASE``."""
+    segments = [part for part in _api_path(url).split("/") if part][:2]
+    return f"{Config.SPOTIFY_API_BASE}/{'/'.join(segments)}"
+
+
+def header(response, name: str) -> str | None:
+    """Return a response header, case-insensitively."""
+    headers = getattr(response, "headers", None) or {}
+    value = headers.get(name)
+    if value is None:
+        lowered = name.lower()
+        for key, item in headers.items():
+            if key.lower() == lowered:
+                return item
+    return value
+
+
+def parse_cache_control(value: str | None) -> Dict[str, str | None]:
+    """Parse a ``Cache-Control`` header into a directive mapping."""
+    directives: Dict[str, str | None] = {}
+    for part in (value or "").split(","):
+        name, _, arg = part.strip().partition("=")
+        if name:
+            directives[name.lower()] = arg.strip('"') if arg else None
+    return directives
+
+
+def _max_age(directives: Mapping[str, str | None]) -> float:
+    if "no-cache" in directives:
+        return 0.0
+    try:
+        return max(float(directives.get("max-age") or 0), 0.0)
+    except ValueError:
+        return 0.0
+
+
+def _encoded_body(response, body: Any) -> bytes:
+    content = getattr(response, "content", None)
+    if isinstance(content, (bytes, bytearray)) and content:
+        return bytes(content)
+    return json_codec.dumps(body)
+
+
+class _Entry:
+    __slots__ = ("etag", "blob", "fresh_until")
+
+    def __init__(self, etag: str | None, blob: bytes, fresh_until: float):
+        self.etag = etag
+        self.blob = blob
+        self.fresh_until = fresh_until
+
+
+class HttpCache:
+    """Validator cache keyed by URL and query params, bounded by entry count."""
+
+    def __init__(self, max_entries: int | None = None):
+        self.max_entries = max_entries or Config.HTTP_CACHE_MAX_ENTRIES
+        self._entries: OrderedDict[CacheKey, _Entry] = OrderedDict()
+        self._lock = threading.Lock()
+        self.fresh_hits = 0
+        self.revalidated = 0
+        self.stored = 0
+        self.invalidated = 0
+        self.bytes_saved = 0
+
+    @staticmethod
+    def key(url: str, params: Mapping[str, Any] | None = None) -> CacheKey:
+        items = tuple(sorted((str(k), str(v)) for k, v in (params or {}).items()))
+        return (url, items)
+
+    def fresh(self, key: CacheKey) -> Any:
+        """Return the body if it is still within ``max-age``, else :data:`MISS`."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.fresh_until <= time.monotonic():
+                return MISS
+            self._entries.move_to_end(key)
+            self.fresh_hits += 1
+            self.bytes_saved += len(entry.blob)
+            blob = entry.blob
+        return json_codec.loads(blob)
+
+    def validator(self, key: CacheKey) -> str | None:
+        """Return the stored ``ETag`` to send as ``If-None-Match``."""
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry.etag if entry is not None else None
+
+    def not_modified(self, key: CacheKey, response) -> Any:
+        """Handle a 304: return the stored body and refresh its lifetime."""
+        directives = parse_cache_control(header(response, "Cache-Control"))
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return MISS
+            entry.fresh_until = time.monotonic() + _max_age(directives)
+            self._entries.move_to_end(key)
+            self.revalidated += 1
+            self.bytes_saved += len(entry.blob)
+            blob = entry.blob
+        return json_codec.loads(blob)
+
+    def store(self, key: CacheKey, response, body: Any) -> None:
+        """Keep ``body`` if the response allows it and can be revalidated."""
+        directives = parse_cache_control(header(response, "Cache-Control"))
+        etag = header(response, "ETag")
+        max_age = _max_age(directives)
+        if "no-store" in directives or (etag is None and max_age <= 0):
+            with self._lock:
+                self._entries.pop(key, None)
+            return
+        entry = _Entry(etag, _encoded_body(response, body), time.monotonic() + max_age)
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            self.stored += 1
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, url: str) -> None:
+        """Evict every cached read of the resource ``url`` writes to."""
+        prefix = resource_url(url)
+        with self._lock:
+            doomed = [
+                key
+                for key in self._entries
+                if key[0] == prefix or str(key[0]).startswith(prefix + "/")
+            ]
+            for key in doomed:
+                del self._entries[key]
+            self.invalidated += len(doomed)
+
+    def stats(self) -> Dict[str, int]:
+        """Return entry count, hit counters and bytes not downloaded."""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "stored": self.stored,
+                "fresh_hits": self.fresh_hits,
+                "revalidated": self.revalidated,
+                "invalidated": self.invalidated,
+                "bytes_saved": self.bytes_saved,
+            }
+
+
+_CACHE: HttpCache | None = None
+_CACHE_LOCK = threading.Lock()
+
+
+def get_http_cache() -> HttpCache:
+    """Return the process-wide :class:`HttpCache`, creating it on first use."""
+    global _CACHE
+    with _CACHE_LOCK:
+        if _CACHE is None:
+            _CACHE = HttpCache()
+        return _CACHE
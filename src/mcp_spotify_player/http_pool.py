@@ -0,0 +1,284 @@
+"""Shared, long-lived HTTP connection pool for Spotify requests.
+
+Every call to the Web API and to the accounts service goes through a single
+``requests.Session`` so TCP and TLS connections are reused between tool calls
+instead of being re-established for each request. Async callers get an HTTP/2
+``httpx.AsyncClient`` from the same pool, one per event loop.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+import weakref
+from functools import cache
+from typing import TYPE_CHECKING, Any, Dict
+
+from mcp_logging import get_logger
+from mcp_spotify.errors import DeadlineExceededError
+from mcp_spotify_player.config import Config
+from mcp_spotify_player.json_codec import ACCEPT_ENCODING
+from mcp_spotify_player.timeouts import deadline_exceeded, request_timeout
+
+if TYPE_CHECKING:
+    import asyncio
+
+    import httpx
+    import requests
+
+logger = get_logger(__name__)
+
+
+class _PoolStats:
+    """Thread-safe counters describing connection reuse."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.opened = 0
+        self.evicted = 0
+
+    def record_request(self) -> None:
+        with self._lock:
+            self.requests += 1
+
+    def record_open(self) -> None:
+        with self._lock:
+            self.opened += 1
+
+    def record_eviction(self) -> None:
+        with self._lock:
+            self.evicted += 1
+
+    def snapshot(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "opened": self.opened,
+                "reused": max(self.requests - self.opened, 0),
+                "evicted": self.evicted,
+            }
+
+
+def _http2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+@cache
+def _counting_adapter_class() -> type:
+    """Build the adapter class on first use, so ``requests`` loads lazily."""
+    from requests.adapters import HTTPAdapter
+    from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+    class _CountingAdapter(HTTPAdapter):
+        """HTTPAdapter whose connection pools report every new connection."""
+
+        def __init__(self, stats: _PoolStats, **kwargs):
+            self._stats = stats
+            super().__init__(**kwargs)
+
+        def init_poolmanager(self, *args, **kwargs):
+            super().init_poolmanager(*args, **kwargs)
+            stats = self._stats
+
+            class CountingHTTPConnectionPool(HTTPConnectionPool):
+                def _new_conn(self):
+                    stats.record_open()
+                    return super()._new_conn()
+
+            class CountingHTTPSConnectionPool(HTTPSConnectionPool):
+                def _new_conn(self):
+                    stats.record_open()
+                    return super()._new_conn()
+
+            self.poolmanager.pool_classes_by_scheme = {
+                "http": CountingHTTPConnectionPool,
+                "https": CountingHTTPSConnectionPool,
+            }
+
+    return _CountingAdapter
+
+
+class HttpPool:
+    """Pooled ``requests.Session`` shared by every Spotify client.
+
+    Connections are kept alive between requests. When the pool has been idle
+    for longer than ``idle_timeout`` seconds the underlying session is closed
+    and rebuilt, since Spotify will have dropped the sockets by then anyway.
+    The idle period starts when the last request finishes, and the session is
+    never closed while a request is still in flight.
+    """
+
+    def __init__(
+        self,
+        pool_size: int | None = None,
+        idle_timeout: float | None = None,
+        keep_alive: bool | None = None,
+    ):
+        self.pool_size = pool_size or Config.HTTP_POOL_SIZE
+        self.idle_timeout = (
+            Config.HTTP_IDLE_TIMEOUT if idle_timeout is None else idle_timeout
+        )
+        self.keep_alive = Config.HTTP_KEEPALIVE if keep_alive is None else keep_alive
+        self._stats = _PoolStats()
+        self._lock = threading.Lock()
+        self._session: requests.Session | None = None
+        self._last_used = 0.0
+        self._in_flight = 0
+        # An async client's connections belong to the loop that opened them
+        self._async_clients: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, httpx.AsyncClient
+        ] = weakref.WeakKeyDictionary()
+
+    def _build_session(self) -> requests.Session:
+        import requests
+
+        session = requests.Session()
+        adapter = _counting_adapter_class()(
+            self._stats,
+            pool_connections=4,
+            pool_maxsize=self.pool_size,
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.headers["Accept-Encoding"] = ACCEPT_ENCODING
+        if not self.keep_alive:
+            session.headers["Connection"] = "close"
+        return session
+
+    def _live_session(self, now: float) -> requests.Session:
+        """Return the session, rebuilding it after an idle period; hold ``_lock``."""
+        if self._session is not None and self.idle_timeout > 0 and not self._in_flight:
+            if now - self._last_used > self.idle_timeout:
+                logger.debug("Evicting idle HTTP connections")
+                self._session.close()
+                self._session = None
+                self._stats.record_eviction()
+        if self._session is None:
+            self._session = self._build_session()
+        self._last_used = now
+        return self._session
+
+    @property
+    def session(self) -> requests.Session:
+        """Return the live session, rebuilding it after an idle period."""
+        with self._lock:
+            return self._live_session(time.monotonic())
+
+    def request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        """Send a request through the pooled session.
+
+        Without an explicit ``timeout`` the endpoint's timeout class is used,
+        clamped to the active tool deadline.
+        """
+        import requests
+
+        if kwargs.get("timeout") is None:
+            kwargs["timeout"] = request_timeout(method, url)
+        with self._lock:
+            session = self._live_session(time.monotonic())
+            self._in_flight += 1
+        self._stats.record_request()
+        try:
+            return session.request(method, url, **kwargs)
+        except requests.Timeout as exc:
+            if deadline_exceeded():
+                raise DeadlineExceededError("Tool deadline exceeded.") from exc
+            raise
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+                self._last_used = time.monotonic()
+
+    def async_client(self) -> httpx.AsyncClient:
+        """Return the running event loop's ``httpx.AsyncClient``.
+
+        It is sized and configured like the session, with HTTP/2 enabled when
+        ``h2`` is installed so concurrent requests share one connection.
+        """
+        import asyncio
+
+        import httpx
+
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            client = self._async_clients.get(loop)
+            if client is None:
+                http2 = _http2_available()
+                if not http2:
+                    logger.warning("h2 is not installed; falling back to HTTP/1.1")
+                headers = {"Accept-Encoding": ACCEPT_ENCODING}
+                if not self.keep_alive:
+                    headers["Connection"] = "close"
+                client = httpx.AsyncClient(
+                    http2=http2,
+                    limits=httpx.Limits(
+                        max_connections=self.pool_size,
+                        keepalive_expiry=self.idle_timeout or None,
+                    ),
+                    headers=headers,
+                )
+                self._async_clients[loop] = client
+            return client
+
+    async def aclose(self) -> None:
+        """Close the running event loop's async client, if it was opened."""
+        import asyncio
+
+        with self._lock:
+            client = self._async_clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.aclose()
+
+    def post(self, url: str, **kwargs: Any) -> requests.Response:
+        """Shortcut for ``request("POST", url, ...)``."""
+        return self.request("POST", url, **kwargs)
+
+    def preconnect(self, url: str) -> None:
+        """Open a connection to ``url``'s host and leave it idle in the pool.
+
+        A ``HEAD`` request goes through the full TCP and TLS handshake; its
+        status is irrelevant. Reading the (empty) body hands the connection
+        back to the pool for the next request to that host.
+        """
+        response = self.request("HEAD", url, allow_redirects=False)
+        response.content
+
+    def stats(self) -> Dict[str, int]:
+        """Return connection counters together with the configured size."""
+        data = self._stats.snapshot()
+        data["size"] = self.pool_size
+        return data
+
+    def close(self) -> None:
+        """Close every pooled connection."""
+        with self._lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+
+
+_POOL: HttpPool | None = None
+_POOL_LOCK = threading.Lock()
+
+
+def get_http_pool() -> HttpPool:
+    """Return the process-wide :class:`HttpPool`, creating it on first use."""
+    global _POOL
+    with _POOL_LOCK:
+        if _POOL is None:
+            _POOL = HttpPool()
+        return _POOL
+
+
+def close_http_pool() -> None:
+    """Close the process-wide pool if it was ever created."""
+    global _POOL
+    with _POOL_LOCK:
+        if _POOL is not None:
+            _POOL.close()
+            _POOL = None
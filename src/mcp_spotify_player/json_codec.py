@@ -0,0 +1,56 @@
+"""Fast JSON encoding and decoding.
+
+Web API bodies are parsed straight from the raw (already decompressed) bytes,
+so the ``text`` of a response is never built, and outgoing JSON-RPC messages
+are encoded straight to UTF-8 bytes. ``orjson`` is used when it is installed
+and the standard library otherwise; both raise :class:`ValueError` on
+malformed input.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+BACKEND = "orjson" if orjson is not None else "json"
+
+# Returned by :func:`decode` for a response without a body
+EMPTY = object()
+
+# Compressed encodings both ``requests`` and ``httpx`` can decode here;
+# Brotli only when one of its bindings is installed.
+ENCODINGS = ["gzip", "deflate"]
+if importlib.util.find_spec("brotli") or importlib.util.find_spec("brotlicffi"):
+    ENCODINGS.append("br")
+ACCEPT_ENCODING = ", ".join(ENCODINGS)
+
+
+def loads(data: bytes | str) -> Any:
+    """Parse a JSON document from bytes or text."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any) -> bytes:
+    """Encode ``obj`` as compact UTF-8 JSON bytes."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            # e.g. integers beyond 64 bits; the standard library handles those
+            pass
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def decode(response) -> Any:
+    """Parse a response's raw ``content`` bytes, returning :data:`EMPTY`
+    when there is no body."""
+    content = response.content
+    return loads(content) if content else EMPTY
@@ -83,7 +83,8 @@ MANIFEST = {
                 "type": "object",
                 "properties": {
                     "limit": {"type": "integer", "minimum": 1}
-                }
+                },
+                "additionalProperties": False
             }
         },
         {
@@ -223,7 +224,16 @@ MANIFEST = {
             "description": "Retrieve the user's playlists list",
             "inputSchema": {
                 "type": "object",
-                "properties": {}
+                "properties": {
+                    "limit": {
+                        "oneOf": [
+                            {"type": "integer", "minimum": 1},
+                            {"type": "string", "enum": ["all"]}
+                        ],
+                        "default": 20,
+                        "description": "Number of items to return, fetched across pages as needed, or \"all\""
+                    }
+                }
             }
         },
         {
@@ -234,13 +244,16 @@ MANIFEST = {
                 "properties": {
                     "playlist_id": {
                         "type": "string",
+                        "format": "spotify-id",
                         "description": "Playlist ID"
                     },
                     "limit": {
-                        "type": "integer",
-                        "minimum": 1,
-                        "maximum": 100,
-                        "default": 20
+                        "oneOf": [
+                            {"type": "integer", "minimum": 1},
+                            {"type": "string", "enum": ["all"]}
+                        ],
+                        "default": 20,
+                        "description": "Number of items to return, fetched across pages as needed, or \"all\""
                     }
                 },
                 "required": [
@@ -256,6 +269,7 @@ MANIFEST = {
                 "properties": {
                     "artist_id": {
                         "type": "string",
+                        "format": "spotify-id",
                         "description": "Spotify artist ID",
                     }
                 },
@@ -270,6 +284,7 @@ MANIFEST = {
                 "properties": {
                     "artist_id": {
                         "type": "string",
+                        "format": "spotify-id",
                         "description": "Spotify artist ID",
                     },
                     "include_groups": {
@@ -277,10 +292,12 @@ MANIFEST = {
                         "description": "Filter by album types, e.g., album,single",
                     },
                     "limit": {
-                        "type": "integer",
-                        "minimum": 1,
-                        "maximum": 50,
+                        "oneOf": [
+                            {"type": "integer", "minimum": 1},
+                            {"type": "string", "enum": ["all"]}
+                        ],
                         "default": 20,
+                        "description": "Number of items to return, fetched across pages as needed, or \"all\""
                     },
                 },
                 "required": ["artist_id"],
@@ -294,10 +311,13 @@ MANIFEST = {
                 "properties": {
                     "artist_id": {
                         "type": "string",
+                        "format": "spotify-id",
                         "description": "Spotify artist ID",
                     },
                     "market": {
                         "type": "string",
+                        "minLength": 2,
+                        "maxLength": 2,
                         "description": "ISO 3166-1 alpha-2 country code",
                         "default": "US",
                     },
@@ -319,6 +339,7 @@ MANIFEST = {
                 "properties": {
                     "album_id": {
                         "type": "string",
+                        "format": "spotify-id",
                         "description": "Spotify album ID"
                     }
                 },
@@ -335,7 +356,7 @@ MANIFEST = {
                 "properties": {
                     "album_ids": {
                         "type": "array",
-                        "items": {"type": "string"},
+                        "items": {"type": "string", "format": "spotify-id"},
                         "description": "List of Spotify album IDs"
                     }
                 },
@@ -350,13 +371,16 @@ MANIFEST = {
                 "properties": {
                     "album_id": {
                         "type": "string",
+                        "format": "spotify-id",
                         "description": "Album ID"
                     },
                     "limit": {
-                        "type": "integer",
-                        "minimum": 1,
-                        "maximum": 100,
-                        "default": 20
+                        "oneOf": [
+                            {"type": "integer", "minimum": 1},
+                            {"type": "string", "enum": ["all"]}
+                        ],
+                        "default": 20,
+                        "description": "Number of items to return, fetched across pages as needed, or \"all\""
                     }
                 },
                 "required": ["album_id"]
@@ -369,10 +393,12 @@ MANIFEST = {
                 "type": "object",
                 "properties": {
                     "limit": {
-                        "type": "integer",
-                        "minimum": 1,
-                        "maximum": 50,
-                        "default": 20
+                        "oneOf": [
+                            {"type": "integer", "minimum": 1},
+                            {"type": "string", "enum": ["all"]}
+                        ],
+                        "default": 20,
+                        "description": "Number of items to return, fetched across pages as needed, or \"all\""
                     }
                 }
             }
@@ -385,7 +411,7 @@ MANIFEST = {
                 "properties": {
                     "album_ids": {
                         "type": "array",
-                        "items": {"type": "string"},
+                        "items": {"type": "string", "format": "spotify-id"},
                         "description": "List of Spotify album IDs"
                     }
                 },
@@ -400,7 +426,7 @@ MANIFEST = {
                 "properties": {
                     "album_ids": {
                         "type": "array",
-                        "items": {"type": "string"},
+                        "items": {"type": "string", "format": "spotify-id"},
                         "description": "List of Spotify album IDs"
                     }
                 },
@@ -415,7 +441,7 @@ MANIFEST = {
                 "properties": {
                     "album_ids": {
                         "type": "array",
-                        "items": {"type": "string"},
+                        "items": {"type": "string", "format": "spotify-id"},
                         "description": "List of Spotify album IDs"
                     }
                 },
@@ -430,16 +456,17 @@ MANIFEST = {
                 "properties": {
                     "playlist_id": {
                         "type": "string",
+                        "format": "spotify-id",
                         "description": "Spotify playlist ID"
                     },
-                    "new_name": {
+                    "playlist_name": {
                         "type": "string",
                         "description": "New name for the playlist"
                     }
                 },
                 "required": [
                     "playlist_id",
-                    "new_name"
+                    "playlist_name"
                 ]
             }
         },
@@ -451,6 +478,7 @@ MANIFEST = {
                 "properties": {
                     "playlist_id": {
                         "type": "string",
+                        "format": "spotify-id",
                         "description": "Spotify playlist ID"
                     }
                 },
@@ -487,6 +515,7 @@ MANIFEST = {
                 "properties": {
                     "playlist_id": {
                         "type": "string",
+                        "format": "spotify-id",
                         "description": "Spotify playlist ID"
                     },
                     "track_uris": {
@@ -494,7 +523,12 @@ MANIFEST = {
                         "items": {
                             "type": "string"
                         },
-                        "description": "List of track URIs to add"
+                        "description": "List of track URIs to add; lists over 100 are added in chunks"
+                    },
+                    "position": {
+                        "type": "integer",
+                        "minimum": 0,
+                        "description": "Zero-based index at which to insert the tracks (appends if omitted)"
                     }
                 },
                 "required": [
@@ -1,4 +1,4 @@
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, ClassVar, Dict, List, Optional, Union
 
 from pydantic import BaseModel, Field, field_validator
 
@@ -49,6 +49,16 @@ class PlaylistRequest(BaseModel):
 # Models to requests
 class TrackInfo(BaseModel):
     """Tracks information"""
+    # Where each field is read from in a Web API track object
+    spotify_paths: ClassVar[Dict[str, str]] = {
+        "name": "name",
+        "artist": "artists.name",
+        "album": "album.name",
+        "uri": "uri",
+        "duration_ms": "duration_ms",
+        "external_url": "external_urls.spotify",
+    }
+
     name: str
     artist: str
     album: str
@@ -56,6 +66,22 @@ class TrackInfo(BaseModel):
     duration_ms: int
     external_url: str
 
+    @classmethod
+    def from_spotify(cls, track: Dict[str, Any]) -> "TrackInfo":
+        """Build from a Web API track object by following :attr:`spotify_paths`.
+
+        A list met along a path, such as ``artists``, contributes its first item.
+        """
+        values = {}
+        for field, path in cls.spotify_paths.items():
+            value: Any = track
+            for key in path.split("."):
+                if isinstance(value, list):
+                    value = value[0]
+                value = value[key]
+            values[field] = value
+        return cls(**values)
+
 class PlaybackState(BaseModel):
     """Playback state"""
     is_playing: bool
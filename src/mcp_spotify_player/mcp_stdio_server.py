@@ -4,118 +4,120 @@ MCP server for Spotify Player using stdio
 Implements the MCP protocol over JSON-RPC for communication with MCP clients
 """
 
+import contextvars
 import json
 import platform
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, wait
 from datetime import datetime, timezone
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, List, Optional
 
-from mcp_logging import get_logger
+from mcp_logging import get_logger, payload
 
 import mcp_spotify_player
 
+from mcp_spotify.auth.manager import TokenManager
+from mcp_spotify.auth.store import TokenStore
 from mcp_spotify.auth.tokens import Tokens
-from mcp_spotify.errors import InvalidTokenFileError, McpUserError, UserAuthRequiredError
-from mcp_spotify_player.client_auth import ensure_user_tokens, try_load_tokens
+from mcp_spotify.errors import InvalidTokenFileError, McpUserError
+from mcp_spotify_player.catalog_cache import close_catalog_cache, get_catalog_cache
+from mcp_spotify_player.client_auth import get_auth_flow, try_load_tokens
 from mcp_spotify_player.config import Config, get_tokens_path
+from mcp_spotify_player.http_cache import get_http_cache
+from mcp_spotify_player.http_pool import close_http_pool, get_http_pool
+from mcp_spotify_player import json_codec
 from mcp_spotify_player.mcp_manifest import MANIFEST
+from mcp_spotify_player.rate_limiter import get_rate_limiter
+from mcp_spotify_player.retry import get_retry_policy
+from mcp_spotify_player.schema_validation import compile_validators
+from mcp_spotify_player.singleflight import get_single_flight
 from mcp_spotify_player.spotify_controller import SpotifyController
+from mcp_spotify_player.stdio_writer import PreEncodedResult, StdioWriter
+from mcp_spotify_player.timeouts import tool_deadline
+from mcp_spotify_player.warmup import Warmup
 
 # Configure logging
 logger = get_logger(__name__)
 
 
 class MCPServer:
+    # Tools that answer without a Spotify login
+    AUTH_FREE_TOOLS = frozenset({"auth", "diagnose"})
+
     def __init__(self):
         self.config = Config()
 
+        self.token_store = TokenStore(get_tokens_path())
         try:
-            ensure_user_tokens()
-        except TimeoutError:
-            raise UserAuthRequiredError(
-                "Authorization not completed within timeout. Please try /auth again."
-            )
-
-        try:
-            tokens = try_load_tokens()
+            tokens = self.token_store.load()
         except InvalidTokenFileError as e:
             logger.error(str(e))
             raise
 
         if tokens is None or not tokens.refresh_token:
-            raise UserAuthRequiredError(
-                "No user token found. Run /auth."
-            )
-
-        self.current_tokens: Tokens = tokens
-
-        def tokens_provider() -> Optional[Tokens]:
-            return self.current_tokens
-
-        self.controller = SpotifyController(tokens_provider)
+            # Serve at once; the login starts when a tool first needs it
+            logger.info("No user token found. Run /auth to log in to Spotify.")
+
+        # Runs the browser login in the background, never blocking a request
+        self.auth_flow = get_auth_flow()
+        self.token_manager = TokenManager(tokens, store=self.token_store)
+        self.controller = SpotifyController(
+            self.token_manager.get, token_manager=self.token_manager
+        )
+        # Started by initialize when MCP_WARMUP is on
+        self.warmup = Warmup(self.token_manager)
         self.request_id = 0
+        # Serializes stdout so concurrent responses never interleave
+        self.writer = StdioWriter()
         # MCP Manifest
         self.manifest = MANIFEST
+        # The tool list never changes, so its response is encoded only once
+        self._tools_list = PreEncodedResult({"tools": self.manifest["tools"]})
 
         # Tool dispatch configuration
         self.TOOL_HANDLERS = {
-            "play_music": self.controller.playback.play_music,
-            "pause_music": self.controller.playback.pause_music,
-            "skip_next": self.controller.playback.skip_next,
-            "skip_previous": self.controller.playback.skip_previous,
-            "set_volume": self.controller.playback.set_volume,
-            "set_repeat": self.controller.playback.set_repeat,
-            "get_current_playing": self.controller.playback.get_current_playing,
-            "get_playback_state": self.controller.playback.get_playback_state,
-            "get_devices": self.controller.playback.get_devices,
-            "search_music": self.controller.playback.search_music,
-            "search_collections": self.controller.playback.search_collections,
-            "get_playlists": self.controller.playlists.get_playlists,
-            "get_playlist_tracks": self.controller.playlists.get_playlist_tracks,
-            "get_artist": self.controller.artists.get_artist,
-            "get_artist_albums": self.controller.artists.get_artist_albums,
-            "get_artist_top_tracks": self.controller.artists.get_artist_top_tracks,
-            "get_album": self.controller.albums.get_album,
-            "get_albums": self.controller.albums.get_albums,
-            "get_album_tracks": self.controller.albums.get_album_tracks,
-            "get_saved_albums": self.controller.albums.get_saved_albums,
-            "check_saved_albums": self.controller.albums.check_saved_albums,
-            "save_albums": self.controller.albums.save_albums,
-            "delete_saved_albums": self.controller.albums.delete_saved_albums,
-            "rename_playlist": self.controller.playlists.rename_playlist,
-            "clear_playlist": self.controller.playlists.clear_playlist,
-            "create_playlist": self.controller.playlists.create_playlist,
-            "add_tracks_to_playlist": self.controller.playlists.add_tracks_to_playlist,
+            "play_music": self._controller_method("playback", "play_music"),
+            "pause_music": self._controller_method("playback", "pause_music"),
+            "skip_next": self._controller_method("playback", "skip_next"),
+            "skip_previous": self._controller_method("playback", "skip_previous"),
+            "set_volume": self._controller_method("playback", "set_volume"),
+            "set_repeat": self._controller_method("playback", "set_repeat"),
+            "get_current_playing": self._controller_method("playback", "get_current_playing"),
+            "get_playback_state": self._controller_method("playback", "get_playback_state"),
+            "get_devices": self._controller_method("playback", "get_devices"),
+            "search_music": self._controller_method("playback", "search_music"),
+            "search_collections": self._controller_method("playback", "search_collections"),
+            "get_playlists": self._controller_method("playlists", "get_playlists"),
+            "get_playlist_tracks": self._controller_method("playlists", "get_playlist_tracks"),
+            "get_artist": self._controller_method("artists", "get_artist"),
+            "get_artist_albums": self._controller_method("artists", "get_artist_albums"),
+            "get_artist_top_tracks": self._controller_method("artists", "get_artist_top_tracks"),
+            "get_album": self._controller_method("albums", "get_album"),
+            "get_albums": self._controller_method("albums", "get_albums"),
+            "get_album_tracks": self._controller_method("albums", "get_album_tracks"),
+            "get_saved_albums": self._controller_method("albums", "get_saved_albums"),
+            "check_saved_albums": self._controller_method("albums", "check_saved_albums"),
+            "save_albums": self._controller_method("albums", "save_albums"),
+            "delete_saved_albums": self._controller_method("albums", "delete_saved_albums"),
+            "rename_playlist": self._controller_method("playlists", "rename_playlist"),
+            "clear_playlist": self._controller_method("playlists", "clear_playlist"),
+            "create_playlist": self._controller_method("playlists", "create_playlist"),
+            "add_tracks_to_playlist": self._controller_method("playlists", "add_tracks_to_playlist"),
             "diagnose": self._diagnose,
-            "queue_add": self.controller.playback.queue_add,
-            "queue_list": self.controller.playback.queue_list,
+            "queue_add": self._controller_method("playback", "queue_add"),
+            "queue_list": self._controller_method("playback", "queue_list"),
             "auth": self._auth,
         }
 
-        # Optional validators and result formatters
-        self.TOOL_VALIDATORS = {
-            "set_volume": self._validate_set_volume,
-            "set_repeat": self._validate_set_repeat,
-            "search_music": self._validate_search_music,
-            "search_collections": self._validate_search_collections,
-            "get_playlist_tracks": self._validate_get_playlist_tracks,
-            "get_artist": self._validate_get_artist,
-            "get_artist_albums": self._validate_get_artist_albums,
-            "get_artist_top_tracks": self._validate_get_artist_top_tracks,
-            "get_album": self._validate_get_album,
-            "get_albums": self._validate_get_albums,
-            "get_album_tracks": self._validate_get_album_tracks,
-            "get_saved_albums": self._validate_get_saved_albums,
-            "check_saved_albums": self._validate_check_saved_albums,
-            "save_albums": self._validate_save_albums,
-            "delete_saved_albums": self._validate_delete_saved_albums,
-            "rename_playlist": self._validate_rename_playlist,
-            "clear_playlist": self._validate_clear_playlist,
-            "create_playlist": self._validate_create_playlist,
-            "add_tracks_to_playlist": self._validate_add_tracks_to_playlist,
-            "queue_add": self._validate_queue_add,
-            "queue_list": self._validate_queue_list,
+        # Argument validators compiled from each tool's inputSchema, and
+        # optional result formatters
+        self.TOOL_VALIDATORS = compile_validators(self.manifest)
+
+        # Deadlines for tools that may legitimately run past MCP_TOOL_TIMEOUT
+        self.TOOL_TIMEOUTS = {
+            "add_tracks_to_playlist": self.config.MCP_BULK_TIMEOUT,
         }
 
         self.RESULT_FORMATTERS = {
@@ -139,12 +141,31 @@ class MCPServer:
             "queue_list": self._format_json_result,
         }
 
+    def _controller_method(self, group: str, name: str) -> Callable[..., Any]:
+        """Return a handler that looks up ``controller.<group>.<name>`` when called.
+
+        Looking the method up at call time keeps the controllers, and the
+        modules they import, unbuilt until a tool actually needs them.
+        """
+
+        def handler(**arguments: Any) -> Any:
+            return getattr(getattr(self.controller, group), name)(**arguments)
+
+        handler.__name__ = name
+        return handler
+
+    @property
+    def current_tokens(self) -> Optional[Tokens]:
+        return self.token_manager.get()
+
+    @current_tokens.setter
+    def current_tokens(self, tokens: Optional[Tokens]):
+        self.token_manager.set(tokens)
+
     def send_response(self, response: Dict[str, Any]):
         """Send a JSON-RPC response over stdout"""
-        json_response = json.dumps(response, ensure_ascii=False) + "\n"
-        sys.stdout.write(json_response)
-        sys.stdout.flush()
-        logger.info(f"Sending response: {response}")
+        self.writer.send(response)
+        logger.debug("Sending response: %s", payload(response))
 
     def send_error(self, request_id: Any, code: int, message: str):
         """Send a JSON-RPC error"""
@@ -172,11 +193,13 @@ class MCPServer:
             },
         }
         self.send_response(response)
+        if self.config.MCP_WARMUP:
+            self.warmup.start()
 
     def handle_tools_list(self, request_id: Any):
         """List available tools"""
-        response = {"jsonrpc": "2.0", "id": request_id, "result": {"tools": self.manifest["tools"]}}
-        self.send_response(response)
+        self.writer.write_frame(self._tools_list.frame(request_id))
+        logger.info("Sending tools/list response for id %s", request_id)
 
     def handle_tools_call(self, request_id: Any, params: Dict[str, Any]):
         """Execute a tool"""
@@ -186,24 +209,7 @@ class MCPServer:
             else:
                 calls = [{"name": params.get("name"), "arguments": params.get("arguments", {})}]
 
-            results = []
-            for call in calls:
-                tool_name = call.get("name")
-                arguments = call.get("arguments", {})
-                if not tool_name:
-                    continue
-
-                logger.info(f"Executing {tool_name} with arguments: {arguments}")
-                try:
-                    result = self.execute_tool(tool_name, arguments)
-                    results.append(
-                        {"name": tool_name, "content": [{"type": "text", "text": result}]}
-                    )
-                except McpUserError as exc:
-                    logger.warning(f"User error executing {tool_name}: {exc}")
-                    results.append(
-                        {"name": tool_name, "content": [{"type": "text", "text": str(exc)}]}
-                    )
+            results = self._execute_calls(calls)
 
             if len(results) == 1:
                 response = {"jsonrpc": "2.0", "id": request_id, "result": results[0]}
@@ -214,6 +220,73 @@ class MCPServer:
             logger.error(f"Error executing tool: {str(e)}")
             self.send_error(request_id, -32603, f"Internal error: {str(e)}")
 
+    def _execute_call(self, call: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Run one entry of a tools/call request and wrap its text result"""
+        tool_name = call.get("name")
+        arguments = call.get("arguments", {})
+        if not tool_name:
+            return None
+
+        logger.info("Executing %s with arguments: %s", tool_name, payload(arguments))
+        try:
+            result = self.execute_tool(tool_name, arguments)
+            return {"name": tool_name, "content": [{"type": "text", "text": result}]}
+        except McpUserError as exc:
+            logger.warning("User error executing %s: %s", tool_name, exc)
+            return {"name": tool_name, "content": [{"type": "text", "text": str(exc)}]}
+
+    def _execute_calls(self, calls: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Run the entries of a ``calls`` batch concurrently.
+
+        Entries run on a pool of at most ``MCP_BATCH_WORKERS`` threads and the
+        whole batch shares a ``MCP_BATCH_TIMEOUT`` deadline, which each entry
+        inherits through the ``timeouts`` context variable so its HTTP
+        requests stop at the same moment. Results keep the order of the
+        request. Entries that had not started by the deadline are cancelled
+        and reported as not run. Entries still running are reported with an
+        unknown result instead of delaying the response: a write that Spotify
+        already received may still apply.
+        """
+        if len(calls) <= 1:
+            return [r for r in map(self._execute_call, calls) if r is not None]
+
+        timeout = self.config.MCP_BATCH_TIMEOUT
+        workers = min(len(calls), self.config.MCP_BATCH_WORKERS)
+        executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="mcp-batch")
+        try:
+            with tool_deadline(timeout):
+                # Each worker runs in a copy of this context, deadline included
+                futures = [
+                    executor.submit(contextvars.copy_context().run, self._execute_call, call)
+                    for call in calls
+                ]
+            done, _ = wait(futures, timeout=timeout)
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        results = []
+        for call, future in zip(calls, futures):
+            if future in done:
+                result = future.result()
+            elif call.get("name"):
+                logger.warning("Batch deadline exceeded for %s", call.get("name"))
+                if future.cancelled():
+                    text = f"Error: batch deadline of {timeout:g}s exceeded; the call was not run"
+                else:
+                    text = (
+                        f"Error: batch deadline of {timeout:g}s exceeded; "
+                        "result unknown, the call may still apply"
+                    )
+                result = {
+                    "name": call.get("name"),
+                    "content": [{"type": "text", "text": text}],
+                }
+            else:
+                result = None
+            if result is not None:
+                results.append(result)
+        return results
+
     def execute_tool(self, tool_name: str, arguments: Dict[str, Any]) -> str:
         """Execute a specific tool using dynamic dispatch"""
         try:
@@ -225,9 +298,17 @@ class MCPServer:
             if validator:
                 validator(arguments)
 
-            result = handler(**arguments)
+            if tool_name not in self.AUTH_FREE_TOOLS and not self._authorized():
+                return self._auth_pending()
+
+            start = time.perf_counter()
+            timeout = self.TOOL_TIMEOUTS.get(tool_name, self.config.MCP_TOOL_TIMEOUT)
+            with tool_deadline(timeout):
+                result = handler(**arguments)
+            if tool_name not in self.AUTH_FREE_TOOLS:
+                self.warmup.record_first_call(time.perf_counter() - start)
             formatter = self.RESULT_FORMATTERS.get(tool_name, self._default_formatter)
-            logger.info("Executing tool: %s with arguments: %s", tool_name, arguments)
+            logger.info("Executing tool: %s with arguments: %s", tool_name, payload(arguments))
             return formatter(result, arguments)
 
         except McpUserError:
@@ -261,215 +342,93 @@ class MCPServer:
             )
         elif "tokens: invalid" not in lines:
             lines.append("tokens: missing")
+        lines.append(f"auth: {self.auth_flow.state}")
+
+        pool = get_http_pool().stats()
+        lines.append(
+            "http_pool: "
+            + " ".join(f"{key}={value}" for key, value in pool.items())
+        )
+        limiter = get_rate_limiter().stats()
+        lines.append(
+            "rate_limit: "
+            + " ".join(f"{key}={value}" for key, value in limiter.items())
+        )
+        cache = get_catalog_cache().stats()
+        lines.append(
+            "catalog_cache: "
+            + " ".join(f"{key}={value}" for key, value in cache.items())
+        )
+        http_cache = get_http_cache().stats()
+        lines.append(
+            "http_cache: "
+            + " ".join(f"{key}={value}" for key, value in http_cache.items())
+        )
+        lines.append(
+            f"decoding: json={json_codec.BACKEND} "
+            f"accept_encoding={','.join(json_codec.ENCODINGS)}"
+        )
+        flights = get_single_flight().stats()
+        lines.append(
+            "single_flight: "
+            + " ".join(f"{key}={value}" for key, value in flights.items())
+        )
+        loaders = self.controller.client.loaders
+        lines.append(
+            "batch_loader: "
+            + " ".join(
+                f"{kind}={stats['loaded']}/{stats['batches']}"
+                for kind, stats in ((k, loader.stats()) for k, loader in loaders.items())
+            )
+        )
+        retries = get_retry_policy().stats()
+        lines.append(
+            "retries: "
+            + " ".join(f"{key}={value}" for key, value in retries.items())
+        )
+
+        warmup = self.warmup.stats()
+        lines.append(
+            "warmup: "
+            + " ".join(f"{key}={value}" for key, value in warmup.items())
+        )
 
         lines.append(f"python: {platform.python_version()}")
         lines.append(f"package: {mcp_spotify_player.__version__}")
         return "\n".join(lines)
 
+    def _authorized(self) -> bool:
+        """Return whether user tokens able to refresh themselves are available."""
+        tokens = self.token_manager.get()
+        return tokens is not None and bool(tokens.refresh_token)
+
+    def _auth_pending(self) -> str:
+        """Start the login if needed and report that it is still pending."""
+        url = self.auth_flow.start()
+        return json.dumps(
+            {
+                "success": False,
+                "auth_pending": True,
+                "authorize_url": url,
+                "message": (
+                    "Spotify authorization pending. Log in with the browser window "
+                    "that opened (or visit authorize_url), then retry."
+                ),
+            },
+            ensure_ascii=False,
+        )
+
     def _auth(self) -> str:
-        ensure_user_tokens()
+        if self._authorized():
+            return "Already authorized. Tokens saved."
+        url = self.auth_flow.start()
         messages = [
             "Opening the browser for Spotify login…",
-            "Received authorization code, exchanging for tokens…",
-            "Done. Tokens saved.",
+            f"If it did not open, visit: {url}",
+            "The login completes in the background; retry your command once done.",
         ]
         return "\n".join(messages)
 
-    # -----------------------
-    # Validators
-    # -----------------------
-    def _validate_set_volume(self, arguments: Dict[str, Any]):
-        if arguments.get("volume_percent") is None:
-            raise ValueError("volume_percent is required")
-
-    def _validate_set_repeat(self, arguments: Dict[str, Any]):
-        state = arguments.get("state")
-        if not state:
-            raise ValueError("state is required")
-        if state not in ["track", "context", "off"]:
-            raise ValueError("state must be 'track', 'context', or 'off'")
-
-    def _validate_search_music(self, arguments: Dict[str, Any]):
-        if not arguments.get("query"):
-            raise ValueError("query is required")
-
-    def _validate_search_collections(self, arguments: Dict[str, Any]):
-        if not arguments.get("q"):
-            raise ValueError("q is required")
-        collection_type = arguments.get("type")
-        if collection_type not in ("playlist", "album"):
-            raise ValueError("type must be 'playlist' or 'album'")
-        limit = arguments.get("limit", 20)
-        if not isinstance(limit, int) or limit < 1 or limit > 50:
-            raise ValueError("limit must be between 1 and 50")
-        offset = arguments.get("offset", 0)
-        if not isinstance(offset, int) or offset < 0:
-            raise ValueError("offset must be >= 0")
-        arguments.setdefault("limit", limit)
-        arguments.setdefault("offset", offset)
-
-    def _validate_get_playlist_tracks(self, arguments: Dict[str, Any]):
-        playlist_id = arguments.get("playlist_id")
-        if not playlist_id:
-            raise ValueError("playlist_id is required")
-        if playlist_id.isdigit() and len(playlist_id) < 10:
-            raise ValueError(
-                "The provided identifier appears to be a position number, not a valid Spotify ID. Spotify IDs are long alphanumeric codes."
-            )
-
-        # set default limit if not provided
-        arguments.setdefault("limit", 20)
-
-    def _validate_get_artist(self, arguments: Dict[str, Any]):
-        artist_id = arguments.get("artist_id")
-        if not artist_id:
-            raise ValueError("artist_id is required")
-        if artist_id.isdigit() and len(artist_id) < 10:
-            raise ValueError(
-                "The provided identifier appears to be a position number, not a valid Spotify ID. Spotify IDs are long alphanumeric codes."
-            )
-
-    def _validate_get_artist_albums(self, arguments: Dict[str, Any]):
-        artist_id = arguments.get("artist_id")
-        if not artist_id:
-            raise ValueError("artist_id is required")
-        if artist_id.isdigit() and len(artist_id) < 10:
-            raise ValueError(
-                "The provided identifier appears to be a position number, not a valid Spotify ID. Spotify IDs are long alphanumeric codes."
-            )
-        limit = arguments.get("limit")
-        if limit is not None:
-            if not isinstance(limit, int) or limit < 1 or limit > 50:
-                raise ValueError("limit must be between 1 and 50")
-        else:
-            arguments["limit"] = 20
-
-    def _validate_get_artist_top_tracks(self, arguments: Dict[str, Any]):
-        artist_id = arguments.get("artist_id")
-        if not artist_id:
-            raise ValueError("artist_id is required")
-        if artist_id.isdigit() and len(artist_id) < 10:
-            raise ValueError(
-                "The provided identifier appears to be a position number, not a valid Spotify ID. Spotify IDs are long alphanumeric codes."
-            )
-        limit = arguments.get("limit")
-        if limit is not None:
-            if not isinstance(limit, int) or limit < 1 or limit > 10:
-                raise ValueError("limit must be between 1 and 10")
-        else:
-            arguments["limit"] = 10
-        market = arguments.get("market")
-        if market is not None:
-            if not isinstance(market, str) or len(market) != 2:
-                raise ValueError("market must be a 2-letter country code")
-        else:
-            arguments["market"] = "US"
-
-    def _validate_rename_playlist(self, arguments: Dict[str, Any]):
-        if not arguments.get("playlist_id"):
-            raise ValueError("playlist_id is required")
-
-    def _validate_get_album(self, arguments: Dict[str, Any]):
-        album_id = arguments.get("album_id")
-        if not album_id:
-            raise ValueError("album_id is required")
-        if album_id.isdigit() and len(album_id) < 10:
-            raise ValueError(
-                "The provided identifier appears to be a position number, not a valid Spotify ID. Spotify IDs are long alphanumeric codes."
-            )
-
-    def _validate_get_albums(self, arguments: Dict[str, Any]):
-        album_ids = arguments.get("album_ids")
-        if not album_ids or not isinstance(album_ids, list):
-            raise ValueError("album_ids is required")
-        for album_id in album_ids:
-            if album_id.isdigit() and len(album_id) < 10:
-                raise ValueError(
-                    "The provided identifier appears to be a position number, not a valid Spotify ID. Spotify IDs are long alphanumeric codes."
-                )
-
-
-
-    def _validate_get_album_tracks(self, arguments: Dict[str, Any]):
-        album_id = arguments.get("album_id")
-        if not album_id:
-            raise ValueError("album_id is required")
-        if album_id.isdigit() and len(album_id) < 10:
-            raise ValueError(
-                "The provided identifier appears to be a position number, not a valid Spotify ID. Spotify IDs are long alphanumeric codes.",
-            )
-        arguments.setdefault("limit", 20)
-
-    def _validate_get_saved_albums(self, arguments: Dict[str, Any]):
-        limit = arguments.get("limit")
-        if limit is not None:
-            if not isinstance(limit, int) or limit < 1 or limit > 50:
-                raise ValueError("limit must be between 1 and 50")
-        else:
-            arguments["limit"] = 20
-
-    def _validate_check_saved_albums(self, arguments: Dict[str, Any]):
-        album_ids = arguments.get("album_ids")
-        if not album_ids or not isinstance(album_ids, list):
-            raise ValueError("album_ids is required")
-        for album_id in album_ids:
-            if album_id.isdigit() and len(album_id) < 10:
-                raise ValueError(
-                    "The provided identifier appears to be a position number, not a valid Spotify ID. Spotify IDs are long alphanumeric codes."
-                )
-
-    def _validate_save_albums(self, arguments: Dict[str, Any]):
-        album_ids = arguments.get("album_ids")
-        if not album_ids or not isinstance(album_ids, list):
-            raise ValueError("album_ids is required")
-        for album_id in album_ids:
-            if album_id.isdigit() and len(album_id) < 10:
-                raise ValueError(
-                    "The provided identifier appears to be a position number, not a valid Spotify ID. Spotify IDs are long alphanumeric codes."
-                )
-
-    def _validate_delete_saved_albums(self, arguments: Dict[str, Any]):
-        album_ids = arguments.get("album_ids")
-        if not album_ids or not isinstance(album_ids, list):
-            raise ValueError("album_ids is required")
-        for album_id in album_ids:
-            if album_id.isdigit() and len(album_id) < 10:
-                raise ValueError(
-                    "The provided identifier appears to be a position number, not a valid Spotify ID. Spotify IDs are long alphanumeric codes."
-                )
-
-    def _validate_clear_playlist(self, arguments: Dict[str, Any]):
-        if not arguments.get("playlist_id"):
-            raise ValueError("playlist_id is required")
-
-    def _validate_create_playlist(self, arguments: Dict[str, Any]):
-        if not arguments.get("playlist_name"):
-            raise ValueError("playlist_name is required")
-
-    def _validate_add_tracks_to_playlist(self, arguments: Dict[str, Any]):
-        if not arguments.get("playlist_id") or not arguments.get("track_uris"):
-            raise ValueError("playlist_id and track_uris are required")
-
-    def _validate_queue_add(self, args: dict) -> None:
-        """Validate input for the queue_add tool."""
-        if not args.get("uri"):
-            raise ValueError("'uri' is required")
-        # device_id is optional, no check needed
-
-    def _validate_queue_list(self, arguments: Dict[str, Any]) -> None:
-        # We only accept 'limit' (optional, integer >= 1)
-        allowed = {"limit"}
-        for k in arguments.keys():
-            if k not in allowed:
-                raise ValueError("queue_list only accepts 'limit'")
-        if "limit" in arguments:
-            try:
-                limit = int(arguments["limit"])
-            except Exception:
-                raise ValueError("limit must be an integer")
-            if limit < 1:
-                raise ValueError("limit must be >= 1")
-
     # -----------------------
     # Result formatters
     # -----------------------
@@ -526,9 +485,55 @@ class MCPServer:
     #         return json.dumps(result)
     #     return json.dumps({"success": False, "message": result.get("message", "Unknown error")})
 
+    def handle_request(self, request: Dict[str, Any]):
+        """Dispatch a parsed JSON-RPC request to its handler"""
+        method = request.get("method")
+        request_id = request.get("id")
+        params = request.get("params", {})
+
+        logger.info("Received: %s", method)
+
+        # Handle MCP methods
+        if method == "initialize":
+            self.handle_initialize(request_id, params)
+        elif method == "notifications/initialized":
+            # No action for initialization notifications
+            logger.info("Client initialized successfully")
+        elif method == "tools/list":
+            self.handle_tools_list(request_id)
+        elif method == "tools/call":
+            self.handle_tools_call(request_id, params)
+        elif method in ["resources/list", "prompts/list"]:
+            # Optional methods not implemented
+            logger.info(f"Optional method not implemented: {method}")
+            if request_id is not None:
+                self.send_error(
+                    request_id, -32601, f"Method '{method}' not implemented"
+                )
+        else:
+            logger.warning(f"Unsupported method: {method}")
+            if request_id is not None:
+                self.send_error(request_id, -32601, f"Method '{method}' not supported")
+
+    def _parse_line(self, line: str) -> Optional[Dict[str, Any]]:
+        """Parse one stdin line, returning ``None`` if it is not valid JSON"""
+        try:
+            return json.loads(line.strip())
+        except json.JSONDecodeError as e:
+            logger.error(f"Error parsing JSON: {e}")
+            return None
+
+    def _handle_safely(self, request: Dict[str, Any]):
+        """Handle a request, logging instead of propagating failures"""
+        try:
+            self.handle_request(request)
+        except Exception as e:
+            logger.error(f"Error processing request: {e}")
+
     def run(self):
         """Run the MCP server"""
         logger.info("Starting MCP Spotify Player server...")
+        self.token_manager.start()
 
         try:
             while True:
@@ -536,51 +541,76 @@ class MCPServer:
                 line = sys.stdin.readline()
                 if not line:
                     break
-
-                try:
-                    # Parse JSON-RPC
-                    request = json.loads(line.strip())
-                    method = request.get("method")
-                    request_id = request.get("id")
-                    params = request.get("params", {})
-
-                    logger.info(f"Received: {method}")
-
-                    # Handle MCP methods
-                    if method == "initialize":
-                        self.handle_initialize(request_id, params)
-                    elif method == "notifications/initialized":
-                        # No action for initialization notifications
-                        logger.info("Client initialized successfully")
-                    elif method == "tools/list":
-                        self.handle_tools_list(request_id)
-                    elif method == "tools/call":
-                        self.handle_tools_call(request_id, params)
-                    elif method in ["resources/list", "prompts/list"]:
-                        # Optional methods not implemented
-                        logger.info(f"Optional method not implemented: {method}")
-                        if request_id is not None:
-                            self.send_error(
-                                request_id, -32601, f"Method '{method}' not implemented"
-                            )
-                    else:
-                        logger.warning(f"Unsupported method: {method}")
-                        if request_id is not None:
-                            self.send_error(request_id, -32601, f"Method '{method}' not supported")
-
-                except json.JSONDecodeError as e:
-                    logger.error(f"Error parsing JSON: {e}")
-                    continue
-                except Exception as e:
-                    logger.error(f"Error processing request: {e}")
-                    continue
+                request = self._parse_line(line)
+                if request is not None:
+                    self._handle_safely(request)
 
         except KeyboardInterrupt:
             logger.info("Server stopped by the user")
         except Exception as e:
             logger.error(f"Server error: {e}")
+        finally:
+            self.token_manager.stop()
+            self.auth_flow.cancel()
+            close_http_pool()
+            close_catalog_cache()
+
+    async def run_async(self, max_concurrency: Optional[int] = None):
+        """Run the MCP server on an asyncio event loop.
+
+        Requests are read continuously from stdin. ``tools/call`` requests run
+        on a worker pool of ``max_concurrency`` threads and their responses are
+        written as soon as each one finishes, so a slow tool no longer delays
+        the ones sent after it. Clients match responses through their ``id``.
+        """
+        import asyncio
+
+        limit = max_concurrency or self.config.MCP_MAX_CONCURRENCY
+        logger.info(
+            "Starting MCP Spotify Player server (async, max concurrency %s)...", limit
+        )
+        loop = asyncio.get_running_loop()
+        lines: asyncio.Queue = asyncio.Queue()
+        self.token_manager.start()
+
+        def read_stdin():
+            while True:
+                line = sys.stdin.readline()
+                loop.call_soon_threadsafe(lines.put_nowait, line)
+                if not line:
+                    break
 
+        # Daemon thread so a blocked readline never prevents interpreter exit
+        threading.Thread(target=read_stdin, name="mcp-stdin", daemon=True).start()
+        executor = ThreadPoolExecutor(max_workers=limit, thread_name_prefix="mcp-tool")
+        pending: set[asyncio.Future] = set()
 
+        try:
+            while True:
+                line = await lines.get()
+                if not line:
+                    break
+                request = self._parse_line(line)
+                if request is None:
+                    continue
+                if isinstance(request, dict) and request.get("method") == "tools/call":
+                    task = loop.run_in_executor(executor, self._handle_safely, request)
+                    pending.add(task)
+                    task.add_done_callback(pending.discard)
+                else:
+                    self._handle_safely(request)
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+        except asyncio.CancelledError:
+            logger.info("Server stopped by the user")
+        except Exception as e:
+            logger.error(f"Server error: {e}")
+        finally:
+            executor.shutdown(wait=False)
+            self.token_manager.stop()
+            self.auth_flow.cancel()
+            close_http_pool()
+            close_catalog_cache()
 
 
 if __name__ == "__main__":
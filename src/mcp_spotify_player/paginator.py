@@ -0,0 +1,161 @@
+"""Lazy iteration over paged Web API list endpoints.
+
+List endpoints answer with one page of ``items`` (at most 50 or 100) plus the
+``total`` number of items and a ``next`` URL. :func:`paginate` yields items
+one at a time and only requests the first page when iteration starts. Once
+that page has revealed ``total``, the remaining offsets are requested
+concurrently, a few pages ahead of the consumer, and still yielded in order.
+Stopping early cancels the pages that have not been sent yet.
+"""
+
+from __future__ import annotations
+
+import contextvars
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Deque, Dict, Iterator, Union
+
+from mcp_logging import get_logger, payload
+
+from mcp_spotify_player.config import Config
+
+logger = get_logger(__name__)
+
+ALL = "all"
+
+# A tool ``limit``: a number of items, or ``"all"``
+Limit = Union[int, str]
+
+# Fetches the page starting at ``offset`` holding at most ``limit`` items
+FetchPage = Callable[[int, int], Union[Dict[str, Any], None]]
+
+
+def resolve_limit(limit: Limit | None) -> int | None:
+    """Return ``limit`` as a number of items, ``None`` meaning all of them."""
+    if limit is None or limit == ALL:
+        return None
+    return int(limit)
+
+
+def single_page(limit: Limit | None, page_size: int) -> bool:
+    """Return whether ``limit`` items fit in one request."""
+    wanted = resolve_limit(limit)
+    return wanted is not None and wanted <= page_size
+
+
+def is_page(page: Any) -> bool:
+    """Return whether ``page`` is a paging object rather than an error."""
+    return isinstance(page, dict) and isinstance(page.get("items"), list)
+
+
+def iter_pages(
+    fetch_page: FetchPage,
+    page_size: int,
+    limit: Limit | None = None,
+    prefetch: int | None = None,
+) -> Iterator[Dict[str, Any] | None]:
+    """Yield the pages covering the first ``limit`` items, in order.
+
+    The first page is always yielded, even when it is an error; iteration
+    stops after any page that is not a paging object. When a page carries no
+    ``total`` the ``next`` links are followed one request at a time.
+    """
+    wanted = resolve_limit(limit)
+
+    def size_at(offset: int, end: int | None) -> int:
+        return page_size if end is None else max(min(page_size, end - offset), 0)
+
+    first = fetch_page(0, size_at(0, wanted))
+    yield first
+    if not is_page(first):
+        return
+
+    total = first.get("total")
+    if not isinstance(total, int):
+        page, offset = first, len(first["items"])
+        while page.get("next") and page["items"] and (wanted is None or offset < wanted):
+            page = fetch_page(offset, size_at(offset, wanted))
+            yield page
+            if not is_page(page):
+                return
+            offset += len(page["items"])
+        return
+
+    end = total if wanted is None else min(total, wanted)
+    offsets = iter(range(page_size, end, page_size))
+    workers = prefetch or Config.FANOUT_WORKERS
+    pending: Deque[Future] = deque()
+    executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="mcp-pages")
+
+    def submit() -> None:
+        offset = next(offsets, None)
+        if offset is not None:
+            pending.append(
+                executor.submit(
+                    contextvars.copy_context().run, fetch_page, offset, size_at(offset, end)
+                )
+            )
+
+    try:
+        for _ in range(workers):
+            submit()
+        while pending:
+            page = pending.popleft().result()
+            submit()
+            yield page
+            if not is_page(page):
+                return
+    finally:
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=False)
+
+
+def paginate(
+    fetch_page: FetchPage,
+    page_size: int,
+    limit: Limit | None = None,
+    prefetch: int | None = None,
+) -> Iterator[Any]:
+    """Yield up to ``limit`` items lazily, across as many pages as needed."""
+    wanted = resolve_limit(limit)
+    count = 0
+    for page in iter_pages(fetch_page, page_size, limit, prefetch):
+        if not is_page(page):
+            logger.warning("Stopping pagination on a failed page: %s", payload(page))
+            return
+        for item in page["items"]:
+            if wanted is not None and count >= wanted:
+                return
+            count += 1
+            yield item
+
+
+def collect(
+    fetch_page: FetchPage,
+    page_size: int,
+    limit: Limit | None = None,
+    prefetch: int | None = None,
+) -> Dict[str, Any] | None:
+    """Return one paging object holding the first ``limit`` items.
+
+    The first page is returned unchanged when it is an error. A later page
+    failing ends the listing early with the items gathered so far.
+    """
+    pages = iter_pages(fetch_page, page_size, limit, prefetch)
+    first = next(pages)
+    if not is_page(first):
+        pages.close()
+        return first
+    items = list(first["items"])
+    for page in pages:
+        if not is_page(page):
+            logger.warning("Stopping pagination on a failed page: %s", payload(page))
+            break
+        items.extend(page["items"])
+    wanted = resolve_limit(limit)
+    if wanted is not None:
+        items = items[:wanted]
+    merged = dict(first)
+    merged.update(items=items, offset=0, limit=len(items), next=None)
+    return merged
@@ -44,13 +44,12 @@ class PlaybackController:
                 result = self.playback_client.play(context_uri=artist_uri)
                 return handle_play_result(result, "Playing artist")
             elif playlist_name:
-                playlists = self.playlists_client.get_user_playlists()
-                if playlists and 'items' in playlists:
-                    for playlist in playlists['items']:
-                        if playlist['name'].lower() == playlist_name.lower():
-                            result = self.playback_client.play(context_uri=playlist['uri'])
-                            return handle_play_result(result, f"Playing playlist: {playlist['name']}")
-                    return {"success": False, "message": f"Playlist '{playlist_name}' not found"}
+                # Pages are fetched lazily, so the scan stops at the first match
+                for playlist in self.playlists_client.iter_user_playlists():
+                    if playlist['name'].lower() == playlist_name.lower():
+                        result = self.playback_client.play(context_uri=playlist['uri'])
+                        return handle_play_result(result, f"Playing playlist: {playlist['name']}")
+                return {"success": False, "message": f"Playlist '{playlist_name}' not found"}
             elif query:
                 search_result = self.playback_client.search_tracks(query, limit=1)
                 if search_result and 'tracks' in search_result and search_result['tracks']['items']:
@@ -278,8 +277,8 @@ class PlaybackController:
                 }
                 if type == "album":
                     entry["artists"] = [a.get("name") for a in item.get("artists", [])]
-                logger.info("playback controller [search_collections] --> entry with artists: %s", entry)
                 items.append(entry)
+            logger.debug("search_collections returned %d %s items", len(items), type)
 
             return {
                 "type": type,
@@ -1,8 +1,9 @@
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 from mcp_logging import get_logger
 
 from mcp_spotify_player.mcp_models import PlaylistInfo, TrackInfo
+from mcp_spotify_player.paginator import Limit
 from mcp_spotify_player.spotify_client import SpotifyClient
 
 logger = get_logger(__name__)
@@ -15,10 +16,10 @@ class PlaylistController:
         self.client = client
         self.playlists_client = client.playlists
 
-    def get_playlists(self) -> Dict[str, Any]:
+    def get_playlists(self, limit: Limit = 20) -> Dict[str, Any]:
         """Gets the user's playlists"""
         try:
-            playlists = self.playlists_client.get_user_playlists()
+            playlists = self.playlists_client.get_user_playlists(limit)
             if playlists and 'items' in playlists:
                 playlist_list = []
                 for playlist in playlists['items']:
@@ -62,7 +63,7 @@ class PlaylistController:
         except Exception as e:
             return {"success": False, "message": f"Error: {str(e)}"}
 
-    def get_playlist_tracks(self, playlist_id: str, limit: int = 20) -> Dict[str, Any]:
+    def get_playlist_tracks(self, playlist_id: str, limit: Limit = 20) -> Dict[str, Any]:
         """Gets songs from a playlist"""
         try:
             if not self._validate_spotify_id(playlist_id):
@@ -70,18 +71,9 @@ class PlaylistController:
 
             tracks = self.playlists_client.get_playlist_tracks(playlist_id, limit)
             if tracks and 'items' in tracks:
-                track_list = []
-                for item in tracks['items']:
-                    track = item['track']
-                    track_info = TrackInfo(
-                        name=track['name'],
-                        artist=track['artists'][0]['name'],
-                        album=track['album']['name'],
-                        uri=track['uri'],
-                        duration_ms=track['duration_ms'],
-                        external_url=track['external_urls']['spotify'],
-                    )
-                    track_list.append(track_info.dict())
+                track_list = [
+                    TrackInfo.from_spotify(item['track']).dict() for item in tracks['items']
+                ]
 
                 return {
                     "success": True,
@@ -118,8 +110,10 @@ class PlaylistController:
         except Exception as e:
             return {"success": False, "message": f"Error: {str(e)}"}
 
-    def add_tracks_to_playlist(self, playlist_id: str, track_uris: List[str]) -> Dict[str, Any]:
-        """Add tracks to a playlist"""
+    def add_tracks_to_playlist(
+        self, playlist_id: str, track_uris: List[str], position: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """Add tracks to a playlist, optionally inserting them at ``position``"""
         try:
             if not self._validate_spotify_id(playlist_id):
                 return {'success': False, 'message': 'Invalid playlist ID. It must be a valid Spotify ID.'}
@@ -127,10 +121,32 @@ class PlaylistController:
                 isinstance(uri, str) and uri.startswith('spotify:track:') for uri in track_uris
             ):
                 return {'success': False, 'message': 'Invalid track URIs. Must be valid Spotify track URIs.'}
-            result = self.playlists_client.add_tracks_to_playlist(playlist_id, track_uris)
-            if result:
-                return {'success': True, 'message': 'Tracks added successfully'}
-            return {'success': False, 'message': 'Could not add tracks to playlist'}
+            total = len(track_uris)
+
+            def report(added: int, _total: int, _snapshot_id: Optional[str]) -> None:
+                logger.info("Added %d/%d tracks to playlist %s", added, total, playlist_id)
+
+            result = self.playlists_client.add_tracks_to_playlist(
+                playlist_id, track_uris, position, progress=report
+            )
+            if result and 'error' not in result:
+                return {
+                    'success': True,
+                    'message': f"Added {result['added']} tracks successfully",
+                    'snapshot_id': result.get('snapshot_id'),
+                }
+            added = result.get('added', 0) if result else 0
+            error = result.get('error') if result else None
+            detail = error.get('message') if isinstance(error, dict) else error
+            message = f'Could not add tracks to playlist (added {added} of {total})'
+            if detail:
+                message += f': {detail}'
+            return {
+                'success': False,
+                'message': message,
+                'added': added,
+                'snapshot_id': result.get('snapshot_id') if result else None,
+            }
         except Exception as e:
             return {'success': False, 'message': f'Error: {str(e)}'}
 
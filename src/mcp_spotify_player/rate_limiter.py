@@ -0,0 +1,192 @@
+"""Client-side scheduling of Web API requests around Spotify's rate limit.
+
+Requests draw from a token bucket whose refill rate adapts to the responses
+(additive increase while calls succeed, multiplicative decrease on HTTP 429).
+A 429 also pauses the endpoint group that received it for the duration given
+by ``Retry-After``; requests to other groups keep flowing.
+"""
+
+from __future__ import annotations
+
+import email.utils
+import threading
+import time
+from typing import Dict
+
+from mcp_logging import get_logger
+from mcp_spotify_player.config import Config
+
+logger = get_logger(__name__)
+
+# Used when a 429 carries no usable Retry-After header
+DEFAULT_RETRY_AFTER = 1.0
+
+
+def parse_retry_after(value: str | None, now: float | None = None) -> float:
+    """Return the delay in seconds described by a ``Retry-After`` header.
+
+    Both forms allowed by RFC 9110 are accepted: a number of seconds and an
+    HTTP date. Missing or malformed values fall back to one second.
+    """
+    if not value:
+        return DEFAULT_RETRY_AFTER
+    value = value.strip()
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return DEFAULT_RETRY_AFTER
+    if when is None:
+        return DEFAULT_RETRY_AFTER
+    now = time.time() if now is None else now
+    return max(when.timestamp() - now, 0.0)
+
+
+def endpoint_group(endpoint: str) -> str:
+    """Return the group an endpoint is throttled with.
+
+    ``/me/player/play`` and ``/me/player/next`` share ``/me/player``;
+    ``/playlists/{id}/tracks`` belongs to ``/playlists``.
+    """
+    path = endpoint.split("?", 1)[0]
+    parts = [part for part in path.split("/") if part]
+    if not parts:
+        return "/"
+    if parts[0] == "me" and len(parts) > 1:
+        return f"/me/{parts[1]}"
+    return f"/{parts[0]}"
+
+
+class RateLimiter:
+    """Adaptive token bucket with per-endpoint-group backoff.
+
+    ``rate`` starts at ``max_rate`` requests per second. Each successful
+    response adds ``increase`` to it and each 429 halves it, never going
+    below ``min_rate``.
+    """
+
+    def __init__(
+        self,
+        max_rate: float | None = None,
+        burst: int | None = None,
+        min_rate: float = 0.5,
+        increase: float = 0.5,
+    ):
+        self.max_rate = max_rate or Config.RATE_LIMIT_RPS
+        self.burst = burst or Config.RATE_LIMIT_BURST
+        self.min_rate = min(min_rate, self.max_rate)
+        self.increase = increase
+        self.rate = self.max_rate
+        self.throttled = 0
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._blocked_until: Dict[str, float] = {}
+        self._cond = threading.Condition()
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated
+        if elapsed > 0:
+            self._tokens = min(self.burst, self._tokens + elapsed * self.rate)
+            self._updated = now
+
+    def _wait_time(self, group: str, now: float) -> float:
+        blocked = self._blocked_until.get(group, 0.0) - now
+        if blocked > 0:
+            return blocked
+        if self._tokens >= 1:
+            return 0.0
+        return (1 - self._tokens) / self.rate
+
+    def acquire(self, group: str, deadline: float) -> bool:
+        """Wait for a slot to send a request to ``group``.
+
+        Returns ``False`` without waiting if the slot would only become
+        available after ``deadline`` (a ``time.monotonic()`` value).
+        """
+        with self._cond:
+            while True:
+                now = time.monotonic()
+                self._refill(now)
+                wait = self._wait_time(group, now)
+                if wait <= 0:
+                    self._tokens -= 1
+                    return True
+                if now + wait > deadline:
+                    return False
+                self._cond.wait(wait)
+
+    def reserve(self, group: str) -> float:
+        """Take a slot for ``group`` if one is free, without waiting.
+
+        Returns ``0`` once the slot is taken, otherwise the seconds to wait
+        before asking again; used by callers that must not block a thread.
+        """
+        with self._cond:
+            now = time.monotonic()
+            self._refill(now)
+            wait = self._wait_time(group, now)
+            if wait <= 0:
+                self._tokens -= 1
+                return 0.0
+            return wait
+
+    def retry_in(self, group: str) -> float:
+        """Seconds until ``group`` may be called again."""
+        with self._cond:
+            return max(self._blocked_until.get(group, 0.0) - time.monotonic(), 0.0)
+
+    def record(self, group: str, status_code: int, retry_after: str | None = None) -> float:
+        """Feed a response back into the limiter.
+
+        Returns the backoff in seconds applied to ``group`` (``0`` unless the
+        response was a 429).
+        """
+        with self._cond:
+            if status_code != 429:
+                if status_code < 500:
+                    self.rate = min(self.max_rate, self.rate + self.increase)
+                return 0.0
+            delay = parse_retry_after(retry_after)
+            self.throttled += 1
+            self.rate = max(self.min_rate, self.rate / 2)
+            until = time.monotonic() + delay
+            self._blocked_until[group] = max(self._blocked_until.get(group, 0.0), until)
+            self._cond.notify_all()
+        logger.warning(
+            "Rate limited on %s; backing off %.1fs (rate now %.2f/s)",
+            group,
+            delay,
+            self.rate,
+        )
+        return delay
+
+    def stats(self) -> Dict[str, float]:
+        """Return the bucket level, current rate and longest active backoff."""
+        with self._cond:
+            now = time.monotonic()
+            self._refill(now)
+            backoff = max(
+                (until - now for until in self._blocked_until.values()), default=0.0
+            )
+            return {
+                "tokens": round(self._tokens, 1),
+                "rate": round(self.rate, 2),
+                "backoff": round(max(backoff, 0.0), 1),
+                "throttled": self.throttled,
+            }
+
+
+_LIMITER: RateLimiter | None = None
+_LIMITER_LOCK = threading.Lock()
+
+
+def get_rate_limiter() -> RateLimiter:
+    """Return the process-wide :class:`RateLimiter`, creating it on first use."""
+    global _LIMITER
+    with _LIMITER_LOCK:
+        if _LIMITER is None:
+            _LIMITER = RateLimiter()
+        return _LIMITER
@@ -0,0 +1,131 @@
+"""Retrying of transient Web API failures.
+
+Connection errors, timeouts and 5xx responses are retried with full-jitter
+exponential backoff, but only for idempotent methods: replaying a POST such
+as adding tracks to a playlist could apply it twice.
+"""
+
+from __future__ import annotations
+
+import random
+import threading
+import time
+from functools import cache
+from typing import TYPE_CHECKING, Callable, Dict, Tuple, Type
+
+from mcp_logging import get_logger
+from mcp_spotify_player.config import Config
+from mcp_spotify_player.timeouts import bound
+
+if TYPE_CHECKING:
+    import requests
+
+logger = get_logger(__name__)
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+RETRY_STATUSES = frozenset({500, 502, 503, 504})
+
+
+@cache
+def retry_exceptions() -> Tuple[Type[BaseException], ...]:
+    """Exceptions worth retrying; ``requests`` is imported on first use."""
+    import requests
+
+    return (requests.ConnectionError, requests.Timeout)
+
+
+class RetryPolicy:
+    """Per-request retry policy with a total time budget.
+
+    Attempt ``n`` (starting at 1) waits a random time between 0 and
+    ``min(max_delay, base_delay * 2 ** (n - 1))`` before the next one. No
+    retry is started once ``budget`` seconds have passed since the first
+    attempt, nor after the active tool deadline.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int | None = None,
+        base_delay: float | None = None,
+        max_delay: float = 2.0,
+        budget: float | None = None,
+    ):
+        self.max_attempts = max_attempts or Config.RETRY_MAX_ATTEMPTS
+        self.base_delay = Config.RETRY_BASE_DELAY if base_delay is None else base_delay
+        self.max_delay = max_delay
+        self.budget = Config.RETRY_BUDGET if budget is None else budget
+        self._lock = threading.Lock()
+        self.attempts = 0
+        self.retries = 0
+        self.exhausted = 0
+
+    def _count(self, field: str) -> None:
+        with self._lock:
+            setattr(self, field, getattr(self, field) + 1)
+
+    def backoff(self, attempt: int) -> float:
+        """Return the jittered delay to wait after failed ``attempt``."""
+        cap = min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+        return random.uniform(0, cap)
+
+    def call(self, method: str, send: Callable[[], requests.Response]) -> requests.Response:
+        """Run ``send`` until it succeeds, is not retryable, or time runs out.
+
+        The last response is returned, or the last exception re-raised, when
+        no further attempt is allowed.
+        """
+        retryable = method.upper() in IDEMPOTENT_METHODS
+        retry_on = retry_exceptions()
+        deadline = bound(time.monotonic() + self.budget)
+        attempt = 0
+        while True:
+            attempt += 1
+            self._count("attempts")
+            try:
+                response = send()
+                error = None
+            except retry_on as exc:
+                response, error = None, exc
+            if error is None and response.status_code not in RETRY_STATUSES:
+                return response
+            if not retryable:
+                if error is not None:
+                    raise error
+                return response
+            delay = self.backoff(attempt)
+            if attempt >= self.max_attempts or time.monotonic() + delay > deadline:
+                self._count("exhausted")
+                if error is not None:
+                    raise error
+                return response
+            self._count("retries")
+            logger.debug(
+                "Retrying %s after %s (attempt %d, waiting %.2fs)",
+                method,
+                error or response.status_code,
+                attempt,
+                delay,
+            )
+            time.sleep(delay)
+
+    def stats(self) -> Dict[str, int]:
+        """Return attempt, retry and exhausted-budget counters."""
+        with self._lock:
+            return {
+                "attempts": self.attempts,
+                "retries": self.retries,
+                "exhausted": self.exhausted,
+            }
+
+
+_POLICY: RetryPolicy | None = None
+_POLICY_LOCK = threading.Lock()
+
+
+def get_retry_policy() -> RetryPolicy:
+    """Return the process-wide :class:`RetryPolicy`, creating it on first use."""
+    global _POLICY
+    with _POLICY_LOCK:
+        if _POLICY is None:
+            _POLICY = RetryPolicy()
+        return _POLICY
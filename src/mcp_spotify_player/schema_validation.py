@@ -0,0 +1,246 @@
+"""Tool argument validators compiled from the manifest's ``inputSchema``.
+
+Each tool's schema is turned once, at server start, into a closure that
+checks the arguments of a call against it: unknown keys (when the schema sets
+``additionalProperties: false``), missing required arguments, types,
+``enum``, numeric and length bounds, ``oneOf`` and the ``spotify-id`` format.
+Absent optional arguments receive their ``default``, and integer arguments
+given as decimal strings (``"5"``) are converted, as the hand-written
+validators used to accept them.
+Every check is decided while compiling, so a call only runs the handful of
+comparisons its own arguments need instead of walking the schema again.
+
+Only the subset of JSON Schema used by :data:`~mcp_spotify_player.mcp_manifest.MANIFEST`
+is supported. Failures raise ``ValueError`` with a message meant for the
+user, e.g. ``"limit must be an integer between 1 and 50"``.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Any, Callable, Dict, List, Tuple
+
+Validator = Callable[[Dict[str, Any]], None]
+
+# Checks one value and returns whether it conforms
+_Check = Callable[[Any], bool]
+
+SPOTIFY_ID_FORMAT = "spotify-id"
+POSITION_NUMBER_MESSAGE = (
+    "The provided identifier appears to be a position number, not a valid "
+    "Spotify ID. Spotify IDs are long alphanumeric codes."
+)
+
+_MISSING = object()
+
+_INTEGER_STRING = re.compile(r"-?\d+")
+
+
+def looks_like_position(value: str) -> bool:
+    """Return whether ``value`` is a short number such as a list position.
+
+    Spotify IDs are 22-character base-62 strings; users often pass the
+    position of an item from a previous listing instead.
+    """
+    return value.isdigit() and len(value) < 10
+
+
+def _is_int(value: Any) -> bool:
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+_TYPE_CHECKS: Dict[str, _Check] = {
+    "string": lambda value: isinstance(value, str),
+    "integer": _is_int,
+    "number": _is_number,
+    "boolean": lambda value: isinstance(value, bool),
+    "array": lambda value: isinstance(value, list),
+    "object": lambda value: isinstance(value, dict),
+}
+
+
+def _alternatives(values: List[Any]) -> str:
+    quoted = [repr(value) for value in values]
+    if len(quoted) <= 2:
+        return " or ".join(quoted)
+    return ", ".join(quoted[:-1]) + ", or " + quoted[-1]
+
+
+_PLURALS = {
+    "string": "strings",
+    "integer": "integers",
+    "number": "numbers",
+    "boolean": "booleans",
+    "object": "objects",
+}
+
+
+def _describe_number(schema: Dict[str, Any]) -> str:
+    kind = "integer" if schema.get("type") == "integer" else "number"
+    noun = f"an {kind}" if kind == "integer" else f"a {kind}"
+    low, high = schema.get("minimum"), schema.get("maximum")
+    if low is not None and high is not None:
+        return f"{noun} between {low} and {high}"
+    if low == 0:
+        return f"a non-negative {kind}"
+    if low == 1 and kind == "integer":
+        return "a positive integer"
+    if low is not None:
+        return f"{noun} >= {low}"
+    if high is not None:
+        return f"{noun} <= {high}"
+    return noun
+
+
+def _describe_string(schema: Dict[str, Any]) -> str:
+    low, high = schema.get("minLength"), schema.get("maxLength")
+    if low is not None and low == high:
+        return f"a {low}-character string"
+    if low is not None:
+        return f"a string of at least {low} characters"
+    if high is not None:
+        return f"a string of at most {high} characters"
+    return "a string"
+
+
+def describe(schema: Dict[str, Any]) -> str:
+    """Return what ``schema`` accepts, as in ``"limit must be <description>"``."""
+    if "oneOf" in schema:
+        return " or ".join(describe(branch) for branch in schema["oneOf"])
+    if "enum" in schema:
+        return _alternatives(schema["enum"])
+    kind = schema.get("type")
+    if kind in ("integer", "number"):
+        return _describe_number(schema)
+    if kind == "string":
+        return _describe_string(schema)
+    if kind == "array":
+        items = _PLURALS.get(schema.get("items", {}).get("type"))
+        return f"a list of {items}" if items else "a list"
+    if kind == "boolean":
+        return "a boolean"
+    if kind == "object":
+        return "an object"
+    return "a valid value"
+
+
+def _compile_check(schema: Dict[str, Any]) -> _Check:
+    """Return a predicate for the type, enum and bounds of ``schema``."""
+    if "oneOf" in schema:
+        branches = [_compile_check(branch) for branch in schema["oneOf"]]
+        return lambda value: sum(1 for check in branches if check(value)) == 1
+
+    checks: List[_Check] = []
+    kind = schema.get("type")
+    if kind is not None:
+        checks.append(_TYPE_CHECKS[kind])
+    if "enum" in schema:
+        allowed = list(schema["enum"])
+        checks.append(lambda value: value in allowed)
+    low, high = schema.get("minimum"), schema.get("maximum")
+    if low is not None:
+        checks.append(lambda value: value >= low)
+    if high is not None:
+        checks.append(lambda value: value <= high)
+    min_length, max_length = schema.get("minLength"), schema.get("maxLength")
+    if min_length is not None:
+        checks.append(lambda value: len(value) >= min_length)
+    if max_length is not None:
+        checks.append(lambda value: len(value) <= max_length)
+
+    if len(checks) == 1:
+        return checks[0]
+    return lambda value: all(check(value) for check in checks)
+
+
+def _compile_property(name: str, schema: Dict[str, Any]) -> Callable[[Any], Any]:
+    """Return a function raising ``ValueError`` when a value breaks ``schema``.
+
+    The function returns the value to use, which differs from its argument
+    only for an integer passed as a decimal string.
+    """
+    check = _compile_check(schema)
+    integer = schema.get("type") == "integer"
+    message = f"{name} must be {describe(schema)}"
+    item_schema = schema.get("items") or {}
+    item_check = _compile_check(item_schema) if item_schema else None
+    spotify_id = schema.get("format") == SPOTIFY_ID_FORMAT
+    item_spotify_id = item_schema.get("format") == SPOTIFY_ID_FORMAT
+
+    def validate(value: Any) -> Any:
+        if integer and isinstance(value, str) and _INTEGER_STRING.fullmatch(value):
+            value = int(value)
+        if not check(value):
+            raise ValueError(message)
+        if spotify_id and looks_like_position(value):
+            raise ValueError(POSITION_NUMBER_MESSAGE)
+        if item_check is not None:
+            for item in value:
+                if not item_check(item):
+                    raise ValueError(message)
+                if item_spotify_id and looks_like_position(item):
+                    raise ValueError(POSITION_NUMBER_MESSAGE)
+        return value
+
+    return validate
+
+
+def _empty(value: Any) -> bool:
+    return value is None or value == "" or value == []
+
+
+def compile_schema(tool_name: str, schema: Dict[str, Any]) -> Validator:
+    """Compile one tool's ``inputSchema`` into a validator.
+
+    The validator checks ``arguments`` in place, converts integer strings
+    and fills in defaults. As in JSON Schema, keys missing from
+    ``properties`` are accepted unless the schema sets
+    ``additionalProperties`` to ``false``. Arguments set to ``None`` count as
+    absent; required arguments must also not be empty strings or empty lists.
+    """
+    properties: Dict[str, Dict[str, Any]] = schema.get("properties", {})
+    required = tuple(schema.get("required", ()))
+    validators = {name: _compile_property(name, prop) for name, prop in properties.items()}
+    defaults: Tuple[Tuple[str, Any], ...] = tuple(
+        (name, prop["default"]) for name, prop in properties.items() if "default" in prop
+    )
+    allowed = frozenset(properties)
+    if schema.get("additionalProperties", True) is not False:
+        unknown_message = None
+    elif allowed:
+        unknown_message = f"{tool_name} only accepts " + ", ".join(
+            repr(name) for name in properties
+        )
+    else:
+        unknown_message = f"{tool_name} takes no arguments"
+
+    def validate(arguments: Dict[str, Any]) -> None:
+        if unknown_message is not None and not allowed.issuperset(arguments):
+            raise ValueError(unknown_message)
+        for name in required:
+            if _empty(arguments.get(name)):
+                raise ValueError(f"{name} is required")
+        for name, value in arguments.items():
+            validator = validators.get(name)
+            if validator is not None and value is not None:
+                checked = validator(value)
+                if checked is not value:
+                    arguments[name] = checked
+        for name, default in defaults:
+            if arguments.get(name, _MISSING) in (_MISSING, None):
+                arguments[name] = default
+
+    validate.__name__ = f"validate_{tool_name}"
+    return validate
+
+
+def compile_validators(manifest: Dict[str, Any]) -> Dict[str, Validator]:
+    """Return a validator for every tool of ``manifest``, keyed by tool name."""
+    return {
+        tool["name"]: compile_schema(tool["name"], tool.get("inputSchema", {}))
+        for tool in manifest.get("tools", [])
+    }
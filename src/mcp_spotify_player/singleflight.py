@@ -0,0 +1,81 @@
+"""Coalescing of identical in-flight requests.
+
+When several threads ask for the same thing at the same time only the first
+one (the leader) does the work; the others wait for it and receive the same
+result, or the same exception.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Any, Callable, Dict, Hashable
+
+
+class _Call:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight:
+    """Run at most one call per key at a time."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self.leaders = 0
+        self.coalesced = 0
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """Return ``fn()``, sharing the result with concurrent callers of ``key``."""
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                self.coalesced += 1
+                leader = False
+            else:
+                call = self._calls[key] = _Call()
+                self.leaders += 1
+                leader = True
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except BaseException as exc:
+            call.error = exc
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+    def stats(self) -> Dict[str, int]:
+        """Return how many calls ran and how many were coalesced into them."""
+        with self._lock:
+            return {
+                "in_flight": len(self._calls),
+                "leaders": self.leaders,
+                "coalesced": self.coalesced,
+            }
+
+
+_FLIGHT: SingleFlight | None = None
+_FLIGHT_LOCK = threading.Lock()
+
+
+def get_single_flight() -> SingleFlight:
+    """Return the process-wide :class:`SingleFlight`, creating it on first use."""
+    global _FLIGHT
+    with _FLIGHT_LOCK:
+        if _FLIGHT is None:
+            _FLIGHT = SingleFlight()
+        return _FLIGHT
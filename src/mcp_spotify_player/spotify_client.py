@@ -1,29 +1,104 @@
-from typing import Callable, Optional
-
-import requests
+import json
+import time
+from typing import Any, Callable, Dict, Optional, Sequence
 
+from mcp_spotify.auth.manager import TokenManager
 from mcp_spotify.auth.tokens import (
     REQUIRED_SCOPES,
     Tokens,
     check_scopes,
     has_refresh_token,
     needs_refresh,
-    refresh_tokens,
 )
 from mcp_spotify.errors import (
+    DeadlineExceededError,
     NoActiveDeviceError,
     NotAuthenticatedError,
     PremiumRequiredError,
+    RateLimitedError,
 )
 from mcp_spotify_player.client_playback import SpotifyPlaybackClient
 from mcp_spotify_player.client_playlists import SpotifyPlaylistsClient
 from mcp_spotify_player.client_albums import SpotifyAlbumsClient
 from mcp_spotify_player.client_artists import SpotifyArtistsClient
+from mcp_spotify_player.batch_loader import BatchLoader
+from mcp_spotify_player.catalog_cache import (
+    MISS,
+    CatalogCache,
+    get_catalog_cache,
+    is_cacheable,
+)
 from mcp_spotify_player.config import Config
+from mcp_spotify_player.http_cache import MISS as HTTP_MISS
+from mcp_spotify_player.http_cache import HttpCache, get_http_cache, is_cacheable_url
+from mcp_spotify_player.http_pool import HttpPool, get_http_pool
+from mcp_spotify_player import json_codec
+from mcp_spotify_player.rate_limiter import (
+    RateLimiter,
+    endpoint_group,
+    get_rate_limiter,
+)
+from mcp_spotify_player.retry import RetryPolicy, get_retry_policy
+from mcp_spotify_player.singleflight import SingleFlight, get_single_flight
+from mcp_spotify_player.timeouts import bound, deadline_exceeded
 
 
 TokensProvider = Callable[[], Optional[Tokens]]
 
+# Largest number of IDs accepted by each multi-get endpoint
+MULTI_GET_LIMITS = {"album": 20, "artist": 50, "track": 50}
+
+
+def handle_response(
+    response, method: str, endpoint: str, tokens: Tokens, *, feature: str | None = None
+):
+    """Map a Web API response to the value returned by ``_make_request``.
+
+    Works with both ``requests`` and ``httpx`` responses.
+    """
+    if response.status_code in [200, 201, 204]:
+        if method == "PUT" and endpoint == "/me/player/repeat":
+            return True
+        try:
+            data = json_codec.decode(response)
+        except ValueError:
+            return True
+        return True if data is json_codec.EMPTY else data
+
+    try:
+        data = json_codec.decode(response)
+    except Exception:
+        data = json_codec.EMPTY
+    if data is json_codec.EMPTY:
+        data = {"error": response.text}
+
+    if response.status_code == 403:
+        reason = ""
+        err = data.get("error", {}) if isinstance(data, dict) else {}
+        if isinstance(err, dict):
+            reason = err.get("reason") or err.get("message", "")
+        if reason == "PREMIUM_REQUIRED":
+            raise PremiumRequiredError("Spotify Premium required.")
+        if "scope" in reason.lower() and feature:
+            check_scopes(tokens, REQUIRED_SCOPES[feature])
+        return data
+
+    if (
+        response.status_code == 404
+        and endpoint.startswith("/me/player")
+    ):
+        message = ""
+        err = data.get("error", {}) if isinstance(data, dict) else {}
+        if isinstance(err, dict):
+            message = err.get("message", "")
+        if message in ("Device not found", "No active device"):
+            raise NoActiveDeviceError(
+                "No active device. Open Spotify on any device."
+            )
+        return data
+
+    return data
+
 
 class SpotifyClient:
     """Unified interface to the Spotify Web API."""
@@ -34,9 +109,35 @@ class SpotifyClient:
         *,
         verify_scopes: bool = False,
         verify_at_startup: bool = False,
+        http_pool: HttpPool | None = None,
+        token_manager: TokenManager | None = None,
+        rate_limiter: RateLimiter | None = None,
+        retry_policy: RetryPolicy | None = None,
+        catalog_cache: CatalogCache | None = None,
+        http_cache: HttpCache | None = None,
+        single_flight: SingleFlight | None = None,
     ):
+        self.token_manager = token_manager
+        # Without a shared manager a private one still makes concurrent
+        # refreshes of the same stale token single-flight
+        self._refresher = token_manager or TokenManager()
+        if tokens_provider is None and token_manager is not None:
+            tokens_provider = token_manager.get
         self.tokens_provider: TokensProvider = tokens_provider or (lambda: None)
         self.config = Config()
+        self.http = http_pool or get_http_pool()
+        self.rate_limiter = rate_limiter or get_rate_limiter()
+        self.retry_policy = retry_policy or get_retry_policy()
+        self.catalog_cache = catalog_cache or get_catalog_cache()
+        self.http_cache = http_cache or get_http_cache()
+        self.single_flight = single_flight or get_single_flight()
+        window = self.config.BATCH_WINDOW_MS / 1000
+        self.loaders = {
+            kind: BatchLoader(
+                lambda ids, kind=kind: self._get_many(kind, ids), limit, window
+            )
+            for kind, limit in MULTI_GET_LIMITS.items()
+        }
         self.playback = SpotifyPlaybackClient(self)
         self.playlists = SpotifyPlaylistsClient(self)
         self.albums = SpotifyAlbumsClient(self)
@@ -49,12 +150,28 @@ class SpotifyClient:
                 check_scopes(tokens, all_scopes)
 
     def _refresh(self, tokens: Tokens) -> Tokens:
-        return refresh_tokens(
-            tokens, self.config.SPOTIFY_CLIENT_ID, self.config.SPOTIFY_CLIENT_SECRET
-        )
+        return self._refresher.refresh(tokens)
 
     def _make_request(
         self, method: str, endpoint: str, *, feature: str | None = None, **kwargs
+    ):
+        if method != "GET":
+            return self._request(method, endpoint, feature=feature, **kwargs)
+        # Identical GETs in flight at the same time share one upstream request
+        tokens = self.tokens_provider()
+        key = (
+            method,
+            endpoint,
+            feature,
+            json.dumps(kwargs, sort_keys=True, default=str),
+            tokens.access_token if tokens else None,
+        )
+        return self.single_flight.do(
+            key, lambda: self._request(method, endpoint, feature=feature, **kwargs)
+        )
+
+    def _request(
+        self, method: str, endpoint: str, *, feature: str | None = None, **kwargs
     ):
         tokens = self.tokens_provider()
         if tokens is None or not has_refresh_token(tokens):
@@ -70,55 +187,127 @@ class SpotifyClient:
             "Content-Type": "application/json",
         }
         url = f"{self.config.SPOTIFY_API_BASE}{endpoint}"
-        response = requests.request(method, url, headers=headers, **kwargs)
+
+        cache_key = None
+        if method == "GET" and self.config.HTTP_CACHE_ENABLED and is_cacheable_url(url):
+            cache_key = self.http_cache.key(url, kwargs.get("params"))
+            cached = self.http_cache.fresh(cache_key)
+            if cached is not HTTP_MISS:
+                return cached
+            etag = self.http_cache.validator(cache_key)
+            if etag:
+                headers["If-None-Match"] = etag
+
+        response = self._send(method, endpoint, url, headers, kwargs)
+        if method != "GET":
+            self.http_cache.invalidate(url)
 
         if response.status_code == 401:
             if has_refresh_token(tokens):
                 tokens = self._refresh(tokens)
                 headers["Authorization"] = f"Bearer {tokens.access_token}"
-                response = requests.request(method, url, headers=headers, **kwargs)
+                response = self._send(method, endpoint, url, headers, kwargs)
             else:
                 raise NotAuthenticatedError("User token missing. Run /auth.")
 
-        if response.status_code in [200, 201, 204]:
-            if method == "PUT" and endpoint == "/me/player/repeat":
-                return True
-            try:
-                return response.json() if response.text else True
-            except ValueError:
-                return True
+        if cache_key is not None and response.status_code == 304:
+            cached = self.http_cache.not_modified(cache_key, response)
+            if cached is not HTTP_MISS:
+                return cached
+            # The entry was evicted meanwhile; fetch the full body again
+            headers.pop("If-None-Match", None)
+            response = self._send(method, endpoint, url, headers, kwargs)
 
-        try:
-            data = response.json()
-        except Exception:
-            data = {"error": response.text}
-
-        if response.status_code == 403:
-            reason = ""
-            err = data.get("error", {}) if isinstance(data, dict) else {}
-            if isinstance(err, dict):
-                reason = err.get("reason") or err.get("message", "")
-            if reason == "PREMIUM_REQUIRED":
-                raise PremiumRequiredError("Spotify Premium required.")
-            if "scope" in reason.lower() and feature:
-                check_scopes(tokens, REQUIRED_SCOPES[feature])
-            return data
-
-        if (
-            response.status_code == 404
-            and endpoint.startswith("/me/player")
-        ):
-            message = ""
-            err = data.get("error", {}) if isinstance(data, dict) else {}
-            if isinstance(err, dict):
-                message = err.get("message", "")
-            if message in ("Device not found", "No active device"):
-                raise NoActiveDeviceError(
-                    "No active device. Open Spotify on any device."
-                )
-            return data
+        result = handle_response(
+            response, method, endpoint, tokens, feature=feature
+        )
+        if cache_key is not None and response.status_code == 200:
+            self.http_cache.store(cache_key, response, result)
+        return result
 
-        return data
+    def _cached_request(
+        self, kind: str, endpoint: str, params: Dict[str, Any] | None = None
+    ):
+        """GET a catalog ``endpoint``, served from :attr:`catalog_cache` on repeat.
+
+        Cached values are shared between callers and must not be mutated.
+        """
+        if not self.config.CACHE_ENABLED:
+            return self._make_request("GET", endpoint, params=params)
+        key = self.catalog_cache.key(kind, endpoint, params)
+        cached = self.catalog_cache.get(key)
+        if cached is not MISS:
+            return cached
+        result = self._make_request("GET", endpoint, params=params)
+        if is_cacheable(result):
+            self.catalog_cache.put(key, result)
+        return result
+
+    def _load(self, kind: str, spotify_id: str):
+        """GET ``/{kind}s/{id}``, batched with concurrent lookups of the same kind.
+
+        The catalog cache is consulted first and filled with the result.
+        """
+        endpoint = f"/{kind}s/{spotify_id}"
+        key = self.catalog_cache.key(kind, endpoint)
+        if self.config.CACHE_ENABLED:
+            cached = self.catalog_cache.get(key)
+            if cached is not MISS:
+                return cached
+        result = self.loaders[kind].load(spotify_id)
+        if self.config.CACHE_ENABLED and is_cacheable(result):
+            self.catalog_cache.put(key, result)
+        return result
+
+    def _get_many(self, kind: str, ids: Sequence[str]) -> Dict[str, Any]:
+        """Fetch several items of ``kind`` with one multi-get request.
+
+        A single ID uses the single-item endpoint. If the multi-get fails as
+        a whole (e.g. one malformed ID) or leaves an ID unresolved, those IDs
+        are fetched one by one so each caller sees the usual response.
+        """
+        if len(ids) == 1:
+            return {ids[0]: self._make_request("GET", f"/{kind}s/{ids[0]}")}
+        data = self._make_request("GET", f"/{kind}s", params={"ids": ",".join(ids)})
+        items = data.get(f"{kind}s") if isinstance(data, dict) else None
+        if not isinstance(items, list) or len(items) != len(ids):
+            items = [None] * len(ids)
+        return {
+            spotify_id: item or self._make_request("GET", f"/{kind}s/{spotify_id}")
+            for spotify_id, item in zip(ids, items)
+        }
+
+    def _send(self, method: str, endpoint: str, url: str, headers: dict, kwargs: dict):
+        """Send a request through the rate limiter, retrying 429 responses.
+
+        A 429 pauses the endpoint group for ``Retry-After`` seconds and the
+        request is sent again, as long as that fits within
+        ``RATE_LIMIT_MAX_WAIT``. Otherwise the last 429 response is returned.
+        Transient failures are retried according to ``retry_policy``.
+        """
+        group = endpoint_group(endpoint)
+        deadline = bound(time.monotonic() + self.config.RATE_LIMIT_MAX_WAIT)
+        response = None
+        while True:
+            if not self.rate_limiter.acquire(group, deadline):
+                if response is not None:
+                    return response
+                if deadline_exceeded():
+                    raise DeadlineExceededError("Tool deadline exceeded.")
+                retry_in = self.rate_limiter.retry_in(group)
+                raise RateLimitedError(
+                    f"Spotify rate limit reached; try again in {retry_in:.0f}s."
+                )
+            response = self.retry_policy.call(
+                method,
+                lambda: self.http.request(method, url, headers=headers, **kwargs),
+            )
+            response_headers = getattr(response, "headers", None) or {}
+            self.rate_limiter.record(
+                group, response.status_code, response_headers.get("Retry-After")
+            )
+            if response.status_code != 429:
+                return response
 
     def __getattr__(self, name):
         for client in (self.playback, self.playlists, self.albums, self.artists):
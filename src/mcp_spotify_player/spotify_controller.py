@@ -1,32 +1,92 @@
-from typing import Any, Callable, Optional
+from __future__ import annotations
+
+import threading
+from functools import cached_property
+from typing import TYPE_CHECKING, Any, Callable, Optional
 
 from mcp_logging import get_logger
 
+from mcp_spotify.auth.manager import TokenManager
 from mcp_spotify.auth.tokens import Tokens
 from mcp_spotify.errors import InvalidTokenFileError
 from mcp_spotify_player.client_auth import is_token_expired
-from mcp_spotify_player.playback_controller import PlaybackController
-from mcp_spotify_player.playlist_controller import PlaylistController
-from mcp_spotify_player.album_controller import AlbumController
-from mcp_spotify_player.artists_controller import ArtistsController
-from mcp_spotify_player.spotify_client import SpotifyClient
+
+# The client and the controllers (and pydantic, through the models) are only
+# imported when a tool first needs them, so the server starts quickly.
+if TYPE_CHECKING:
+    from mcp_spotify_player.album_controller import AlbumController
+    from mcp_spotify_player.artists_controller import ArtistsController
+    from mcp_spotify_player.playback_controller import PlaybackController
+    from mcp_spotify_player.playlist_controller import PlaylistController
+    from mcp_spotify_player.spotify_client import SpotifyClient
 
 logger = get_logger(__name__)
 
 
 TokensProvider = Callable[[], Optional[Tokens]]
 
+_LAZY_ATTRIBUTES = frozenset({"client", "playback", "playlists", "albums", "artists"})
+
+
+class _built_once(cached_property):
+    """``cached_property`` whose build runs under the instance's ``_build_lock``.
+
+    Concurrent tool calls arriving before the first build would otherwise each
+    build their own client, with its own connection pool and caches.
+    """
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        with instance._build_lock:
+            return super().__get__(instance, owner)
+
 
 class SpotifyController:
-    """Facade that groups playback and playlist controllers."""
+    """Facade that groups playback and playlist controllers.
 
-    def __init__(self, tokens_provider: TokensProvider):
+    The client and each controller are built on first access.
+    """
+
+    def __init__(
+        self,
+        tokens_provider: TokensProvider,
+        token_manager: TokenManager | None = None,
+    ):
         self.tokens_provider = tokens_provider
-        self.client = SpotifyClient(tokens_provider)
-        self.playback = PlaybackController(self.client)
-        self.playlists = PlaylistController(self.client)
-        self.albums = AlbumController(self.client)
-        self.artists = ArtistsController(self.client)
+        self.token_manager = token_manager
+        # Reentrant: building a controller builds the client first
+        self._build_lock = threading.RLock()
+
+    @_built_once
+    def client(self) -> SpotifyClient:
+        from mcp_spotify_player.spotify_client import SpotifyClient
+
+        return SpotifyClient(self.tokens_provider, token_manager=self.token_manager)
+
+    @_built_once
+    def playback(self) -> PlaybackController:
+        from mcp_spotify_player.playback_controller import PlaybackController
+
+        return PlaybackController(self.client)
+
+    @_built_once
+    def playlists(self) -> PlaylistController:
+        from mcp_spotify_player.playlist_controller import PlaylistController
+
+        return PlaylistController(self.client)
+
+    @_built_once
+    def albums(self) -> AlbumController:
+        from mcp_spotify_player.album_controller import AlbumController
+
+        return AlbumController(self.client)
+
+    @_built_once
+    def artists(self) -> ArtistsController:
+        from mcp_spotify_player.artists_controller import ArtistsController
+
+        return ArtistsController(self.client)
 
     def is_authenticated(self) -> bool:
         """Checks if valid authentication tokens are available."""
@@ -38,6 +98,9 @@ class SpotifyController:
         return tokens is not None and not is_token_expired(tokens)
 
     def __getattr__(self, name: str) -> Any:
+        # A lazy attribute failing to build must not recurse through here
+        if name.startswith("_") or name in _LAZY_ATTRIBUTES:
+            raise AttributeError(f"{self.__class__.__name__} object has no attribute {name}")
         if hasattr(self.playback, name):
             return getattr(self.playback, name)
         if hasattr(self.playlists, name):
@@ -0,0 +1,75 @@
+"""Outbound side of the stdio JSON-RPC transport.
+
+Messages are encoded to UTF-8 bytes by :mod:`json_codec` and written to the
+binary ``sys.stdout.buffer``, skipping the text layer. Frames are written
+under a lock so concurrent responses never interleave; when several writers
+are queued only the last one flushes, so a burst of responses costs a single
+flush. Static results can be encoded once with :class:`PreEncodedResult` and
+only the request ``id`` spliced in per reply.
+"""
+
+from __future__ import annotations
+
+import sys
+import threading
+from typing import Any, Dict, TextIO
+
+from mcp_spotify_player import json_codec
+
+
+class PreEncodedResult:
+    """A JSON-RPC response whose ``result`` is encoded once, up front."""
+
+    def __init__(self, result: Any):
+        body = json_codec.dumps({"jsonrpc": "2.0", "result": result})
+        # Reopen the object to append the id, which is the only varying part
+        self._prefix = body[:-1] + b',"id":'
+
+    def frame(self, request_id: Any) -> bytes:
+        """Return the complete, newline-terminated frame for ``request_id``."""
+        return self._prefix + json_codec.dumps(request_id) + b"}\n"
+
+
+class StdioWriter:
+    """Write newline-delimited JSON-RPC frames to stdout.
+
+    ``stream`` defaults to whatever ``sys.stdout`` is at write time. Streams
+    without a binary ``buffer`` (such as :class:`io.StringIO`) get the
+    decoded text instead.
+    """
+
+    def __init__(self, stream: TextIO | None = None):
+        self.stream = stream
+        self._lock = threading.Lock()
+        self._count_lock = threading.Lock()
+        self._queued = 0
+        self.frames = 0
+        self.bytes = 0
+        self.flushes = 0
+
+    def send(self, message: Dict[str, Any]) -> None:
+        """Encode and write one message."""
+        self.write_frame(json_codec.dumps(message) + b"\n")
+
+    def write_frame(self, frame: bytes) -> None:
+        """Write an already encoded, newline-terminated frame."""
+        with self._count_lock:
+            self._queued += 1
+        with self._lock:
+            stream = self.stream if self.stream is not None else sys.stdout
+            buffer = getattr(stream, "buffer", None)
+            target = buffer if buffer is not None else stream
+            target.write(frame if buffer is not None else frame.decode("utf-8"))
+            self.frames += 1
+            self.bytes += len(frame)
+            with self._count_lock:
+                self._queued -= 1
+                last = self._queued == 0
+            if last:
+                target.flush()
+                self.flushes += 1
+
+    def stats(self) -> Dict[str, int]:
+        """Return how many frames, bytes and flushes were written."""
+        with self._lock:
+            return {"frames": self.frames, "bytes": self.bytes, "flushes": self.flushes}
@@ -0,0 +1,115 @@
+"""Per-endpoint request timeouts and end-to-end tool deadlines.
+
+Every HTTP request gets a timeout from its endpoint class: player control
+calls are expected to answer quickly, paginated library reads may take
+longer. ``execute_tool`` additionally opens a :func:`tool_deadline` scope;
+the deadline lives in a context variable so every request made while the
+tool runs, however deeply nested, shares the same budget.
+"""
+
+from __future__ import annotations
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator
+from urllib.parse import urlsplit
+
+from mcp_spotify.errors import DeadlineExceededError
+from mcp_spotify_player.config import Config
+
+_DEADLINE: ContextVar[float | None] = ContextVar("mcp_tool_deadline", default=None)
+
+# Paginated reads of the user's library and of catalog collections
+_LIBRARY_PATHS = ("/me/playlists", "/me/albums", "/me/tracks")
+_LIBRARY_SUFFIXES = ("/tracks", "/albums")
+
+
+@contextmanager
+def tool_deadline(seconds: float) -> Iterator[float]:
+    """Bound everything run inside the block by ``seconds``.
+
+    A nested scope can only shorten the enclosing deadline, never extend it.
+    Yields the absolute ``time.monotonic()`` deadline.
+    """
+    deadline = time.monotonic() + seconds
+    outer = _DEADLINE.get()
+    if outer is not None:
+        deadline = min(deadline, outer)
+    token = _DEADLINE.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _DEADLINE.reset(token)
+
+
+@contextmanager
+def replace_deadline(deadline: float | None) -> Iterator[None]:
+    """Run the block under ``deadline`` instead of the active one.
+
+    ``deadline`` is a ``time.monotonic()`` value, or ``None`` for no limit.
+    Unlike :func:`tool_deadline` this may extend the budget; it is meant for
+    work done on behalf of several callers, such as a merged batch.
+    """
+    token = _DEADLINE.set(deadline)
+    try:
+        yield
+    finally:
+        _DEADLINE.reset(token)
+
+
+def current_deadline() -> float | None:
+    """Return the active deadline as a ``time.monotonic()`` value, if any."""
+    return _DEADLINE.get()
+
+
+def remaining() -> float | None:
+    """Seconds left before the active deadline, or ``None`` without one."""
+    deadline = _DEADLINE.get()
+    if deadline is None:
+        return None
+    return deadline - time.monotonic()
+
+
+def bound(deadline: float) -> float:
+    """Return ``deadline`` capped by the active tool deadline."""
+    current = _DEADLINE.get()
+    return deadline if current is None else min(deadline, current)
+
+
+def endpoint_timeout(method: str, url: str) -> float:
+    """Return the configured timeout class for a request."""
+    parts = urlsplit(url)
+    if parts.netloc and parts.netloc.startswith("accounts."):
+        return Config.TIMEOUT_AUTH
+    path = parts.path
+    base = urlsplit(Config.SPOTIFY_API_BASE).path
+    if base and path.startswith(base):
+        path = path[len(base):]
+    if path.startswith("/me/player"):
+        return Config.TIMEOUT_CONTROL
+    if method.upper() == "GET" and (
+        path in _LIBRARY_PATHS or path.endswith(_LIBRARY_SUFFIXES)
+    ):
+        return Config.TIMEOUT_LIBRARY
+    return Config.TIMEOUT_DEFAULT
+
+
+def request_timeout(method: str, url: str) -> float:
+    """Return the timeout for a request, clamped to the active deadline.
+
+    Raises ``DeadlineExceededError`` if the deadline has already passed.
+    """
+    timeout = endpoint_timeout(method, url)
+    left = remaining()
+    if left is None:
+        return timeout
+    if left <= 0:
+        raise DeadlineExceededError("Tool deadline exceeded.")
+    return min(timeout, left)
+
+
+def deadline_exceeded() -> bool:
+    """Return ``True`` if an active deadline has passed."""
+    left = remaining()
+    return left is not None and left <= 0
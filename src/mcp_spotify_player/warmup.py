@@ -0,0 +1,133 @@
+"""Background warm-up of what the first tool call would otherwise pay for.
+
+Right after ``initialize`` the server resolves the Spotify hosts, opens a
+pooled connection to each of them (TCP and TLS handshakes included) and
+refreshes an access token that is about to expire, all on a daemon thread.
+The first ``tools/call`` then starts from a warm connection pool and a fresh
+token. Every step is best effort: a failure is logged and the next step runs.
+"""
+
+from __future__ import annotations
+
+import socket
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Dict, List
+from urllib.parse import urlparse
+
+from mcp_logging import get_logger
+
+from mcp_spotify_player.config import Config
+from mcp_spotify_player.http_pool import get_http_pool
+
+if TYPE_CHECKING:
+    from mcp_spotify.auth.manager import TokenManager
+
+logger = get_logger(__name__)
+
+WARMUP_IDLE = "idle"
+WARMUP_RUNNING = "running"
+WARMUP_DONE = "done"
+
+
+def _origins() -> List[str]:
+    """Return the Web API and accounts service origins."""
+    origins = []
+    for url in (Config.SPOTIFY_API_BASE, Config.SPOTIFY_TOKEN_URL):
+        parsed = urlparse(url)
+        origin = f"{parsed.scheme}://{parsed.netloc}/"
+        if origin not in origins:
+            origins.append(origin)
+    return origins
+
+
+def _ms(seconds: float) -> float:
+    return round(seconds * 1000, 1)
+
+
+class Warmup:
+    """Runs the warm-up once and keeps its timings for ``diagnose``."""
+
+    def __init__(self, token_manager: TokenManager | None = None):
+        self.token_manager = token_manager
+        self.state = WARMUP_IDLE
+        self.errors = 0
+        self.refreshed = False
+        self._timings: Dict[str, float] = {}
+        self._first_call: float | None = None
+        self._lock = threading.Lock()
+        self._done = threading.Event()
+
+    def start(self) -> bool:
+        """Start the warm-up thread; ``False`` if it already ran or is running."""
+        with self._lock:
+            if self.state != WARMUP_IDLE:
+                return False
+            self.state = WARMUP_RUNNING
+        threading.Thread(target=self._run, name="mcp-warmup", daemon=True).start()
+        return True
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """Block until the warm-up finished; ``False`` if ``timeout`` ran out."""
+        return self._done.wait(timeout)
+
+    def _run(self) -> None:
+        start = time.perf_counter()
+        try:
+            origins = _origins()
+            self._step("dns", self.resolve, origins)
+            self._step("connect", self.preconnect, origins)
+            self._step("refresh", self.refresh)
+        finally:
+            self._timings["total"] = time.perf_counter() - start
+            self.state = WARMUP_DONE
+            self._done.set()
+            logger.debug("Warm-up finished: %s", self.stats())
+
+    def _step(self, name: str, fn, *args: Any) -> None:
+        start = time.perf_counter()
+        try:
+            fn(*args)
+        except Exception as e:
+            self.errors += 1
+            logger.warning("Warm-up step %s failed: %s", name, e)
+        self._timings[name] = time.perf_counter() - start
+
+    def resolve(self, origins: List[str]) -> None:
+        """Resolve each host so the system resolver caches its addresses."""
+        for origin in origins:
+            parsed = urlparse(origin)
+            socket.getaddrinfo(parsed.hostname, parsed.port or 443, type=socket.SOCK_STREAM)
+
+    def preconnect(self, origins: List[str]) -> None:
+        """Leave one idle, already handshaken connection per host in the pool."""
+        pool = get_http_pool()
+        for origin in origins:
+            pool.preconnect(origin)
+
+    def refresh(self) -> None:
+        """Refresh the access token if it expires within the renewal margin."""
+        manager = self.token_manager
+        tokens = manager.get() if manager is not None else None
+        if tokens is None or not tokens.refresh_token:
+            return
+        if tokens.expires_at - time.time() > manager.renew_margin:
+            return
+        manager.refresh(tokens)
+        self.refreshed = True
+
+    def record_first_call(self, seconds: float) -> None:
+        """Remember how long the first Spotify-backed tool call took."""
+        with self._lock:
+            if self._first_call is None:
+                self._first_call = seconds
+
+    def stats(self) -> Dict[str, Any]:
+        data: Dict[str, Any] = {"state": self.state}
+        for name in ("dns", "connect", "refresh", "total"):
+            if name in self._timings:
+                data[f"{name}_ms"] = _ms(self._timings[name])
+        data["refreshed"] = self.refreshed
+        data["errors"] = self.errors
+        data["first_call_ms"] = None if self._first_call is None else _ms(self._first_call)
+        return data
@@ -0,0 +1,91 @@
+import json
+import socket
+import time
+import urllib.request
+
+import pytest
+
+from mcp_spotify_player.client_auth import AUTH_COMPLETE, AUTH_FAILED, AUTH_PENDING
+from mcp_spotify_player.mcp_stdio_server import MCPServer
+
+
+@pytest.fixture
+def client_auth():
+    # Other auth tests reload the module, so always use the current one
+    import mcp_spotify_player.client_auth as client_auth
+
+    return client_auth
+
+
+@pytest.fixture
+def port(client_auth, monkeypatch):
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        port = s.getsockname()[1]
+    monkeypatch.setattr(
+        client_auth.Config, "SPOTIFY_REDIRECT_URI", f"http://127.0.0.1:{port}/auth/callback"
+    )
+    monkeypatch.setattr(client_auth.secrets, "token_urlsafe", lambda n=16: "state")
+    monkeypatch.setattr(client_auth.webbrowser, "open", lambda url: True)
+    monkeypatch.setattr(
+        client_auth,
+        "exchange_code_for_tokens",
+        lambda code: {"access_token": "a", "refresh_token": "r", "expires_in": 3600},
+    )
+    return port
+
+
+@pytest.fixture
+def no_tokens(tmp_path, monkeypatch):
+    path = tmp_path / "fresh" / "tokens.json"
+    monkeypatch.setenv("MCP_SPOTIFY_TOKENS_PATH", str(path))
+    return path
+
+
+def test_start_returns_at_once_and_callback_completes_the_flow(client_auth, port, no_tokens):
+    flow = client_auth.AuthFlow()
+
+    start = time.perf_counter()
+    url = flow.start()
+    elapsed = time.perf_counter() - start
+
+    assert elapsed < 1
+    assert flow.state == AUTH_PENDING
+    assert url.startswith(client_auth.Config.SPOTIFY_AUTH_URL)
+    assert flow.start() == url
+
+    urllib.request.urlopen(f"http://127.0.0.1:{port}/auth/callback?code=code&state=state")
+
+    assert flow.wait(5)
+    assert flow.state == AUTH_COMPLETE
+    assert json.loads(no_tokens.read_text())["refresh_token"] == "r"
+
+
+def test_unfinished_login_fails_and_can_be_restarted(client_auth, port, no_tokens):
+    flow = client_auth.AuthFlow(timeout=0.1)
+    flow.start()
+
+    assert flow.wait(5)
+    assert flow.state == AUTH_FAILED
+    assert isinstance(flow.error, TimeoutError)
+
+    flow.start()
+    assert flow.state == AUTH_PENDING
+    flow.cancel()
+    assert flow.state == AUTH_FAILED
+
+
+def test_server_serves_tools_once_the_background_login_completes(client_auth, port, no_tokens):
+    server = MCPServer()
+    server.auth_flow = client_auth.AuthFlow()
+    server.controller.playback.get_devices = lambda: {"success": True, "devices": []}
+
+    pending = json.loads(server.execute_tool("get_devices", {}))
+    assert pending["auth_pending"] is True
+    assert "Spotify authorization pending" in pending["message"]
+
+    urllib.request.urlopen(f"http://127.0.0.1:{port}/auth/callback?code=code&state=state")
+    assert server.auth_flow.wait(5)
+
+    assert json.loads(server.execute_tool("get_devices", {}))["success"] is True
+    assert "auth: complete" in server.execute_tool("diagnose", {}).splitlines()
@@ -46,6 +46,9 @@ def test_server_ready_before_open(monkeypatch, tmp_path):
         def shutdown(self) -> None:  # pragma: no cover - no-op
             return
 
+        def server_close(self) -> None:  # pragma: no cover - no-op
+            return
+
     def fake_open(url: str) -> bool:
         assert waited["value"]
         opened["value"] = True
@@ -0,0 +1,93 @@
+import threading
+import time
+
+import requests
+
+from mcp_spotify.auth.manager import TokenManager
+from mcp_spotify.auth.tokens import Tokens
+from mcp_spotify_player.spotify_client import SpotifyClient
+
+
+class DummyResponse:
+    status_code = 200
+    text = '{"ok": true}'
+    content = text.encode()
+
+    def json(self):
+        return {"ok": True}
+
+
+def _expired() -> Tokens:
+    return Tokens("old", "refresh", int(time.time()) - 10)
+
+
+def _fresh(access: str) -> Tokens:
+    return Tokens(access, "refresh", int(time.time()) + 3600)
+
+
+def test_refreshed_tokens_are_written_back(monkeypatch):
+    refreshes = []
+
+    def refresher(tokens):
+        refreshes.append(tokens.access_token)
+        return _fresh("new")
+
+    manager = TokenManager(_expired(), refresher)
+    headers_seen = []
+
+    def fake_request(self, method, url, headers=None, **kwargs):
+        headers_seen.append(headers["Authorization"])
+        return DummyResponse()
+
+    monkeypatch.setattr(requests.Session, "request", fake_request)
+
+    client = SpotifyClient(token_manager=manager)
+    for _ in range(3):
+        client.playback.get_playback_state()
+
+    assert refreshes == ["old"]
+    assert manager.get().access_token == "new"
+    assert headers_seen == ["Bearer new"] * 3
+
+
+def test_concurrent_refreshes_are_single_flight():
+    calls = []
+
+    def refresher(tokens):
+        calls.append(tokens.access_token)
+        time.sleep(0.1)
+        return _fresh(f"new{len(calls)}")
+
+    stale = _expired()
+    manager = TokenManager(stale, refresher)
+    results = []
+
+    def worker():
+        results.append(manager.refresh(stale).access_token)
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert calls == ["old"]
+    assert results == ["new1"] * 8
+    assert manager.refresh_count == 1
+
+
+def test_background_renewal_before_expiry():
+    renewed = threading.Event()
+
+    def refresher(tokens):
+        renewed.set()
+        return _fresh("renewed")
+
+    soon = Tokens("old", "refresh", int(time.time()) + 30)
+    manager = TokenManager(soon, refresher, renew_margin=60)
+    manager.start()
+    try:
+        assert renewed.wait(2)
+    finally:
+        manager.stop()
+    assert manager.get().access_token == "renewed"
@@ -18,6 +18,7 @@ class DummyResponse:
         self.status_code = status_code
         self._data = data or {}
         self.text = json.dumps(self._data) if self._data else ""
+        self.content = self.text.encode()
 
     def json(self) -> dict[str, Any]:
         return self._data
@@ -27,15 +28,13 @@ def test_request_200(monkeypatch: pytest.MonkeyPatch) -> None:
     tokens = Tokens("a", "r", int(time.time()) + 3600)
     calls: list[str] = []
 
-    def fake_request(method, url, headers=None, **kwargs):
+    def fake_request(self, method, url, headers=None, **kwargs):
+        if method == "POST":  # pragma: no cover - should not be called
+            raise AssertionError("refresh should not be attempted")
         calls.append(headers["Authorization"])
         return DummyResponse(200, {"ok": True})
 
-    def fake_post(*args, **kwargs):  # pragma: no cover - should not be called
-        raise AssertionError("refresh should not be attempted")
-
-    monkeypatch.setattr(requests, "request", fake_request)
-    monkeypatch.setattr(requests, "post", fake_post)
+    monkeypatch.setattr(requests.Session, "request", fake_request)
 
     client = SpotifyClient(lambda: tokens)
     assert client.playback.get_playback_state() == {"ok": True}
@@ -50,16 +49,14 @@ def test_request_401_triggers_refresh(tmp_path: Path, monkeypatch: pytest.Monkey
     responses = [DummyResponse(401), DummyResponse(200, {"ok": True})]
     headers_seen: list[str] = []
 
-    def fake_request(method, url, headers=None, **kwargs):
+    def fake_request(self, method, url, headers=None, data=None, **kwargs):
+        if method == "POST":
+            assert data["refresh_token"] == "refresh"
+            return DummyResponse(200, {"access_token": "new", "expires_in": 60})
         headers_seen.append(headers["Authorization"])
         return responses.pop(0)
 
-    def fake_post(url, data):
-        assert data["refresh_token"] == "refresh"
-        return DummyResponse(200, {"access_token": "new", "expires_in": 60})
-
-    monkeypatch.setattr(requests, "request", fake_request)
-    monkeypatch.setattr(requests, "post", fake_post)
+    monkeypatch.setattr(requests.Session, "request", fake_request)
 
     client = SpotifyClient(lambda: tokens)
     assert client.playback.get_playback_state() == {"ok": True}
@@ -73,14 +70,12 @@ def test_no_refresh_when_no_refresh_token(
 ) -> None:
     tokens = Tokens("a", "", int(time.time()) + 3600)
 
-    def fake_request(method, url, headers=None, **kwargs):
+    def fake_request(self, method, url, headers=None, **kwargs):
+        if method == "POST":  # pragma: no cover
+            raise AssertionError("refresh should not be attempted")
         return DummyResponse(401)
 
-    def fail_post(*args, **kwargs):  # pragma: no cover
-        raise AssertionError("refresh should not be attempted")
-
-    monkeypatch.setattr(requests, "request", fake_request)
-    monkeypatch.setattr(requests, "post", fail_post)
+    monkeypatch.setattr(requests.Session, "request", fake_request)
 
     client = SpotifyClient(lambda: tokens)
     with pytest.raises(NotAuthenticatedError) as exc:
@@ -98,10 +93,11 @@ def test_refresh_preserves_refresh_token_when_missing_in_response(
     client.refresh_token = "refresh"
     client.token_expires_at = 0
 
-    def fake_post(url, data):
+    def fake_request(self, method, url, data=None, **kwargs):
+        assert method == "POST"
         return DummyResponse(200, {"access_token": "new", "expires_in": 120})
 
-    monkeypatch.setattr(requests, "post", fake_post)
+    monkeypatch.setattr(requests.Session, "request", fake_request)
     monkeypatch.setattr(time, "time", lambda: 1000)
 
     assert client.refresh_access_token() is True
@@ -110,3 +106,42 @@ def test_refresh_preserves_refresh_token_when_missing_in_response(
     assert stored["refresh_token"] == "refresh"
     assert client.token_expires_at == 1000 + 120 - 60
 
+
+
+def test_concurrent_refreshes_without_token_manager_run_once(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    import threading
+
+    monkeypatch.setenv("MCP_SPOTIFY_TOKENS_PATH", str(tmp_path / "tokens.json"))
+    stale = Tokens("old", "refresh", int(time.time()) + 3600)
+    refreshes: list[str] = []
+    barrier = threading.Barrier(4, timeout=2)
+
+    def fake_request(self, method, url, headers=None, data=None, **kwargs):
+        if method == "POST":
+            refreshes.append(data["refresh_token"])
+            time.sleep(0.05)
+            return DummyResponse(200, {"access_token": "new", "expires_in": 3600})
+        if headers["Authorization"] == "Bearer old":
+            barrier.wait()
+            return DummyResponse(401)
+        return DummyResponse(200, {"ok": True})
+
+    monkeypatch.setattr(requests.Session, "request", fake_request)
+    client = SpotifyClient(lambda: stale)
+    results: list[Any] = []
+
+    threads = [
+        threading.Thread(
+            target=lambda n=n: results.append(client._make_request("GET", f"/albums/{n}"))
+        )
+        for n in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == [{"ok": True}] * 4
+    assert refreshes == ["refresh"]
@@ -0,0 +1,90 @@
+import threading
+import time
+from pathlib import Path
+
+import mcp_spotify.auth.store as store_module
+from mcp_spotify.auth.manager import TokenManager
+from mcp_spotify.auth.store import TokenStore
+from mcp_spotify.auth.tokens import Tokens, write_tokens
+
+
+def _tokens(access: str, expires_in: int = 3600) -> Tokens:
+    return Tokens(access, f"refresh-{access}", int(time.time()) + expires_in)
+
+
+def test_load_reparses_only_when_file_changes(tmp_path: Path, monkeypatch):
+    path = tmp_path / "tokens.json"
+    write_tokens(_tokens("a"), path)
+    parsed = []
+    original = store_module.load_tokens
+
+    def counting_load(p):
+        parsed.append(p)
+        return original(p)
+
+    monkeypatch.setattr(store_module, "load_tokens", counting_load)
+    store = TokenStore(path)
+
+    assert store.load().access_token == "a"
+    assert store.load().access_token == "a"
+    assert len(parsed) == 1
+
+    write_tokens(_tokens("b"), path)
+    assert store.changed()
+    assert store.load().access_token == "b"
+    assert len(parsed) == 2
+
+
+def test_manager_adopts_tokens_written_by_another_process(tmp_path: Path):
+    path = tmp_path / "tokens.json"
+    write_tokens(_tokens("mine", 600), path)
+    store = TokenStore(path)
+    manager = TokenManager(store.load(), store=store)
+
+    write_tokens(_tokens("theirs", 3600), path)
+
+    assert manager.get().access_token == "theirs"
+
+
+def test_refresh_reuses_tokens_rotated_elsewhere(tmp_path: Path):
+    path = tmp_path / "tokens.json"
+    stale = _tokens("old", -10)
+    write_tokens(stale, path)
+    store = TokenStore(path)
+    store.load()
+    write_tokens(_tokens("rotated"), path)
+
+    def refresher(tokens):  # pragma: no cover - must not be called
+        raise AssertionError("refresh should not be attempted")
+
+    assert store.refresh(stale, refresher).access_token == "rotated"
+
+
+def test_lock_serializes_refresh_between_stores(tmp_path: Path):
+    path = tmp_path / "tokens.json"
+    stale = _tokens("old", -10)
+    write_tokens(stale, path)
+    calls = []
+
+    def refresher(tokens):
+        calls.append(tokens.refresh_token)
+        time.sleep(0.1)
+        return _tokens("new")
+
+    results = []
+
+    def worker():
+        # Separate stores behave like separate processes sharing the file
+        store = TokenStore(path)
+        store.load()
+        results.append(store.refresh(stale, refresher).access_token)
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert calls == ["refresh-old"]
+    assert results == ["new"] * 4
+    assert TokenStore(path).load().access_token == "new"
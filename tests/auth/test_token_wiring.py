@@ -5,7 +5,7 @@ from pathlib import Path
 import pytest
 
 from mcp_spotify.auth.tokens import Tokens
-from mcp_spotify.errors import InvalidTokenFileError, UserAuthRequiredError
+from mcp_spotify.errors import InvalidTokenFileError
 from mcp_spotify_player.client_auth import SpotifyAuthClient, try_load_tokens
 from mcp_spotify_player.mcp_stdio_server import MCPServer
 from mcp_spotify_player.spotify_client import SpotifyClient
@@ -20,13 +20,23 @@ def test_no_tokens_file_returns_none(tmp_path: Path, monkeypatch: pytest.MonkeyP
     assert not path.exists()
 
 
-def test_no_tokens_file_fails_without_creating_client_credentials(
+def test_no_tokens_file_reports_auth_pending_without_creating_client_credentials(
     tmp_path: Path, monkeypatch: pytest.MonkeyPatch
 ) -> None:
     path = tmp_path / "alt" / "tokens.json"
     monkeypatch.setenv("MCP_SPOTIFY_TOKENS_PATH", str(path))
-    with pytest.raises(UserAuthRequiredError):
-        MCPServer()
+    server = MCPServer()
+    started = []
+    monkeypatch.setattr(
+        server.auth_flow, "start", lambda: started.append(1) or "https://accounts/authorize"
+    )
+
+    result = json.loads(server.execute_tool("get_devices", {}))
+
+    assert result["success"] is False
+    assert result["auth_pending"] is True
+    assert result["authorize_url"] == "https://accounts/authorize"
+    assert started == [1]
     assert not path.exists()
 
 
@@ -0,0 +1,173 @@
+import pytest
+import requests
+from unittest.mock import patch
+
+from mcp_spotify.errors import DeadlineExceededError
+from mcp_spotify_player.mcp_stdio_server import MCPServer
+from mcp_spotify_player.spotify_client import SpotifyClient
+from mcp_spotify_player.spotify_controller import SpotifyController
+from mcp_spotify_player.timeouts import remaining
+
+PLAYLIST_ID = "37i9dQZF1DXcBWIGoYBM5M"
+
+
+def _uris(n):
+    return [f"spotify:track:{i:022d}" for i in range(n)]
+
+
+def _fake_writes():
+    writes = []
+
+    def fake(method, endpoint, feature=None, json=None, **kwargs):
+        writes.append(json)
+        return {"snapshot_id": f"snap{len(writes)}"}
+
+    return writes, fake
+
+
+def test_client_single_chunk_is_one_request():
+    client = SpotifyClient()
+    with patch.object(client, "_make_request", return_value={"snapshot_id": "s1"}) as mock_request:
+        result = client.add_tracks_to_playlist("playlist123", ["spotify:track:1"])
+        mock_request.assert_called_once_with(
+            "POST",
+            "/playlists/playlist123/tracks",
+            feature="playlists",
+            json={"uris": ["spotify:track:1"]},
+        )
+    assert result == {"added": 1, "snapshot_id": "s1"}
+
+
+def test_client_adds_10000_tracks_in_100_ordered_writes():
+    client = SpotifyClient()
+    writes, fake = _fake_writes()
+    progress = []
+    uris = _uris(10_000)
+
+    with patch.object(client, "_make_request", side_effect=fake):
+        result = client.add_tracks_to_playlist(
+            "playlist123", uris, progress=lambda *args: progress.append(args)
+        )
+
+    assert len(writes) == 100
+    assert [uri for write in writes for uri in write["uris"]] == uris
+    assert all("position" not in write for write in writes)
+    assert result == {"added": 10_000, "snapshot_id": "snap100"}
+    assert progress[0] == (100, 10_000, "snap1")
+    assert progress[-1] == (10_000, 10_000, "snap100")
+
+
+def test_client_position_advances_per_chunk():
+    client = SpotifyClient()
+    writes, fake = _fake_writes()
+
+    with patch.object(client, "_make_request", side_effect=fake):
+        client.add_tracks_to_playlist("playlist123", _uris(250), position=5)
+
+    assert [write["position"] for write in writes] == [5, 105, 205]
+    assert [len(write["uris"]) for write in writes] == [100, 100, 50]
+
+
+def test_client_stops_at_first_failed_chunk():
+    client = SpotifyClient()
+    replies = [{"snapshot_id": "s1"}, {"error": {"status": 400, "message": "Invalid base62 id"}}]
+
+    with patch.object(client, "_make_request", side_effect=replies) as mock_request:
+        result = client.add_tracks_to_playlist("playlist123", _uris(300))
+
+    assert mock_request.call_count == 2
+    assert result["added"] == 100
+    assert result["snapshot_id"] == "s1"
+    assert result["error"]["status"] == 400
+
+
+def test_client_returns_partial_result_when_deadline_runs_out():
+    client = SpotifyClient()
+    replies = [{"snapshot_id": "s1"}, {"snapshot_id": "s2"}, DeadlineExceededError("Tool deadline exceeded.")]
+
+    with patch.object(client, "_make_request", side_effect=replies) as mock_request:
+        result = client.add_tracks_to_playlist("playlist123", _uris(500))
+
+    assert mock_request.call_count == 3
+    assert result == {"added": 200, "snapshot_id": "s2", "error": "Tool deadline exceeded."}
+
+
+def test_client_returns_partial_result_when_a_chunk_raises():
+    client = SpotifyClient()
+    replies = [{"snapshot_id": "s1"}, requests.ConnectionError("Connection reset by peer")]
+
+    with patch.object(client, "_make_request", side_effect=replies) as mock_request:
+        result = client.add_tracks_to_playlist("playlist123", _uris(300))
+
+    assert mock_request.call_count == 2
+    assert result == {"added": 100, "snapshot_id": "s1", "error": "Connection reset by peer"}
+
+
+def test_client_returns_partial_result_on_server_error():
+    client = SpotifyClient()
+    replies = [
+        {"snapshot_id": "s1"},
+        {"snapshot_id": "s2"},
+        {"error": {"status": 502, "message": "Bad gateway"}},
+    ]
+
+    with patch.object(client, "_make_request", side_effect=replies) as mock_request:
+        result = client.add_tracks_to_playlist("playlist123", _uris(500))
+
+    assert mock_request.call_count == 3
+    assert result == {
+        "added": 200,
+        "snapshot_id": "s2",
+        "error": {"status": 502, "message": "Bad gateway"},
+    }
+
+
+def test_controller_reports_partial_failure():
+    controller = SpotifyController(lambda: None)
+    with patch.object(
+        controller.client.playlists,
+        "add_tracks_to_playlist",
+        return_value={"added": 100, "snapshot_id": "s1", "error": {"message": "Invalid base62 id"}},
+    ):
+        result = controller.playlists.add_tracks_to_playlist(PLAYLIST_ID, _uris(300))
+    assert result["success"] is False
+    assert "added 100 of 300" in result["message"]
+    assert "Invalid base62 id" in result["message"]
+    assert result["added"] == 100
+    assert result["snapshot_id"] == "s1"
+
+
+def test_server_runs_bulk_writes_under_the_bulk_deadline():
+    server = MCPServer()
+    server.config.MCP_TOOL_TIMEOUT = 1
+    server.TOOL_TIMEOUTS["add_tracks_to_playlist"] = 120
+    seen = []
+
+    def fake(*args, **kwargs):
+        seen.append(remaining())
+        return {"added": 1, "snapshot_id": "s1"}
+
+    with patch.object(server.controller.client.playlists, "add_tracks_to_playlist", side_effect=fake):
+        server.execute_tool("add_tracks_to_playlist", {"playlist_id": PLAYLIST_ID, "track_uris": _uris(1)})
+
+    assert seen[0] > 100
+
+
+def test_server_passes_position_and_validates_it():
+    server = MCPServer()
+    with patch.object(
+        server.controller.client.playlists,
+        "add_tracks_to_playlist",
+        return_value={"added": 2, "snapshot_id": "s9"},
+    ) as mock_add:
+        result = server.execute_tool(
+            "add_tracks_to_playlist",
+            {"playlist_id": PLAYLIST_ID, "track_uris": _uris(2), "position": 0},
+        )
+    assert result == "Added 2 tracks successfully"
+    assert mock_add.call_args.args[:3] == (PLAYLIST_ID, _uris(2), 0)
+
+    with pytest.raises(ValueError):
+        server.TOOL_VALIDATORS["add_tracks_to_playlist"](
+            {"playlist_id": PLAYLIST_ID, "track_uris": _uris(1), "position": -1}
+        )
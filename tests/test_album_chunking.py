@@ -0,0 +1,94 @@
+import threading
+import time
+
+import requests
+
+from mcp_spotify_player.catalog_cache import CatalogCache
+from mcp_spotify_player.spotify_client import SpotifyClient
+
+
+def _ids(n):
+    return [f"album{i:05d}" for i in range(n)]
+
+
+def _client(fake):
+    client = SpotifyClient(catalog_cache=CatalogCache())
+    client._make_request = fake
+    return client
+
+
+def test_check_saved_albums_chunks_in_parallel_and_keeps_order():
+    calls = []
+    active = {"now": 0, "max": 0}
+    lock = threading.Lock()
+
+    def fake(method, endpoint, feature=None, params=None, **kwargs):
+        ids = params["ids"].split(",")
+        with lock:
+            calls.append(ids)
+            active["now"] += 1
+            active["max"] = max(active["max"], active["now"])
+        time.sleep(0.01)
+        with lock:
+            active["now"] -= 1
+        return [int(i[-1]) % 2 == 0 for i in ids]
+
+    ids = _ids(1000)
+    result = _client(fake).albums.check_saved_albums(ids)
+
+    assert len(calls) == 50
+    assert all(len(chunk) <= 20 for chunk in calls)
+    assert result == [int(i[-1]) % 2 == 0 for i in ids]
+    assert active["max"] > 1
+
+
+def test_get_albums_reassembles_in_input_order():
+    def fake(method, endpoint, feature=None, params=None, **kwargs):
+        time.sleep(0.001 * (len(params["ids"]) % 3))
+        return {"albums": [{"id": i} for i in params["ids"].split(",")]}
+
+    ids = _ids(45)
+    result = _client(fake).albums.get_albums(ids)
+
+    assert [album["id"] for album in result["albums"]] == ids
+
+
+def test_chunk_error_is_reported():
+    def fake(method, endpoint, feature=None, params=None, **kwargs):
+        if params["ids"].startswith("album00020"):
+            return {"error": {"status": 429}}
+        return [True] * len(params["ids"].split(","))
+
+    assert _client(fake).albums.check_saved_albums(_ids(30)) == {"error": {"status": 429}}
+
+
+def test_save_and_delete_return_ids_of_failed_chunks():
+    sent = []
+
+    def fake(method, endpoint, feature=None, json=None, **kwargs):
+        sent.append((method, len(json["ids"])))
+        if method == "DELETE" and json["ids"][0] == "album00040":
+            return {"error": {"status": 400, "message": "Invalid id"}}
+        return True
+
+    client = _client(fake)
+    assert client.albums.save_albums(_ids(41)) == []
+    assert client.albums.delete_saved_albums(_ids(41)) == ["album00040"]
+    assert sorted(sent) == sorted(
+        [("PUT", 20), ("PUT", 20), ("PUT", 1), ("DELETE", 20), ("DELETE", 20), ("DELETE", 1)]
+    )
+
+
+def test_raising_chunk_is_reported_and_others_still_written():
+    written = []
+
+    def fake(method, endpoint, feature=None, json=None, **kwargs):
+        if json["ids"][0] == "album00020":
+            raise requests.ConnectionError("connection reset")
+        written.extend(json["ids"])
+        return True
+
+    failed = _client(fake).albums.save_albums(_ids(45))
+
+    assert failed == _ids(45)[20:40]
+    assert sorted(written) == _ids(45)[:20] + _ids(45)[40:]
@@ -0,0 +1,84 @@
+import asyncio
+import io
+import json
+import sys
+import threading
+import time
+
+from mcp_spotify_player.mcp_stdio_server import MCPServer
+
+
+def _call(request_id, name):
+    return json.dumps(
+        {
+            "jsonrpc": "2.0",
+            "id": request_id,
+            "method": "tools/call",
+            "params": {"name": name, "arguments": {}},
+        }
+    )
+
+
+def _run(server, lines, monkeypatch, max_concurrency=None):
+    stdout = io.StringIO()
+    monkeypatch.setattr(sys, "stdin", io.StringIO("\n".join(lines) + "\n"))
+    monkeypatch.setattr(sys, "stdout", stdout)
+    asyncio.run(server.run_async(max_concurrency))
+    return [json.loads(line) for line in stdout.getvalue().splitlines()]
+
+
+def test_fast_call_is_not_blocked_by_slow_call(monkeypatch):
+    server = MCPServer()
+    server.TOOL_HANDLERS["skip_next"] = lambda: (
+        time.sleep(0.3) or {"success": True, "message": "slow"}
+    )
+    server.TOOL_HANDLERS["pause_music"] = lambda: {"success": True, "message": "fast"}
+
+    responses = _run(
+        server,
+        [_call(1, "skip_next"), _call(2, "pause_music")],
+        monkeypatch,
+        max_concurrency=2,
+    )
+
+    assert [r["id"] for r in responses] == [2, 1]
+    texts = {r["id"]: r["result"]["content"][0]["text"] for r in responses}
+    assert texts == {1: "slow", 2: "fast"}
+
+
+def test_concurrency_limit_is_respected(monkeypatch):
+    server = MCPServer()
+    active = {"now": 0, "peak": 0}
+    lock = threading.Lock()
+
+    def handler():
+        with lock:
+            active["now"] += 1
+            active["peak"] = max(active["peak"], active["now"])
+        time.sleep(0.05)
+        with lock:
+            active["now"] -= 1
+        return {"success": True, "message": "ok"}
+
+    server.TOOL_HANDLERS["pause_music"] = handler
+    lines = [_call(i, "pause_music") for i in range(6)]
+
+    responses = _run(server, lines, monkeypatch, max_concurrency=2)
+
+    assert sorted(r["id"] for r in responses) == list(range(6))
+    assert active["peak"] == 2
+
+
+def test_non_tool_requests_and_bad_lines(monkeypatch):
+    server = MCPServer()
+    lines = [
+        "not json",
+        json.dumps({"jsonrpc": "2.0", "id": 1, "method": "tools/list"}),
+        json.dumps({"jsonrpc": "2.0", "id": 2, "method": "prompts/list"}),
+    ]
+
+    responses = _run(server, lines, monkeypatch)
+
+    assert responses[0]["id"] == 1
+    assert "tools" in responses[0]["result"]
+    assert responses[1]["error"]["code"] == -32601
@@ -0,0 +1,156 @@
+import asyncio
+import time
+
+import httpx
+import pytest
+
+import mcp_spotify_player.http_pool as http_pool_module
+from mcp_spotify.auth.manager import TokenManager
+from mcp_spotify.auth.tokens import REQUIRED_SCOPES, Tokens
+from mcp_spotify.errors import NoActiveDeviceError, PremiumRequiredError
+from mcp_spotify_player.async_spotify_client import AsyncSpotifyClient
+from mcp_spotify_player.http_pool import HttpPool
+from mcp_spotify_player.rate_limiter import RateLimiter
+
+
+def _tokens(access: str = "a") -> Tokens:
+    return Tokens(access, "r", int(time.time()) + 3600, scopes=REQUIRED_SCOPES["playback"])
+
+
+def _client(handler, tokens=None, **kwargs) -> AsyncSpotifyClient:
+    tokens = tokens or _tokens()
+    http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    kwargs.setdefault("rate_limiter", RateLimiter())
+    if "token_manager" in kwargs:
+        return AsyncSpotifyClient(http_client=http, **kwargs)
+    return AsyncSpotifyClient(lambda: tokens, http_client=http, **kwargs)
+
+
+def test_get_request_returns_json():
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append((request.method, request.url.path, request.headers["Authorization"]))
+        return httpx.Response(200, json={"id": "album1"})
+
+    async def main():
+        async with _client(handler) as client:
+            return await client.albums.get_album("album1")
+
+    assert asyncio.run(main()) == {"id": "album1"}
+    assert seen == [("GET", "/v1/albums/album1", "Bearer a")]
+
+
+def test_concurrent_requests_share_one_client():
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"id": request.url.path.rsplit("/", 1)[-1]})
+
+    async def main():
+        async with _client(handler) as client:
+            http = client.http
+            results = await asyncio.gather(
+                *(client.artists.get_artist(f"artist{i}") for i in range(5))
+            )
+            assert client.http is http
+            return results
+
+    assert [r["id"] for r in asyncio.run(main())] == [f"artist{i}" for i in range(5)]
+
+
+def test_clients_share_the_pool_client_of_their_loop():
+    pool = HttpPool()
+
+    async def main():
+        first = AsyncSpotifyClient(lambda: _tokens(), http_pool=pool)
+        second = AsyncSpotifyClient(lambda: _tokens(), http_pool=pool)
+        try:
+            return first.http, second.http
+        finally:
+            await pool.aclose()
+
+    first, second = asyncio.run(main())
+    assert first is second
+    assert first.is_closed
+
+
+def test_401_refreshes_once_through_the_token_manager():
+    auth_headers = []
+    refreshes = []
+
+    def refresher(tokens: Tokens) -> Tokens:
+        refreshes.append(tokens.access_token)
+        return _tokens("new")
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        auth_headers.append(request.headers["Authorization"])
+        if request.headers["Authorization"] == "Bearer old":
+            return httpx.Response(401)
+        return httpx.Response(200, json={"ok": True})
+
+    manager = TokenManager(_tokens("old"), refresher)
+
+    async def main():
+        async with _client(handler, token_manager=manager) as client:
+            return await asyncio.gather(
+                *(client.albums.get_album(f"album{i}") for i in range(4))
+            )
+
+    assert asyncio.run(main()) == [{"ok": True}] * 4
+    assert refreshes == ["old"]
+    assert auth_headers.count("Bearer new") == 4
+
+
+def test_429_is_retried_through_the_shared_rate_limiter():
+    limiter = RateLimiter()
+    replies = [
+        httpx.Response(429, headers={"Retry-After": "0.05"}, json={"error": {"status": 429}}),
+        httpx.Response(200, json={"ok": True}),
+    ]
+
+    async def main():
+        async with _client(lambda request: replies.pop(0), rate_limiter=limiter) as client:
+            return await client.albums.get_album("album1")
+
+    assert asyncio.run(main()) == {"ok": True}
+    assert limiter.stats()["throttled"] == 1
+
+
+def test_premium_required_mapping():
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(403, json={"error": {"status": 403, "reason": "PREMIUM_REQUIRED"}})
+
+    async def main():
+        async with _client(handler) as client:
+            await client.playback.play()
+
+    with pytest.raises(PremiumRequiredError):
+        asyncio.run(main())
+
+
+def test_no_active_device_mapping():
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(404, json={"error": {"status": 404, "message": "No active device"}})
+
+    async def main():
+        async with _client(handler) as client:
+            await client.playback.pause()
+
+    with pytest.raises(NoActiveDeviceError):
+        asyncio.run(main())
+
+
+def test_pool_client_enables_http2(monkeypatch: pytest.MonkeyPatch):
+    created = {}
+
+    class RecordingClient:
+        def __init__(self, **kwargs):
+            created.update(kwargs)
+
+    monkeypatch.setattr(http_pool_module, "_http2_available", lambda: True)
+    monkeypatch.setattr(httpx, "AsyncClient", RecordingClient)
+
+    async def main():
+        return AsyncSpotifyClient(lambda: _tokens(), http_pool=HttpPool()).http
+
+    assert isinstance(asyncio.run(main()), RecordingClient)
+    assert created["http2"] is True
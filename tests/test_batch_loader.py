@@ -0,0 +1,198 @@
+import json
+import threading
+import time
+
+import pytest
+import requests
+
+from mcp_spotify.auth.tokens import Tokens
+from mcp_spotify.errors import DeadlineExceededError
+from mcp_spotify_player.batch_loader import BatchLoader
+from mcp_spotify_player.catalog_cache import CatalogCache
+from mcp_spotify_player.config import Config
+from mcp_spotify_player.mcp_stdio_server import MCPServer
+from mcp_spotify_player.spotify_client import SpotifyClient
+from mcp_spotify_player.timeouts import remaining, tool_deadline
+
+API = Config.SPOTIFY_API_BASE
+
+
+class DummyResponse:
+    status_code = 200
+    headers = {}
+    text = "x"
+
+    def __init__(self, body):
+        self._body = body
+        self.content = json.dumps(body).encode()
+
+    def json(self):
+        return self._body
+
+
+def _upstream(monkeypatch, bad_ids=()):
+    sent = []
+
+    def fake_request(self, method, url, headers=None, params=None, **kwargs):
+        sent.append((url, params))
+        kind = url[len(API) + 1:].split("/")[0]
+        if params and "ids" in params:
+            ids = params["ids"].split(",")
+            if any(i in bad_ids for i in ids):
+                return DummyResponse({"error": {"status": 400, "message": "invalid id"}})
+            return DummyResponse({kind: [{"id": i, "name": f"name-{i}"} for i in ids]})
+        return DummyResponse({"id": url.rsplit("/", 1)[-1], "name": "single"})
+
+    monkeypatch.setattr(requests.Session, "request", fake_request)
+    return sent
+
+
+def _client() -> SpotifyClient:
+    tokens = Tokens("access", "refresh", int(time.time()) + 3600)
+    return SpotifyClient(lambda: tokens, catalog_cache=CatalogCache())
+
+
+def _together(ids, fn):
+    results = {}
+    barrier = threading.Barrier(len(ids))
+
+    def worker(spotify_id):
+        barrier.wait()
+        results[spotify_id] = fn(spotify_id)
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in ids]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+def test_concurrent_get_album_calls_become_one_multi_get(monkeypatch):
+    monkeypatch.setattr(Config, "BATCH_WINDOW_MS", 50)
+    sent = _upstream(monkeypatch)
+    client = _client()
+    ids = [f"album{i}" for i in range(5)]
+
+    results = _together(ids, client.albums.get_album)
+
+    assert len(sent) == 1
+    assert sent[0][0] == f"{API}/albums"
+    assert sorted(sent[0][1]["ids"].split(",")) == ids
+    assert all(results[i] == {"id": i, "name": f"name-{i}"} for i in ids)
+
+
+def test_batches_respect_multi_get_limit(monkeypatch):
+    monkeypatch.setattr(Config, "BATCH_WINDOW_MS", 50)
+    sent = _upstream(monkeypatch)
+    client = _client()
+    ids = [f"album{i}" for i in range(25)]
+
+    _together(ids, client.albums.get_album)
+
+    # A window that closes with one ID goes to the single-ID endpoint
+    sizes = [len(params["ids"].split(",")) if params else 1 for _, params in sent]
+    assert sum(sizes) == 25
+    assert max(sizes) <= 20
+
+
+def test_single_lookup_uses_single_endpoint(monkeypatch):
+    sent = _upstream(monkeypatch)
+    result = _client().artists.get_artist("artist1")
+
+    assert sent == [(f"{API}/artists/artist1", None)]
+    assert result == {"id": "artist1", "name": "single"}
+
+
+def test_failed_multi_get_falls_back_to_single_lookups(monkeypatch):
+    monkeypatch.setattr(Config, "BATCH_WINDOW_MS", 50)
+    sent = _upstream(monkeypatch, bad_ids={"bad"})
+    client = _client()
+
+    results = _together(["good", "bad"], client.artists.get_artist)
+
+    assert len(sent) == 3
+    assert results["good"] == {"id": "good", "name": "single"}
+
+
+def test_loader_deduplicates_and_propagates_errors():
+    calls = []
+
+    def load_many(ids):
+        calls.append(list(ids))
+        if "boom" in ids:
+            raise RuntimeError("boom")
+        return {i: i.upper() for i in ids}
+
+    loader = BatchLoader(load_many, max_batch=10, window=0.05)
+    results = _together(["a", "b"], loader.load)
+    assert results == {"a": "A", "b": "B"}
+    assert len(calls) == 1
+
+    errors = []
+    try:
+        loader.load("boom")
+    except RuntimeError as exc:
+        errors.append(exc)
+    assert errors
+
+
+def test_batch_runs_under_the_latest_caller_deadline():
+    seen = []
+
+    def load_many(ids):
+        seen.append(remaining())
+        return {i: i.upper() for i in ids}
+
+    loader = BatchLoader(load_many, max_batch=10, window=0.2)
+    results = {}
+
+    def call(key, seconds):
+        with tool_deadline(seconds):
+            results[key] = loader.load(key)
+
+    leader = threading.Thread(target=call, args=("a", 0.5))
+    follower = threading.Thread(target=call, args=("b", 30))
+    leader.start()
+    time.sleep(0.02)
+    follower.start()
+    leader.join()
+    follower.join()
+
+    assert results == {"a": "A", "b": "B"}
+    assert len(seen) == 1 and seen[0] > 10
+
+
+def test_waiter_stops_at_its_own_deadline():
+    release = threading.Event()
+
+    def load_many(ids):
+        release.wait(5)
+        return {i: i.upper() for i in ids}
+
+    loader = BatchLoader(load_many, max_batch=10, window=0.01)
+    leader = threading.Thread(target=loader.load, args=("a",))
+    leader.start()
+    time.sleep(0.005)
+    try:
+        with tool_deadline(0.1), pytest.raises(DeadlineExceededError):
+            loader.load("a")
+    finally:
+        release.set()
+        leader.join()
+
+
+def test_batched_tools_call_makes_one_request(monkeypatch):
+    monkeypatch.setattr(Config, "BATCH_WINDOW_MS", 50)
+    monkeypatch.setattr(Config, "CACHE_ENABLED", False)
+    sent = _upstream(monkeypatch)
+    server = MCPServer()
+    ids = ["0OdUWJ0sBjDrqHygGUXeC1", "0OdUWJ0sBjDrqHygGUXeC2", "0OdUWJ0sBjDrqHygGUXeC3"]
+    calls = [{"name": "get_artist", "arguments": {"artist_id": i}} for i in ids]
+
+    results = server._execute_calls(calls)
+
+    assert len(results) == 3
+    assert len(sent) == 1
+    diagnose = server.execute_tool("diagnose", {})
+    assert "batch_loader: album=0/0 artist=3/1" in diagnose
@@ -0,0 +1,111 @@
+import threading
+import time
+
+from mcp_spotify.errors import NoActiveDeviceError
+from mcp_spotify_player.mcp_stdio_server import MCPServer
+from mcp_spotify_player.timeouts import remaining
+
+
+def _capture(server):
+    sent = []
+    server.send_response = sent.append
+    return sent
+
+
+def test_batch_runs_concurrently_and_keeps_order():
+    server = MCPServer()
+    sent = _capture(server)
+    barrier = threading.Barrier(3, timeout=2)
+
+    def get_album(album_id):
+        barrier.wait()  # only passes if all three calls run at once
+        time.sleep(0.01 * int(album_id[-1]))
+        return {"success": True, "message": album_id}
+
+    server.TOOL_HANDLERS["get_album"] = get_album
+    server.RESULT_FORMATTERS.pop("get_album", None)
+    calls = [
+        {"name": "get_album", "arguments": {"album_id": f"album00000{i}"}}
+        for i in (3, 1, 2)
+    ]
+
+    server.handle_tools_call(1, {"calls": calls})
+
+    results = sent[0]["result"]["calls"]
+    assert [r["content"][0]["text"] for r in results] == [
+        "album000003",
+        "album000001",
+        "album000002",
+    ]
+
+
+def test_batch_keeps_per_call_user_errors():
+    server = MCPServer()
+    sent = _capture(server)
+
+    def pause_music():
+        raise NoActiveDeviceError("No active device. Open Spotify on any device.")
+
+    server.TOOL_HANDLERS["pause_music"] = pause_music
+    server.TOOL_HANDLERS["skip_next"] = lambda: {"success": True, "message": "Skipped"}
+
+    server.handle_tools_call(
+        1, {"calls": [{"name": "pause_music"}, {"name": "skip_next"}]}
+    )
+
+    texts = [r["content"][0]["text"] for r in sent[0]["result"]["calls"]]
+    assert texts == ["No active device. Open Spotify on any device.", "Skipped"]
+
+
+def test_batch_deadline(monkeypatch):
+    server = MCPServer()
+    sent = _capture(server)
+    monkeypatch.setattr(server.config, "MCP_BATCH_TIMEOUT", 0.1)
+    release = threading.Event()
+
+    def slow():
+        release.wait(2)
+        return {"success": True, "message": "late"}
+
+    server.TOOL_HANDLERS["skip_next"] = slow
+    server.TOOL_HANDLERS["pause_music"] = lambda: {"success": True, "message": "paused"}
+
+    started = time.monotonic()
+    server.handle_tools_call(
+        1, {"calls": [{"name": "skip_next"}, {"name": "pause_music"}]}
+    )
+    elapsed = time.monotonic() - started
+    release.set()
+
+    texts = [r["content"][0]["text"] for r in sent[0]["result"]["calls"]]
+    assert texts[0].startswith("Error: batch deadline")
+    assert texts[0].endswith("result unknown, the call may still apply")
+    assert texts[1] == "paused"
+    assert elapsed < 1
+
+
+def test_batch_deadline_reaches_the_calls_and_cancels_queued_ones(monkeypatch):
+    server = MCPServer()
+    sent = _capture(server)
+    monkeypatch.setattr(server.config, "MCP_BATCH_TIMEOUT", 0.2)
+    monkeypatch.setattr(server.config, "MCP_BATCH_WORKERS", 1)
+    release = threading.Event()
+    budgets = []
+
+    def slow():
+        budgets.append(remaining())
+        release.wait(2)
+        return {"success": True, "message": "late"}
+
+    server.TOOL_HANDLERS["skip_next"] = slow
+    server.TOOL_HANDLERS["pause_music"] = lambda: {"success": True, "message": "paused"}
+
+    server.handle_tools_call(
+        1, {"calls": [{"name": "skip_next"}, {"name": "pause_music"}]}
+    )
+    release.set()
+
+    texts = [r["content"][0]["text"] for r in sent[0]["result"]["calls"]]
+    assert budgets[0] <= 0.2
+    assert texts[0].endswith("may still apply")
+    assert texts[1].endswith("the call was not run")
@@ -0,0 +1,123 @@
+import json
+import time
+
+import requests
+
+from mcp_spotify.auth.tokens import Tokens
+from mcp_spotify_player.catalog_cache import MISS, CatalogCache
+from mcp_spotify_player.mcp_stdio_server import MCPServer
+from mcp_spotify_player.spotify_client import SpotifyClient
+
+
+class DummyResponse:
+    status_code = 200
+    headers = {}
+    text = "x"
+
+    def __init__(self, body):
+        self._body = body
+        self.content = json.dumps(body).encode()
+
+    def json(self):
+        return self._body
+
+
+def _client(cache: CatalogCache) -> SpotifyClient:
+    tokens = Tokens("access", "refresh", int(time.time()) + 3600)
+    return SpotifyClient(lambda: tokens, catalog_cache=cache)
+
+
+def _patch(monkeypatch):
+    sent = []
+
+    def fake_request(self, method, url, headers=None, params=None, **kwargs):
+        sent.append((url, params))
+        if url.endswith("/missing"):
+            return DummyResponse({"error": {"status": 404}})
+        return DummyResponse({"id": url.rsplit("/", 1)[-1], "params": params})
+
+    monkeypatch.setattr(requests.Session, "request", fake_request)
+    return sent
+
+
+def test_catalog_reads_are_served_from_memory(monkeypatch):
+    sent = _patch(monkeypatch)
+    cache = CatalogCache()
+    client = _client(cache)
+
+    first = client.albums.get_album("a1")
+    assert client.albums.get_album("a1") == first
+    client.artists.get_artist("r1")
+    client.artists.get_artist("r1")
+
+    assert len(sent) == 2
+    assert cache.stats()["hits"] == 2
+    assert cache.stats()["misses"] == 2
+
+
+def test_keys_include_market_and_params(monkeypatch):
+    sent = _patch(monkeypatch)
+    client = _client(CatalogCache())
+
+    client.artists.get_artist_top_tracks("r1", market="US")
+    client.artists.get_artist_top_tracks("r1", market="ES")
+    client.artists.get_artist_top_tracks("r1", market="US")
+    client.albums.get_album_tracks("a1", limit=5)
+    client.albums.get_album_tracks("a1", limit=10)
+
+    assert [params for _, params in sent] == [
+        {"market": "US"},
+        {"market": "ES"},
+        {"limit": 5},
+        {"limit": 10},
+    ]
+
+
+def test_errors_are_not_cached(monkeypatch):
+    sent = _patch(monkeypatch)
+    client = _client(CatalogCache())
+
+    client.albums.get_album("missing")
+    client.albums.get_album("missing")
+
+    assert len(sent) == 2
+
+
+def test_entries_expire_after_ttl(monkeypatch):
+    now = {"value": 100.0}
+    monkeypatch.setattr(
+        "mcp_spotify_player.catalog_cache.time.monotonic", lambda: now["value"]
+    )
+    cache = CatalogCache(ttls={"artist": 10})
+    key = cache.key("artist", "/artists/r1")
+    cache.put(key, {"id": "r1"})
+
+    assert cache.get(key) == {"id": "r1"}
+    now["value"] += 11
+    assert cache.get(key) is MISS
+    assert cache.stats()["entries"] == 0
+
+
+def test_lru_eviction_by_entries_and_bytes():
+    cache = CatalogCache(max_entries=2, max_bytes=10_000)
+    keys = [cache.key("album", f"/albums/{i}") for i in range(3)]
+    cache.put(keys[0], {"id": 0})
+    cache.put(keys[1], {"id": 1})
+    cache.get(keys[0])
+    cache.put(keys[2], {"id": 2})
+
+    assert cache.get(keys[1]) is MISS
+    assert cache.get(keys[0]) == {"id": 0}
+
+    small = CatalogCache(max_entries=100, max_bytes=40)
+    big = {"name": "x" * 20}
+    small.put(keys[0], big)
+    small.put(keys[1], big)
+    assert small.stats()["entries"] == 1
+    assert small.stats()["bytes"] <= 40
+    assert small.stats()["evictions"] == 1
+
+
+def test_diagnose_reports_cache_counters():
+    result = MCPServer().execute_tool("diagnose", {})
+    assert any(line.startswith("catalog_cache: entries=") for line in result.splitlines())
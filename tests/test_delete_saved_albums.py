@@ -10,7 +10,7 @@ from mcp_spotify_player.mcp_stdio_server import MCPServer
 def test_spotify_client_delete_saved_albums():
     client = SpotifyClient()
     with patch.object(client, "_make_request", return_value=True) as mock_request:
-        assert client.delete_saved_albums(["album1", "album2"]) is True
+        assert client.delete_saved_albums(["album1", "album2"]) == []
         mock_request.assert_called_once_with(
             "DELETE",
             "/me/albums",
@@ -22,7 +22,7 @@ def test_spotify_client_delete_saved_albums():
 def test_album_controller_delete_saved_albums():
     controller = SpotifyController(lambda: None)
     with patch.object(
-        controller.albums_client, "delete_saved_albums", return_value=True
+        controller.albums_client, "delete_saved_albums", return_value=[]
     ) as mock_delete:
         result = controller.delete_saved_albums(["1234567890a"])
         assert result["success"] is True
@@ -0,0 +1,126 @@
+import json
+import os
+import sqlite3
+import time
+
+import requests
+
+from mcp_spotify.auth.tokens import Tokens
+from mcp_spotify_player.catalog_cache import MISS, CatalogCache
+from mcp_spotify_player.disk_cache import DiskCache, spotify_id_for
+from mcp_spotify_player.spotify_client import SpotifyClient
+
+
+class DummyResponse:
+    status_code = 200
+    headers = {}
+    text = "x"
+
+    def __init__(self, body):
+        self._body = body
+        self.content = json.dumps(body).encode()
+
+    def json(self):
+        return self._body
+
+
+def _client(cache: CatalogCache) -> SpotifyClient:
+    tokens = Tokens("access", "refresh", int(time.time()) + 3600)
+    return SpotifyClient(lambda: tokens, catalog_cache=cache)
+
+
+def test_warm_start_skips_network(tmp_path, monkeypatch):
+    path = tmp_path / "catalog_cache.sqlite3"
+    sent = []
+
+    def fake_request(self, method, url, headers=None, **kwargs):
+        sent.append(url)
+        return DummyResponse({"id": "a1", "name": "Album"})
+
+    monkeypatch.setattr(requests.Session, "request", fake_request)
+    first = DiskCache(path, max_bytes=1_000_000)
+    _client(CatalogCache(disk=first)).albums.get_album("a1")
+    first.close()
+
+    second = DiskCache(path, max_bytes=1_000_000)
+    cache = CatalogCache(disk=second)
+    assert _client(cache).albums.get_album("a1") == {"id": "a1", "name": "Album"}
+    assert len(sent) == 1
+    assert cache.stats()["disk_hits"] == 1
+    second.close()
+
+
+def test_database_uses_wal_and_compression(tmp_path):
+    path = tmp_path / "cache.sqlite3"
+    disk = DiskCache(path, max_bytes=1_000_000)
+    value = {"tracks": [{"name": "same track name"}] * 200}
+    disk.put(("album", "/albums/a1", ()), "a1", value, ttl=60)
+
+    conn = sqlite3.connect(path)
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    (size,) = conn.execute("SELECT size FROM catalog WHERE spotify_id = 'a1'").fetchone()
+    conn.close()
+    assert size < len(str(value)) / 10
+    disk.close()
+
+
+def test_entries_expire_individually(tmp_path, monkeypatch):
+    now = {"value": 1000.0}
+    monkeypatch.setattr("mcp_spotify_player.disk_cache.time.time", lambda: now["value"])
+    disk = DiskCache(tmp_path / "cache.sqlite3", max_bytes=1_000_000)
+    short, long = ("artist", "/artists/r1", ()), ("album", "/albums/a1", ())
+    disk.put(short, "r1", {"id": "r1"}, ttl=10)
+    disk.put(long, "a1", {"id": "a1"}, ttl=100)
+
+    now["value"] += 50
+    assert disk.get(short, "r1") is None
+    assert disk.get(long, "a1") == ({"id": "a1"}, 1100.0)
+    disk.close()
+
+
+def test_pruned_by_size_oldest_first(tmp_path):
+    disk = DiskCache(tmp_path / "cache.sqlite3", max_bytes=300)
+    keys = [("album", f"/albums/a{i}", ()) for i in range(5)]
+    for i, key in enumerate(keys):
+        disk.put(key, f"a{i}", {"id": f"a{i}", "blob": os.urandom(100).hex()}, ttl=60)
+        time.sleep(0.01)
+
+    assert disk.size() <= 300
+    assert disk.get(keys[0], "a0") is None
+    assert disk.get(keys[-1], "a4") is not None
+    disk.close()
+
+
+def test_memory_miss_falls_back_to_disk(tmp_path):
+    disk = DiskCache(tmp_path / "cache.sqlite3", max_bytes=1_000_000)
+    writer = CatalogCache(disk=disk)
+    key = writer.key("albums", "/albums", {"ids": "a1,a2"})
+    writer.put(key, {"albums": []})
+
+    reader = CatalogCache(disk=disk)
+    assert reader.get(key) == {"albums": []}
+    assert reader.stats()["entries"] == 1
+    assert reader.get(reader.key("albums", "/albums", {"ids": "a3"})) is MISS
+    disk.close()
+
+
+def test_spotify_id_for_endpoints():
+    assert spotify_id_for("/albums/a1/tracks") == "a1"
+    assert spotify_id_for("/artists/r1") == "r1"
+    assert spotify_id_for("/albums", {"ids": "a1,a2"}) == "a1,a2"
+
+
+def test_unreadable_row_is_deleted_and_not_counted_as_hit(tmp_path):
+    path = tmp_path / "cache.sqlite3"
+    disk = DiskCache(path, max_bytes=1_000_000)
+    key = ("album", "/albums/a1", ())
+    disk.put(key, "a1", {"id": "a1"}, ttl=60)
+    disk._conn.execute("UPDATE catalog SET value = ? WHERE spotify_id = 'a1'", (b"garbage",))
+    disk._conn.commit()
+
+    assert disk.get(key, "a1") is None
+    assert disk.hits == 0
+    (rows,) = disk._conn.execute("SELECT COUNT(*) FROM catalog").fetchone()
+    assert rows == 0
+    assert disk.get(key, "a1") is None
+    disk.close()
@@ -18,6 +18,7 @@ class DummyResponse:
         self.status_code = status_code
         self._data = data or {}
         self.text = json.dumps(self._data) if self._data else ""
+        self.content = self.text.encode()
 
     def json(self):
         return self._data
@@ -45,7 +46,7 @@ def test_premium_required_mapping(monkeypatch: pytest.MonkeyPatch):
         403,
         {"error": {"status": 403, "reason": "PREMIUM_REQUIRED"}},
     )
-    monkeypatch.setattr(requests, "request", lambda *args, **kwargs: response)
+    monkeypatch.setattr(requests.Session, "request", lambda *args, **kwargs: response)
     client = SpotifyClient(lambda: tokens)
     with pytest.raises(PremiumRequiredError):
         client.playback.play()
@@ -57,7 +58,7 @@ def test_missing_scope_mapping(monkeypatch: pytest.MonkeyPatch):
         403,
         {"error": {"status": 403, "reason": "MISSING_SCOPE"}},
     )
-    monkeypatch.setattr(requests, "request", lambda *args, **kwargs: response)
+    monkeypatch.setattr(requests.Session, "request", lambda *args, **kwargs: response)
     client = SpotifyClient(lambda: tokens)
     with pytest.raises(MissingScopesError) as exc:
         client.playback.play()
@@ -70,7 +71,7 @@ def test_no_active_device_mapping(monkeypatch: pytest.MonkeyPatch):
         404,
         {"error": {"status": 404, "message": "No active device"}},
     )
-    monkeypatch.setattr(requests, "request", lambda *args, **kwargs: response)
+    monkeypatch.setattr(requests.Session, "request", lambda *args, **kwargs: response)
     client = SpotifyClient(lambda: tokens)
     with pytest.raises(NoActiveDeviceError):
         client.playback.play()
@@ -0,0 +1,185 @@
+import json
+import time
+
+import requests
+
+from mcp_spotify.auth.tokens import Tokens
+from mcp_spotify_player.http_cache import HttpCache, parse_cache_control
+from mcp_spotify_player.mcp_stdio_server import MCPServer
+from mcp_spotify_player.spotify_client import SpotifyClient
+
+PLAYLIST = {"items": [{"track": {"name": f"Song {i}"}} for i in range(50)]}
+
+
+class DummyResponse:
+    def __init__(self, status_code, body=None, headers=None):
+        self.status_code = status_code
+        self._body = body
+        self.content = json.dumps(body).encode() if body is not None else b""
+        self.text = self.content.decode()
+        self.headers = headers or {}
+
+    def json(self):
+        if self._body is None:
+            raise ValueError("no body")
+        return self._body
+
+
+def _client(cache: HttpCache) -> SpotifyClient:
+    tokens = Tokens("access", "refresh", int(time.time()) + 3600)
+    return SpotifyClient(lambda: tokens, http_cache=cache)
+
+
+def _patch(monkeypatch, responder):
+    sent = []
+
+    def fake_request(self, method, url, headers=None, **kwargs):
+        sent.append(dict(headers))
+        return responder(headers)
+
+    monkeypatch.setattr(requests.Session, "request", fake_request)
+    return sent
+
+
+def test_etag_revalidation_serves_stored_body(monkeypatch):
+    def responder(headers):
+        if headers.get("If-None-Match") == '"v1"':
+            return DummyResponse(304, headers={"ETag": '"v1"'})
+        return DummyResponse(200, PLAYLIST, {"ETag": '"v1"', "Cache-Control": "max-age=0"})
+
+    sent = _patch(monkeypatch, responder)
+    cache = HttpCache()
+    client = _client(cache)
+
+    first = client._make_request("GET", "/playlists/p1")
+    second = client._make_request("GET", "/playlists/p1")
+
+    assert first == second == PLAYLIST
+    assert "If-None-Match" not in sent[0]
+    assert sent[1]["If-None-Match"] == '"v1"'
+    stats = cache.stats()
+    assert stats["revalidated"] == 1
+    assert stats["bytes_saved"] == len(json.dumps(PLAYLIST))
+
+
+def test_max_age_serves_without_request(monkeypatch):
+    sent = _patch(
+        monkeypatch,
+        lambda headers: DummyResponse(200, {"id": "a1"}, {"cache-control": "private, max-age=60"}),
+    )
+    cache = HttpCache()
+    client = _client(cache)
+
+    client._make_request("GET", "/albums/a1")
+    assert client._make_request("GET", "/albums/a1") == {"id": "a1"}
+    assert len(sent) == 1
+    assert cache.stats()["fresh_hits"] == 1
+
+
+def test_no_store_is_never_cached(monkeypatch):
+    sent = _patch(
+        monkeypatch,
+        lambda headers: DummyResponse(200, {"ok": True}, {"ETag": '"x"', "Cache-Control": "no-store"}),
+    )
+    client = _client(HttpCache())
+
+    client._make_request("GET", "/albums/a1")
+    client._make_request("GET", "/albums/a1")
+
+    assert len(sent) == 2
+    assert all("If-None-Match" not in headers for headers in sent)
+
+
+def test_query_params_are_part_of_the_key(monkeypatch):
+    sent = _patch(
+        monkeypatch,
+        lambda headers: DummyResponse(200, {"ok": True}, {"Cache-Control": "max-age=60"}),
+    )
+    client = _client(HttpCache())
+
+    client._make_request("GET", "/artists/a1/albums", params={"limit": 5})
+    client._make_request("GET", "/artists/a1/albums", params={"limit": 10})
+    client._make_request("GET", "/artists/a1/albums", params={"limit": 5})
+
+    assert len(sent) == 2
+
+
+def test_only_catalog_and_playlist_metadata_are_cached(monkeypatch):
+    sent = _patch(
+        monkeypatch,
+        lambda headers: DummyResponse(200, PLAYLIST, {"Cache-Control": "max-age=60"}),
+    )
+    cache = HttpCache()
+    client = _client(cache)
+
+    for endpoint in ("/me", "/me/player", "/me/albums", "/playlists/p1/tracks"):
+        client._make_request("GET", endpoint)
+        client._make_request("GET", endpoint)
+
+    assert len(sent) == 8
+    assert cache.stats()["entries"] == 0
+
+
+def test_write_evicts_cached_reads_of_the_resource(monkeypatch):
+    def responder(headers):
+        return DummyResponse(200, {"name": "Old"}, {"Cache-Control": "max-age=60"})
+
+    sent = _patch(monkeypatch, responder)
+    cache = HttpCache()
+    client = _client(cache)
+
+    client._make_request("GET", "/playlists/p1")
+    client._make_request("GET", "/playlists/p2")
+    client.playlists.rename_playlist("p1", "New")
+    client._make_request("GET", "/playlists/p1")
+    client._make_request("GET", "/playlists/p2")
+
+    assert len(sent) == 4
+    assert cache.stats()["invalidated"] == 1
+
+
+def test_hits_return_copies(monkeypatch):
+    _patch(
+        monkeypatch,
+        lambda headers: DummyResponse(200, {"tracks": ["t1"]}, {"Cache-Control": "max-age=60"}),
+    )
+    client = _client(HttpCache())
+
+    client._make_request("GET", "/albums/a1")["tracks"].append("t2")
+    client._make_request("GET", "/albums/a1")["tracks"].append("t3")
+
+    assert client._make_request("GET", "/albums/a1") == {"tracks": ["t1"]}
+
+
+def test_304_after_eviction_refetches(monkeypatch):
+    class EvictingCache(HttpCache):
+        def not_modified(self, key, response):
+            self._entries.clear()
+            return super().not_modified(key, response)
+
+    replies = [
+        DummyResponse(200, {"v": 1}, {"ETag": '"a"'}),
+        DummyResponse(304),
+        DummyResponse(200, {"v": 2}, {"ETag": '"b"'}),
+    ]
+    sent = _patch(monkeypatch, lambda headers: replies.pop(0))
+    client = _client(EvictingCache())
+
+    client._make_request("GET", "/playlists/p1")
+
+    assert client._make_request("GET", "/playlists/p1") == {"v": 2}
+    assert sent[1]["If-None-Match"] == '"a"'
+    assert "If-None-Match" not in sent[2]
+
+
+def test_parse_cache_control():
+    assert parse_cache_control('public, max-age=300, no-cache="x"') == {
+        "public": None,
+        "max-age": "300",
+        "no-cache": "x",
+    }
+
+
+def test_diagnose_reports_http_cache():
+    result = MCPServer().execute_tool("diagnose", {})
+    assert any(line.startswith("http_cache: entries=") for line in result.splitlines())
@@ -0,0 +1,113 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from mcp_spotify_player.http_pool import HttpPool, close_http_pool, get_http_pool
+from mcp_spotify_player.mcp_stdio_server import MCPServer
+from mcp_spotify_player.spotify_client import SpotifyClient
+
+
+class _KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):  # noqa: N802
+        body = b'{"ok": true}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args, **kwargs):
+        return
+
+
+@pytest.fixture
+def local_url():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _KeepAliveHandler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}/"
+    httpd.shutdown()
+    thread.join()
+
+
+def test_connections_are_reused(local_url):
+    pool = HttpPool(pool_size=2, idle_timeout=60)
+    for _ in range(3):
+        assert pool.request("GET", local_url).json() == {"ok": True}
+    stats = pool.stats()
+    assert stats["requests"] == 3
+    assert stats["opened"] == 1
+    assert stats["reused"] == 2
+    pool.close()
+
+
+def test_idle_connections_are_evicted(local_url, monkeypatch):
+    now = {"value": 1000.0}
+    monkeypatch.setattr(
+        "mcp_spotify_player.http_pool.time.monotonic", lambda: now["value"]
+    )
+    pool = HttpPool(idle_timeout=5)
+    pool.request("GET", local_url)
+    now["value"] += 10
+    pool.request("GET", local_url)
+    stats = pool.stats()
+    assert stats["evicted"] == 1
+    assert stats["opened"] == 2
+    pool.close()
+
+
+def test_session_is_not_evicted_while_a_request_is_in_flight(monkeypatch):
+    now = {"value": 1000.0}
+    monkeypatch.setattr(
+        "mcp_spotify_player.http_pool.time.monotonic", lambda: now["value"]
+    )
+    pool = HttpPool(idle_timeout=5)
+    started = threading.Event()
+    release = threading.Event()
+    closed = []
+
+    def slow_request(session, method, url, **kwargs):
+        started.set()
+        release.wait(5)
+        return "slow"
+
+    monkeypatch.setattr("requests.Session.request", slow_request)
+    session = pool.session
+    monkeypatch.setattr(session, "close", lambda: closed.append(True))
+    results = []
+    worker = threading.Thread(target=lambda: results.append(pool.request("GET", "http://x/")))
+    worker.start()
+    started.wait(5)
+    now["value"] += 60
+    assert pool.session is session
+    release.set()
+    worker.join()
+    assert results == ["slow"]
+    assert closed == []
+
+    # The idle period only starts once the slow request has finished
+    now["value"] += 4
+    assert pool.session is session
+    now["value"] += 10
+    assert pool.session is not session
+    assert closed == [True]
+    assert pool.stats()["evicted"] == 1
+
+
+def test_sub_clients_share_one_pool():
+    close_http_pool()
+    client = SpotifyClient()
+    other = SpotifyClient()
+    assert client.http is get_http_pool()
+    assert other.http is client.http
+    for sub in (client.playback, client.playlists, client.albums, client.artists):
+        assert sub.requester.http is client.http
+
+
+def test_diagnose_reports_pool_stats():
+    server = MCPServer()
+    result = server.execute_tool("diagnose", {})
+    assert any(line.startswith("http_pool: requests=") for line in result.splitlines())
@@ -0,0 +1,110 @@
+"""Import-time regression benchmark for server startup.
+
+Runs ``python -X importtime`` in a fresh interpreter and checks that
+importing the server module, and answering ``initialize`` and
+``tools/list``, loads none of the heavy dependencies. The import time is
+only reported, since it depends on the machine; run with ``-s`` to see it.
+"""
+
+import json
+import os
+import subprocess
+import sys
+import threading
+
+from mcp_spotify_player.spotify_controller import SpotifyController
+
+# Modules that must only load once a tool actually needs them
+DEFERRED = [
+    "asyncio",
+    "dotenv",
+    "httpx",
+    "pydantic",
+    "requests",
+    "sqlite3",
+    "mcp_spotify_player.mcp_models",
+    "mcp_spotify_player.spotify_client",
+    "mcp_spotify_player.playback_controller",
+    "mcp_spotify_player.playlist_controller",
+    "mcp_spotify_player.album_controller",
+    "mcp_spotify_player.artists_controller",
+]
+
+
+def _python(cwd, *args, stdin=""):
+    # The warm-up loads the Web API stack on purpose, in the background;
+    # an empty working directory keeps a developer's .env out of the picture
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path), MCP_WARMUP="False")
+    return subprocess.run(
+        [sys.executable, *args],
+        cwd=cwd,
+        input=stdin,
+        capture_output=True,
+        text=True,
+        env=env,
+        timeout=60,
+        check=True,
+    )
+
+
+def _import_times(stderr):
+    times = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def test_server_import_loads_no_deferred_modules(tmp_path):
+    result = _python(tmp_path, "-X", "importtime", "-c", "import mcp_spotify_player.mcp_stdio_server")
+    times = _import_times(result.stderr)
+
+    cumulative = times["mcp_spotify_player.mcp_stdio_server"]
+    print(f"\nmcp_stdio_server import: {cumulative / 1000:.1f} ms")
+    assert [name for name in DEFERRED if name in times] == []
+
+
+def test_initialize_and_tools_list_need_no_deferred_modules(tmp_path):
+    script = f"""
+import json, sys
+from mcp_spotify_player.mcp_stdio_server import MCPServer
+server = MCPServer()
+server.handle_request({{"jsonrpc": "2.0", "id": 1, "method": "initialize", "params": {{}}}})
+server.handle_request({{"jsonrpc": "2.0", "id": 2, "method": "tools/list"}})
+sys.stdout.flush()
+print(json.dumps([name for name in {DEFERRED!r} if name in sys.modules]))
+"""
+    result = _python(tmp_path, "-c", script)
+    lines = result.stdout.splitlines()
+
+    assert [json.loads(line)["id"] for line in lines[:2]] == [1, 2]
+    assert json.loads(lines[-1]) == []
+
+
+def test_dotenv_file_is_still_loaded(tmp_path, monkeypatch):
+    monkeypatch.delenv("MCP_SERVER_NAME", raising=False)
+    (tmp_path / ".env").write_text("MCP_SERVER_NAME=from-dotenv\n")
+    script = "from mcp_spotify_player.config import Config; print(Config.MCP_SERVER_NAME)"
+
+    assert _python(tmp_path, "-c", script).stdout.strip() == "from-dotenv"
+
+
+def test_concurrent_first_access_builds_one_client():
+    controller = SpotifyController(lambda: None)
+    barrier = threading.Barrier(8)
+    clients = []
+
+    def worker():
+        barrier.wait()
+        clients.append(controller.playback.client)
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len({id(client) for client in clients}) == 1
+    assert controller.client is clients[0]
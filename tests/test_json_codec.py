@@ -0,0 +1,65 @@
+import pytest
+
+from mcp_spotify.auth.tokens import Tokens
+from mcp_spotify_player import json_codec
+from mcp_spotify_player.http_pool import HttpPool
+from mcp_spotify_player.spotify_client import handle_response
+
+
+class BytesResponse:
+    def __init__(self, status_code, content):
+        self.status_code = status_code
+        self.content = content
+        self.headers = {}
+
+    @property
+    def text(self):
+        raise AssertionError("text must not be built for a byte body")
+
+    def json(self):
+        raise AssertionError("the body must be decoded only once")
+
+
+def _tokens():
+    return Tokens(access_token="a", refresh_token="r", expires_at=9999999999, scopes=set())
+
+
+@pytest.mark.parametrize("backend", ["orjson", None])
+def test_decode_reads_bytes_with_either_backend(monkeypatch, backend):
+    if backend is None:
+        monkeypatch.setattr(json_codec, "orjson", None)
+
+    response = BytesResponse(200, '{"items": [{"name": "Café"}]}'.encode())
+
+    assert json_codec.decode(response) == {"items": [{"name": "Café"}]}
+
+
+def test_handle_response_decodes_body_without_text():
+    response = BytesResponse(200, b'{"id": "abc"}')
+
+    assert handle_response(response, "GET", "/albums/abc", _tokens()) == {"id": "abc"}
+
+
+def test_handle_response_empty_body_is_success():
+    response = BytesResponse(204, b"")
+
+    assert handle_response(response, "PUT", "/me/player/pause", _tokens()) is True
+
+
+def test_handle_response_error_body_is_returned():
+    response = BytesResponse(404, b'{"error": {"status": 404, "message": "Not found"}}')
+
+    result = handle_response(response, "GET", "/albums/abc", _tokens())
+
+    assert result == {"error": {"status": 404, "message": "Not found"}}
+
+
+def test_pool_session_negotiates_compression():
+    pool = HttpPool()
+    try:
+        encoding = pool.session.headers["Accept-Encoding"]
+    finally:
+        pool.close()
+
+    assert encoding == json_codec.ACCEPT_ENCODING
+    assert "gzip" in encoding
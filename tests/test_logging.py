@@ -0,0 +1,51 @@
+import logging
+from logging.handlers import QueueHandler
+
+import mcp_logging
+from mcp_logging import Payload, PayloadSampler, get_logger, payload
+
+
+class Counting:
+    def __init__(self, text):
+        self.text = text
+        self.rendered = 0
+
+    def __str__(self):
+        self.rendered += 1
+        return self.text
+
+
+def _record(*args):
+    return logging.LogRecord("mcp", logging.INFO, __file__, 1, "msg %s", args, None)
+
+
+def test_payload_is_truncated_to_max_chars():
+    assert str(payload("x" * 50, max_chars=10)) == "x" * 10 + "... [40 more chars]"
+    assert str(payload("short", max_chars=10)) == "short"
+
+
+def test_payload_is_not_rendered_below_the_logger_level():
+    value = Counting("big")
+    logger = get_logger("mcp.test.lazy")
+    logger.setLevel(logging.INFO)
+
+    logger.debug("Sending response: %s", payload(value))
+
+    assert value.rendered == 0
+
+
+def test_sampler_only_drops_payload_records():
+    sampler = PayloadSampler(rate=0)
+
+    assert sampler.filter(_record("plain")) is True
+    assert sampler.filter(_record(Payload({"id": 1}))) is False
+    assert sampler.dropped == 1
+    assert PayloadSampler(rate=1).filter(_record(Payload({"id": 1}))) is True
+
+
+def test_records_go_through_a_background_queue():
+    root_handlers = logging.getLogger().handlers
+
+    assert any(isinstance(handler, QueueHandler) for handler in root_handlers)
+    assert mcp_logging._listener is not None
+    assert mcp_logging._listener._thread is not None
@@ -0,0 +1,145 @@
+import threading
+import time
+
+import pytest
+
+from mcp_spotify_player.catalog_cache import CatalogCache
+from mcp_spotify_player.mcp_stdio_server import MCPServer
+from mcp_spotify_player.paginator import collect, paginate
+from mcp_spotify_player.playback_controller import PlaybackController
+from mcp_spotify_player.spotify_client import SpotifyClient
+
+
+def _source(total, calls, delay=0.0):
+    lock = threading.Lock()
+    active = {"now": 0, "max": 0}
+
+    def fetch(offset, limit):
+        with lock:
+            calls.append((offset, limit))
+            active["now"] += 1
+            active["max"] = max(active["max"], active["now"])
+        time.sleep(delay)
+        with lock:
+            active["now"] -= 1
+        items = list(range(offset, min(offset + limit, total)))
+        return {"items": items, "total": total, "offset": offset, "limit": limit}
+
+    return fetch, active
+
+
+def test_paginate_fetches_nothing_until_iterated_and_stops_early():
+    calls = []
+    fetch, _ = _source(500, calls)
+
+    items = paginate(fetch, 50)
+    assert calls == []
+
+    for item in items:
+        if item == 10:
+            break
+    items.close()
+
+    assert calls == [(0, 50)]
+
+
+def test_paginate_prefetches_remaining_pages_concurrently_in_order():
+    calls = []
+    fetch, active = _source(430, calls, delay=0.01)
+
+    items = list(paginate(fetch, 50, prefetch=4))
+
+    assert items == list(range(430))
+    assert sorted(calls) == [(offset, 50) for offset in range(0, 400, 50)] + [(400, 30)]
+    assert active["max"] > 1
+
+
+def test_collect_truncates_to_limit_and_merges_pages():
+    calls = []
+    fetch, _ = _source(500, calls)
+
+    page = collect(fetch, 50, limit=120)
+
+    assert page["items"] == list(range(120))
+    assert page["total"] == 500
+    assert page["next"] is None
+    assert sorted(calls) == [(0, 50), (50, 50), (100, 20)]
+
+
+def test_collect_returns_first_page_error_unchanged():
+    error = {"error": {"status": 404, "message": "Not found"}}
+
+    assert collect(lambda offset, limit: error, 50, limit="all") is error
+
+
+def test_collect_follows_next_without_total():
+    pages = {
+        0: {"items": [1, 2], "next": "page2"},
+        2: {"items": [3, 4], "next": "page3"},
+        4: {"items": [5], "next": None},
+    }
+
+    page = collect(lambda offset, limit: pages[offset], 2, limit="all")
+
+    assert page["items"] == [1, 2, 3, 4, 5]
+
+
+def test_get_playlist_tracks_all_reads_every_page():
+    calls = []
+
+    def fake(method, endpoint, feature=None, params=None, **kwargs):
+        calls.append(params)
+        offset = params.get("offset", 0)
+        return {
+            "items": [{"n": n} for n in range(offset, min(offset + params["limit"], 250))],
+            "total": 250,
+        }
+
+    client = SpotifyClient(catalog_cache=CatalogCache())
+    client._make_request = fake
+
+    result = client.playlists.get_playlist_tracks("p1", limit="all")
+
+    assert [item["n"] for item in result["items"]] == list(range(250))
+    assert sorted(p["offset"] for p in calls) == [0, 100, 200]
+
+
+def test_play_music_finds_playlist_beyond_first_page():
+    requested = []
+
+    class DummyPlaylists:
+        def iter_user_playlists(self):
+            for n in range(200):
+                requested.append(n)
+                yield {"name": f"List {n}", "uri": f"spotify:playlist:{n}"}
+
+    class DummyPlayback:
+        def play(self, context_uri=None, uris=None):
+            self.context_uri = context_uri
+            return {}
+
+    playback = DummyPlayback()
+    client = type("Dummy", (), {"playback": playback, "playlists": DummyPlaylists()})()
+
+    result = PlaybackController(client).play_music(playlist_name="list 120")
+
+    assert result == {"success": True, "message": "Playing playlist: List 120"}
+    assert playback.context_uri == "spotify:playlist:120"
+    assert requested[-1] == 120
+
+
+@pytest.mark.parametrize("limit", [0, -1, "some", True])
+def test_page_limit_validator_rejects_invalid_values(limit):
+    with pytest.raises(ValueError):
+        MCPServer().TOOL_VALIDATORS["get_saved_albums"]({"limit": limit})
+
+
+def test_page_limit_validator_accepts_all_and_large_values():
+    server = MCPServer()
+    for limit in ("all", 500):
+        arguments = {"limit": limit}
+        server.TOOL_VALIDATORS["get_saved_albums"](arguments)
+        assert arguments["limit"] == limit
+    arguments = {}
+    server.TOOL_VALIDATORS["get_playlists"](arguments)
+    assert arguments["limit"] == 20
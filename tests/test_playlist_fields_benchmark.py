@@ -0,0 +1,205 @@
+"""Benchmark of the ``fields`` projection used for playlist tracks.
+
+Builds a realistic full playlist page, projects it the way the Web API does
+for :data:`PLAYLIST_TRACKS_FIELDS`, and compares payload size. The JSON decode
+timing is skipped unless ``MCP_BENCHMARKS`` is set; run it with ``-s`` to see
+the numbers.
+"""
+
+import json
+import os
+import time
+from unittest.mock import patch
+
+import pytest
+
+from mcp_spotify_player.client_playlists import PLAYLIST_TRACKS_FIELDS
+from mcp_spotify_player.mcp_models import TrackInfo
+from mcp_spotify_player.playlist_controller import PlaylistController
+from mcp_spotify_player.spotify_client import SpotifyClient
+
+MARKETS = [f"{chr(65 + a)}{chr(65 + b)}" for a in range(14) for b in range(13)]
+
+
+def _image(size):
+    return {"url": f"https://i.scdn.co/image/{'ab' * 20}{size}", "height": size, "width": size}
+
+
+def _artist(n):
+    return {
+        "external_urls": {"spotify": f"https://open.spotify.com/artist/artist{n:018d}"},
+        "href": f"https://api.spotify.com/v1/artists/artist{n:018d}",
+        "id": f"artist{n:018d}",
+        "name": f"Artist {n}",
+        "type": "artist",
+        "uri": f"spotify:artist:artist{n:018d}",
+    }
+
+
+def _item(n):
+    track_id = f"track{n:017d}"
+    return {
+        "added_at": "2024-01-01T00:00:00Z",
+        "added_by": {"id": "someone", "type": "user", "uri": "spotify:user:someone"},
+        "is_local": False,
+        "track": {
+            "album": {
+                "album_type": "album",
+                "artists": [_artist(n)],
+                "available_markets": MARKETS,
+                "external_urls": {"spotify": f"https://open.spotify.com/album/album{n:018d}"},
+                "id": f"album{n:018d}",
+                "images": [_image(640), _image(300), _image(64)],
+                "name": f"Album {n}",
+                "release_date": "2020-01-01",
+                "total_tracks": 12,
+                "uri": f"spotify:album:album{n:018d}",
+            },
+            "artists": [_artist(n), _artist(n + 1)],
+            "available_markets": MARKETS,
+            "disc_number": 1,
+            "duration_ms": 200000 + n,
+            "explicit": False,
+            "external_ids": {"isrc": f"USRC1{n:07d}"},
+            "external_urls": {"spotify": f"https://open.spotify.com/track/{track_id}"},
+            "href": f"https://api.spotify.com/v1/tracks/{track_id}",
+            "id": track_id,
+            "name": f"Song {n}",
+            "popularity": 50,
+            "preview_url": None,
+            "track_number": 1,
+            "type": "track",
+            "uri": f"spotify:track:{track_id}",
+        },
+    }
+
+
+def _parse(fields):
+    """Turn ``a(b,c),d`` into ``{"a": {"b": {}, "c": {}}, "d": {}}``."""
+    stack = [{}]
+    name = ""
+    for char in fields + ",":
+        if char in ",()":
+            if name:
+                stack[-1][name] = {}
+            if char == "(":
+                stack.append(stack[-1][name])
+            elif char == ")":
+                stack.pop()
+            name = ""
+        else:
+            name += char
+    return stack[0]
+
+
+def _project(value, tree):
+    if not tree:
+        return value
+    if isinstance(value, list):
+        return [_project(item, tree) for item in value]
+    return {key: _project(value[key], child) for key, child in tree.items() if key in value}
+
+
+def _decode_seconds(payload, rounds=20):
+    start = time.perf_counter()
+    for _ in range(rounds):
+        json.loads(payload)
+    return (time.perf_counter() - start) / rounds
+
+
+def test_fields_filter_covers_every_track_info_field():
+    assert set(TrackInfo.spotify_paths) == set(TrackInfo.model_fields)
+
+
+def test_track_info_reads_only_its_spotify_paths():
+    track = _project(_item(7)["track"], _parse(PLAYLIST_TRACKS_FIELDS)["items"]["track"])
+
+    assert TrackInfo.from_spotify(track) == TrackInfo(
+        name="Song 7",
+        artist="Artist 7",
+        album="Album 7",
+        uri="spotify:track:track00000000000000007",
+        duration_ms=200007,
+        external_url="https://open.spotify.com/track/track00000000000000007",
+    )
+
+
+def _page():
+    return {
+        "items": [_item(n) for n in range(100)],
+        "total": 100,
+        "next": None,
+        "offset": 0,
+        "limit": 100,
+        "href": "https://api.spotify.com/v1/playlists/p/tracks",
+    }
+
+
+def test_playlist_tracks_request_only_the_projected_fields():
+    client = SpotifyClient()
+    with patch.object(client, "_make_request", return_value={"items": []}) as mock_request:
+        client.playlists.get_playlist_tracks("1234567890abcdef", 20)
+
+    assert mock_request.call_args.kwargs["params"] == {
+        "limit": 20,
+        "fields": PLAYLIST_TRACKS_FIELDS,
+    }
+    assert _parse(PLAYLIST_TRACKS_FIELDS) == {
+        "items": {
+            "track": {
+                "name": {},
+                "artists": {"name": {}},
+                "album": {"name": {}},
+                "uri": {},
+                "duration_ms": {},
+                "external_urls": {"spotify": {}},
+            }
+        },
+        "total": {},
+        "next": {},
+        "offset": {},
+        "limit": {},
+    }
+
+
+def test_projected_playlist_page_is_smaller_and_still_parses():
+    page = _page()
+    full = json.dumps(page).encode()
+    projected = json.dumps(_project(page, _parse(PLAYLIST_TRACKS_FIELDS))).encode()
+
+    assert len(projected) * 5 < len(full)
+
+    class DummyPlaylists:
+        def get_playlist_tracks(self, playlist_id, limit):
+            return json.loads(projected)
+
+    client = type("Dummy", (), {"playlists": DummyPlaylists()})()
+    result = PlaylistController(client).get_playlist_tracks("1234567890abcdef", 100)
+
+    assert result["success"] is True
+    assert result["tracks"][0] == {
+        "name": "Song 0",
+        "artist": "Artist 0",
+        "album": "Album 0",
+        "uri": "spotify:track:track00000000000000000",
+        "duration_ms": 200000,
+        "external_url": "https://open.spotify.com/track/track00000000000000000",
+    }
+
+
+@pytest.mark.skipif(not os.getenv("MCP_BENCHMARKS"), reason="set MCP_BENCHMARKS to run timings")
+def test_benchmark_projected_page_decode_time():
+    """Compare JSON decode time of the full and projected page; run with ``-s``."""
+    page = _page()
+    full = json.dumps(page).encode()
+    projected = json.dumps(_project(page, _parse(PLAYLIST_TRACKS_FIELDS))).encode()
+
+    full_time = _decode_seconds(full)
+    projected_time = _decode_seconds(projected)
+    print(
+        f"\nplaylist page of 100 tracks: {len(full)} -> {len(projected)} bytes "
+        f"({len(full) / len(projected):.1f}x), decode {full_time * 1e3:.2f} -> "
+        f"{projected_time * 1e3:.2f} ms"
+    )
+
+    assert projected_time < full_time
@@ -0,0 +1,106 @@
+import json
+import time
+from email.utils import formatdate
+
+import pytest
+import requests
+
+from mcp_spotify.auth.tokens import Tokens
+from mcp_spotify.errors import RateLimitedError
+from mcp_spotify_player.mcp_stdio_server import MCPServer
+from mcp_spotify_player.rate_limiter import (
+    RateLimiter,
+    endpoint_group,
+    parse_retry_after,
+)
+from mcp_spotify_player.spotify_client import SpotifyClient
+
+
+class DummyResponse:
+    def __init__(self, status_code, body, headers=None):
+        self.status_code = status_code
+        self._body = body
+        self.text = "x"
+        self.content = json.dumps(body).encode()
+        self.headers = headers or {}
+
+    def json(self):
+        return self._body
+
+
+def _client() -> SpotifyClient:
+    tokens = Tokens("access", "refresh", int(time.time()) + 3600)
+    return SpotifyClient(
+        lambda: tokens, rate_limiter=RateLimiter(max_rate=10, burst=5)
+    )
+
+
+def test_parse_retry_after_forms():
+    assert parse_retry_after("3") == 3
+    assert parse_retry_after(None) == 1
+    assert parse_retry_after("soon") == 1
+    now = time.time()
+    assert 9 <= parse_retry_after(formatdate(now + 10, usegmt=True), now=now) <= 10
+
+
+def test_endpoint_groups():
+    assert endpoint_group("/me/player/play") == "/me/player"
+    assert endpoint_group("/me/player") == "/me/player"
+    assert endpoint_group("/playlists/abc/tracks?limit=5") == "/playlists"
+    assert endpoint_group("/search") == "/search"
+
+
+def test_429_backs_off_only_the_affected_group():
+    limiter = RateLimiter(max_rate=10, burst=5)
+    limiter.record("/me/player", 429, "5")
+    deadline = time.monotonic() + 1
+    assert limiter.acquire("/search", deadline)
+    assert not limiter.acquire("/me/player", deadline)
+    assert limiter.rate == 5
+    assert limiter.stats()["throttled"] == 1
+
+
+def test_429_is_retried_transparently(monkeypatch):
+    responses = [
+        DummyResponse(429, {"error": {"status": 429}}, {"Retry-After": "0.05"}),
+        DummyResponse(200, {"ok": True}),
+    ]
+    sent = []
+
+    def fake_request(self, method, url, headers=None, **kwargs):
+        sent.append(url)
+        return responses.pop(0)
+
+    monkeypatch.setattr(requests.Session, "request", fake_request)
+    client = _client()
+
+    assert client._make_request("GET", "/me/player") == {"ok": True}
+    assert len(sent) == 2
+    assert client.rate_limiter.throttled == 1
+
+
+def test_retry_after_beyond_deadline_returns_429_then_fails_fast(monkeypatch):
+    sent = []
+
+    def fake_request(self, method, url, headers=None, **kwargs):
+        sent.append(url)
+        return DummyResponse(
+            429, {"error": {"status": 429}}, {"Retry-After": "60"}
+        )
+
+    monkeypatch.setattr(requests.Session, "request", fake_request)
+    monkeypatch.setattr(
+        "mcp_spotify_player.config.Config.RATE_LIMIT_MAX_WAIT", 1
+    )
+    client = _client()
+
+    assert client._make_request("GET", "/me/player") == {"error": {"status": 429}}
+    with pytest.raises(RateLimitedError):
+        client._make_request("PUT", "/me/player/pause")
+    assert len(sent) == 1
+
+
+def test_diagnose_reports_rate_limit_state():
+    server = MCPServer()
+    result = server.execute_tool("diagnose", {})
+    assert any(line.startswith("rate_limit: tokens=") for line in result.splitlines())
@@ -0,0 +1,99 @@
+import json
+import time
+
+import pytest
+import requests
+
+from mcp_spotify.auth.tokens import Tokens
+from mcp_spotify_player.mcp_stdio_server import MCPServer
+from mcp_spotify_player.retry import RetryPolicy
+from mcp_spotify_player.spotify_client import SpotifyClient
+
+
+class DummyResponse:
+    def __init__(self, status_code, body=None):
+        self.status_code = status_code
+        self._body = body or {}
+        self.text = "x"
+        self.content = json.dumps(self._body).encode()
+        self.headers = {}
+
+    def json(self):
+        return self._body
+
+
+def _client(policy: RetryPolicy) -> SpotifyClient:
+    tokens = Tokens("access", "refresh", int(time.time()) + 3600)
+    return SpotifyClient(lambda: tokens, retry_policy=policy)
+
+
+def _patch(monkeypatch, outcomes):
+    sent = []
+
+    def fake_request(self, method, url, headers=None, **kwargs):
+        sent.append(method)
+        outcome = outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    monkeypatch.setattr(requests.Session, "request", fake_request)
+    return sent
+
+
+def test_get_is_retried_after_reset_and_5xx(monkeypatch):
+    sent = _patch(
+        monkeypatch,
+        [
+            requests.ConnectionError("reset"),
+            DummyResponse(503),
+            DummyResponse(200, {"ok": True}),
+        ],
+    )
+    policy = RetryPolicy(max_attempts=3, base_delay=0.01)
+
+    assert _client(policy)._make_request("GET", "/me/player") == {"ok": True}
+    assert sent == ["GET"] * 3
+    assert policy.stats() == {"attempts": 3, "retries": 2, "exhausted": 0}
+
+
+def test_put_volume_is_retried(monkeypatch):
+    sent = _patch(monkeypatch, [requests.Timeout(), DummyResponse(204)])
+    policy = RetryPolicy(max_attempts=3, base_delay=0.01)
+
+    client = _client(policy)
+    client._make_request("PUT", "/me/player/volume", params={"volume_percent": 5})
+    assert sent == ["PUT", "PUT"]
+
+
+def test_post_is_never_retried(monkeypatch):
+    sent = _patch(monkeypatch, [requests.ConnectionError("reset")])
+    policy = RetryPolicy(max_attempts=3, base_delay=0.01)
+
+    with pytest.raises(requests.ConnectionError):
+        _client(policy)._make_request(
+            "POST", "/playlists/p1/tracks", json={"uris": ["spotify:track:1"]}
+        )
+    assert sent == ["POST"]
+    assert policy.stats()["retries"] == 0
+
+
+def test_budget_limits_retries(monkeypatch):
+    sent = _patch(monkeypatch, [DummyResponse(500, {"error": "boom"})] * 5)
+    policy = RetryPolicy(max_attempts=5, base_delay=1, budget=0)
+
+    assert _client(policy)._make_request("GET", "/me/player") == {"error": "boom"}
+    assert sent == ["GET"]
+    assert policy.stats()["exhausted"] == 1
+
+
+def test_backoff_is_jittered_and_capped():
+    policy = RetryPolicy(base_delay=0.5, max_delay=1)
+    delays = [policy.backoff(4) for _ in range(50)]
+    assert all(0 <= delay <= 1 for delay in delays)
+    assert len(set(delays)) > 1
+
+
+def test_diagnose_reports_retries():
+    result = MCPServer().execute_tool("diagnose", {})
+    assert any(line.startswith("retries: attempts=") for line in result.splitlines())
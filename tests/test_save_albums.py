@@ -8,7 +8,7 @@ from mcp_spotify_player.mcp_stdio_server import MCPServer
 def test_spotify_client_save_albums():
     client = SpotifyClient()
     with patch.object(client, "_make_request", return_value=True) as mock_request:
-        assert client.save_albums(["album1", "album2"]) is True
+        assert client.save_albums(["album1", "album2"]) == []
         mock_request.assert_called_once_with(
             "PUT",
             "/me/albums",
@@ -20,13 +20,25 @@ def test_spotify_client_save_albums():
 def test_album_controller_save_albums():
     controller = SpotifyController(lambda: None)
     with patch.object(
-        controller.albums_client, "save_albums", return_value=True
+        controller.albums_client, "save_albums", return_value=[]
     ) as mock_save:
         result = controller.save_albums(["1234567890a"])
         assert result["success"] is True
         mock_save.assert_called_once_with(["1234567890a"])
 
 
+def test_album_controller_save_albums_reports_failed_ids():
+    controller = SpotifyController(lambda: None)
+    ids = [f"album{i:07d}" for i in range(25)]
+    with patch.object(controller.albums_client, "save_albums", return_value=ids[20:]):
+        result = controller.save_albums(ids)
+    assert result == {
+        "success": False,
+        "message": "20 of 25 albums saved; could not save 5",
+        "failed_ids": ids[20:],
+    }
+
+
 def test_album_controller_save_albums_invalid():
     controller = SpotifyController(lambda: None)
     result = controller.save_albums(["bad id!"])
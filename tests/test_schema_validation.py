@@ -0,0 +1,149 @@
+import inspect
+import time
+
+import pytest
+
+from mcp_spotify_player.mcp_manifest import MANIFEST
+from mcp_spotify_player.mcp_stdio_server import MCPServer
+from mcp_spotify_player.schema_validation import (
+    POSITION_NUMBER_MESSAGE,
+    compile_schema,
+    compile_validators,
+)
+
+VALIDATORS = compile_validators(MANIFEST)
+ALBUM_ID = "4aawyAB9vmqN3uQ7FjRGTy"
+
+# Mean cost of validating one call, in microseconds
+VALIDATION_BUDGET_US = 20
+
+
+def _error(tool, arguments):
+    with pytest.raises(ValueError) as exc:
+        VALIDATORS[tool](arguments)
+    return str(exc.value)
+
+
+def test_every_tool_gets_a_validator():
+    assert set(VALIDATORS) == {tool["name"] for tool in MANIFEST["tools"]}
+    assert set(MCPServer().TOOL_VALIDATORS) == set(VALIDATORS)
+
+
+def test_manifest_properties_match_the_handlers():
+    server = MCPServer()
+    for tool in MANIFEST["tools"]:
+        handler = server.TOOL_HANDLERS[tool["name"]]
+        if handler.__name__.startswith("_"):
+            continue
+        group = next(
+            group
+            for group in ("playback", "playlists", "albums", "artists")
+            if hasattr(getattr(server.controller, group), tool["name"])
+        )
+        method = getattr(getattr(server.controller, group), tool["name"])
+        assert set(inspect.signature(method).parameters) == set(
+            tool["inputSchema"].get("properties", {})
+        ), tool["name"]
+
+
+def test_required_arguments_and_messages():
+    assert _error("set_volume", {}) == "volume_percent is required"
+    assert _error("add_tracks_to_playlist", {"playlist_id": ALBUM_ID}) == "track_uris is required"
+    assert _error("queue_add", {"uri": ""}) == "uri is required"
+    assert _error("set_repeat", {"state": "all"}) == "state must be 'track', 'context', or 'off'"
+    assert _error("search_collections", {"q": "a", "type": "album", "limit": 0}) == (
+        "limit must be an integer between 1 and 50"
+    )
+    assert _error("get_artist_top_tracks", {"artist_id": ALBUM_ID, "market": "USA"}) == (
+        "market must be a 2-character string"
+    )
+    assert _error("get_albums", {"album_ids": [ALBUM_ID, 3]}) == (
+        "album_ids must be a list of strings"
+    )
+
+
+def test_unknown_arguments_are_rejected_only_where_the_schema_says_so():
+    assert _error("queue_list", {"limit": 5, "offset": 1}) == "queue_list only accepts 'limit'"
+    VALIDATORS["pause_music"]({"force": True})
+    VALIDATORS["get_album"]({"album_id": ALBUM_ID, "market": "ES"})
+    closed = compile_schema("tool", {"type": "object", "additionalProperties": False})
+    with pytest.raises(ValueError, match="tool takes no arguments"):
+        closed({"force": True})
+
+
+def test_integer_strings_are_converted():
+    arguments = {"limit": "5"}
+    VALIDATORS["queue_list"](arguments)
+    assert arguments == {"limit": 5}
+
+    arguments = {"volume_percent": "40"}
+    VALIDATORS["set_volume"](arguments)
+    assert arguments == {"volume_percent": 40}
+
+    assert _error("queue_list", {"limit": "0"}) == "limit must be a positive integer"
+    assert _error("queue_list", {"limit": "five"}) == "limit must be a positive integer"
+
+
+@pytest.mark.parametrize(
+    "tool, arguments",
+    [
+        ("get_album", {"album_id": "12"}),
+        ("get_playlist_tracks", {"playlist_id": "3"}),
+        ("save_albums", {"album_ids": [ALBUM_ID, "7"]}),
+    ],
+)
+def test_spotify_id_format_rejects_position_numbers(tool, arguments):
+    assert _error(tool, arguments) == POSITION_NUMBER_MESSAGE
+
+
+def test_defaults_fill_absent_and_null_arguments():
+    arguments = {"artist_id": ALBUM_ID, "market": None}
+    VALIDATORS["get_artist_top_tracks"](arguments)
+    assert arguments == {"artist_id": ALBUM_ID, "market": "US", "limit": 10}
+
+    arguments = {"q": "a", "type": "album", "limit": 5}
+    VALIDATORS["search_collections"](arguments)
+    assert arguments == {"q": "a", "type": "album", "limit": 5, "offset": 0}
+
+
+def test_one_of_accepts_exactly_one_branch():
+    validate = VALIDATORS["get_saved_albums"]
+    for limit in (1, 500, "all"):
+        validate({"limit": limit})
+    assert _error("get_saved_albums", {"limit": True}) == (
+        "limit must be a positive integer or 'all'"
+    )
+
+
+def test_additional_properties_can_be_allowed():
+    validate = compile_schema(
+        "tool", {"type": "object", "properties": {}, "additionalProperties": True}
+    )
+    validate({"anything": 1})
+
+
+def test_benchmark_validation_overhead():
+    """Mean validation cost per call across the manifest; run with ``-s``."""
+    calls = [
+        ("set_volume", {"volume_percent": 50}),
+        ("search_collections", {"q": "jazz", "type": "album", "limit": 10}),
+        ("get_artist_top_tracks", {"artist_id": ALBUM_ID}),
+        ("get_albums", {"album_ids": [ALBUM_ID] * 20}),
+        ("add_tracks_to_playlist", {"playlist_id": ALBUM_ID, "track_uris": ["spotify:track:x"]}),
+        ("get_playlists", {}),
+        ("queue_list", {"limit": 5}),
+    ]
+    rounds = 2000
+
+    start = time.perf_counter()
+    compile_validators(MANIFEST)
+    compile_us = (time.perf_counter() - start) * 1e6
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for tool, arguments in calls:
+            VALIDATORS[tool](dict(arguments))
+    per_call_us = (time.perf_counter() - start) * 1e6 / (rounds * len(calls))
+    print(f"\ncompile: {compile_us:.0f} us; validation: {per_call_us:.2f} us/call")
+
+    assert per_call_us < VALIDATION_BUDGET_US
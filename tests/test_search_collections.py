@@ -82,13 +82,13 @@ def _server():
 def test_validate_search_collections_invalid_type():
     server = _server()
     with pytest.raises(ValueError):
-        server._validate_search_collections({"q": "a", "type": "track"})
+        server.TOOL_VALIDATORS["search_collections"]({"q": "a", "type": "track"})
 
 
 def test_validate_search_collections_invalid_limit():
     server = _server()
     with pytest.raises(ValueError):
-        server._validate_search_collections({"q": "a", "type": "album", "limit": 0})
+        server.TOOL_VALIDATORS["search_collections"]({"q": "a", "type": "album", "limit": 0})
 
 
 # Error handling tests
@@ -0,0 +1,129 @@
+import json
+import threading
+import time
+
+import pytest
+import requests
+
+from mcp_spotify.auth.tokens import Tokens
+from mcp_spotify_player.config import Config
+from mcp_spotify_player.mcp_stdio_server import MCPServer
+from mcp_spotify_player.singleflight import SingleFlight
+from mcp_spotify_player.spotify_client import SpotifyClient
+
+
+class DummyResponse:
+    status_code = 200
+    headers = {}
+    text = "x"
+
+    def __init__(self, body):
+        self._body = body
+        self.content = json.dumps(body).encode()
+
+    def json(self):
+        return self._body
+
+
+def _slow_upstream(monkeypatch, delay=0.2):
+    sent = []
+
+    def fake_request(self, method, url, headers=None, params=None, **kwargs):
+        sent.append((method, url, params))
+        time.sleep(delay)
+        return DummyResponse({"url": url, "params": params})
+
+    monkeypatch.setattr(requests.Session, "request", fake_request)
+    return sent
+
+
+def _client(flight: SingleFlight) -> SpotifyClient:
+    tokens = Tokens("access", "refresh", int(time.time()) + 3600)
+    return SpotifyClient(lambda: tokens, single_flight=flight)
+
+
+def _run_together(n, fn):
+    results = [None] * n
+    barrier = threading.Barrier(n)
+
+    def worker(i):
+        barrier.wait()
+        results[i] = fn(i)
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(n)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+def test_identical_gets_share_one_request(monkeypatch):
+    sent = _slow_upstream(monkeypatch)
+    flight = SingleFlight()
+    client = _client(flight)
+
+    results = _run_together(4, lambda i: client._make_request("GET", "/me/player"))
+
+    assert len(sent) == 1
+    assert results == [{"url": f"{Config.SPOTIFY_API_BASE}/me/player", "params": None}] * 4
+    assert flight.stats()["coalesced"] == 3
+
+
+def test_different_params_and_posts_are_not_coalesced(monkeypatch):
+    sent = _slow_upstream(monkeypatch, delay=0.05)
+    client = _client(SingleFlight())
+
+    gets = _run_together(
+        2, lambda i: client._make_request("GET", "/me/playlists", params={"limit": i + 1})
+    )
+    posts = _run_together(2, lambda i: client._make_request("POST", "/me/player/next"))
+
+    assert len(sent) == 4
+    assert [result["params"] for result in gets] == [{"limit": 1}, {"limit": 2}]
+    assert [result["url"] for result in posts] == [f"{Config.SPOTIFY_API_BASE}/me/player/next"] * 2
+
+
+def test_errors_reach_every_waiter():
+    flight = SingleFlight()
+    started = threading.Event()
+
+    def failing():
+        started.set()
+        time.sleep(0.1)
+        raise RuntimeError("boom")
+
+    errors = []
+
+    def call():
+        try:
+            flight.do("key", failing)
+        except RuntimeError as exc:
+            errors.append(str(exc))
+
+    leader = threading.Thread(target=call)
+    leader.start()
+    started.wait()
+    follower = threading.Thread(target=call)
+    follower.start()
+    leader.join()
+    follower.join()
+
+    assert errors == ["boom", "boom"]
+    assert flight.stats()["in_flight"] == 0
+    with pytest.raises(RuntimeError):
+        flight.do("key", failing)
+
+
+def test_batch_of_same_artist_makes_one_request(monkeypatch):
+    monkeypatch.setattr(Config, "CACHE_ENABLED", False)
+    sent = _slow_upstream(monkeypatch)
+    server = MCPServer()
+    artist_id = "0OdUWJ0sBjDrqHygGUXeCF"
+    calls = [{"name": "get_artist", "arguments": {"artist_id": artist_id}}] * 3
+
+    results = server._execute_calls(calls)
+
+    assert len(results) == 3
+    assert all(artist_id in result["content"][0]["text"] for result in results)
+    assert [url for _, url, _ in sent] == [f"{Config.SPOTIFY_API_BASE}/artists/{artist_id}"]
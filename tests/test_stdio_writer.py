@@ -0,0 +1,121 @@
+import io
+import json
+import sys
+import threading
+import time
+
+from mcp_spotify_player.mcp_manifest import MANIFEST
+from mcp_spotify_player.mcp_stdio_server import MCPServer
+from mcp_spotify_player.stdio_writer import PreEncodedResult, StdioWriter
+
+
+def _stdout():
+    raw = io.BytesIO()
+    return raw, io.TextIOWrapper(raw, encoding="utf-8", write_through=False)
+
+
+def test_writer_writes_utf8_frames_to_the_binary_buffer():
+    raw, stdout = _stdout()
+    writer = StdioWriter(stdout)
+
+    writer.send({"jsonrpc": "2.0", "id": 1, "result": {"text": "Café ♫"}})
+
+    line = raw.getvalue().decode("utf-8")
+    assert line.endswith("\n")
+    assert json.loads(line) == {"jsonrpc": "2.0", "id": 1, "result": {"text": "Café ♫"}}
+    assert writer.stats() == {"frames": 1, "bytes": len(raw.getvalue()), "flushes": 1}
+
+
+def test_writer_falls_back_to_text_streams():
+    stdout = io.StringIO()
+    writer = StdioWriter(stdout)
+
+    writer.send({"id": 2})
+
+    assert json.loads(stdout.getvalue()) == {"id": 2}
+
+
+def test_concurrent_frames_never_interleave():
+    raw, stdout = _stdout()
+    writer = StdioWriter(stdout)
+    payload = "x" * 5000
+
+    threads = [
+        threading.Thread(target=writer.send, args=({"id": n, "text": payload},))
+        for n in range(20)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    lines = raw.getvalue().decode("utf-8").splitlines()
+    assert sorted(json.loads(line)["id"] for line in lines) == list(range(20))
+    assert 1 <= writer.stats()["flushes"] <= 20
+
+
+def test_pre_encoded_result_splices_the_request_id():
+    tools = PreEncodedResult({"tools": MANIFEST["tools"]})
+
+    for request_id in (7, "abc", None):
+        message = json.loads(tools.frame(request_id))
+        assert message == {
+            "jsonrpc": "2.0",
+            "id": request_id,
+            "result": {"tools": MANIFEST["tools"]},
+        }
+
+
+def test_tools_list_is_written_by_the_server(monkeypatch):
+    raw, stdout = _stdout()
+    monkeypatch.setattr(sys, "stdout", stdout)
+    server = MCPServer()
+
+    server.handle_request({"jsonrpc": "2.0", "id": 3, "method": "tools/list"})
+
+    message = json.loads(raw.getvalue())
+    assert message["id"] == 3
+    assert [tool["name"] for tool in message["result"]["tools"]] == [
+        tool["name"] for tool in MANIFEST["tools"]
+    ]
+
+
+def _rate(send, seconds=0.2):
+    count = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < seconds:
+        send(count)
+        count += 1
+    return count / (time.perf_counter() - start)
+
+
+def test_benchmark_messages_per_second():
+    """Compare the old text-mode writer with the binary one; run with ``-s``."""
+    _, text_out = _stdout()
+    _, binary_out = _stdout()
+    writer = StdioWriter(binary_out)
+    tools = PreEncodedResult({"tools": MANIFEST["tools"]})
+    reply = {
+        "jsonrpc": "2.0",
+        "result": {"content": [{"type": "text", "text": json.dumps({"success": True})}]},
+    }
+
+    def text_tools(request_id):
+        response = {"jsonrpc": "2.0", "id": request_id, "result": {"tools": MANIFEST["tools"]}}
+        text_out.write(json.dumps(response, ensure_ascii=False) + "\n")
+        text_out.flush()
+
+    def text_reply(request_id):
+        text_out.write(json.dumps(dict(reply, id=request_id), ensure_ascii=False) + "\n")
+        text_out.flush()
+
+    old_tools = _rate(text_tools)
+    new_tools = _rate(lambda request_id: writer.write_frame(tools.frame(request_id)))
+    old_reply = _rate(text_reply)
+    new_reply = _rate(lambda request_id: writer.send(dict(reply, id=request_id)))
+    print(
+        f"\ntools/list: {old_tools:,.0f} -> {new_tools:,.0f} msg/s; "
+        f"tools/call reply: {old_reply:,.0f} -> {new_reply:,.0f} msg/s"
+    )
+
+    assert new_tools > old_tools
@@ -0,0 +1,105 @@
+import json
+import time
+
+import pytest
+import requests
+
+from mcp_spotify.errors import DeadlineExceededError
+from mcp_spotify_player.config import Config
+from mcp_spotify_player.http_pool import HttpPool
+from mcp_spotify_player.mcp_stdio_server import MCPServer
+from mcp_spotify_player.timeouts import endpoint_timeout, remaining, tool_deadline
+
+API = Config.SPOTIFY_API_BASE
+
+
+class DummyResponse:
+    status_code = 200
+    headers = {}
+
+    def __init__(self, body):
+        self._body = body
+        self.text = "x"
+        self.content = json.dumps(body).encode()
+
+    def json(self):
+        return self._body
+
+
+def test_endpoint_timeout_classes():
+    assert endpoint_timeout("PUT", f"{API}/me/player/volume") == Config.TIMEOUT_CONTROL
+    assert endpoint_timeout("GET", f"{API}/me/playlists") == Config.TIMEOUT_LIBRARY
+    assert endpoint_timeout("GET", f"{API}/playlists/p1/tracks") == Config.TIMEOUT_LIBRARY
+    assert endpoint_timeout("POST", f"{API}/playlists/p1/tracks") == Config.TIMEOUT_DEFAULT
+    assert endpoint_timeout("GET", f"{API}/search") == Config.TIMEOUT_DEFAULT
+    assert endpoint_timeout("POST", Config.SPOTIFY_TOKEN_URL) == Config.TIMEOUT_AUTH
+
+
+def test_pool_sets_timeout_clamped_to_deadline(monkeypatch):
+    seen = []
+
+    def fake_request(self, method, url, headers=None, timeout=None, **kwargs):
+        seen.append(timeout)
+        return DummyResponse({})
+
+    monkeypatch.setattr(requests.Session, "request", fake_request)
+    pool = HttpPool()
+
+    pool.request("GET", f"{API}/me/albums")
+    with tool_deadline(1):
+        pool.request("GET", f"{API}/me/albums")
+    pool.request("GET", f"{API}/me/albums", timeout=3)
+
+    assert seen[0] == Config.TIMEOUT_LIBRARY
+    assert 0 < seen[1] <= 1
+    assert seen[2] == 3
+
+
+def test_expired_deadline_fails_before_sending(monkeypatch):
+    def fake_request(self, *args, **kwargs):  # pragma: no cover - must not run
+        raise AssertionError("request should not be sent")
+
+    monkeypatch.setattr(requests.Session, "request", fake_request)
+    with tool_deadline(0):
+        with pytest.raises(DeadlineExceededError):
+            HttpPool().request("GET", f"{API}/me")
+
+
+def test_nested_deadline_never_extends_outer():
+    with tool_deadline(1):
+        with tool_deadline(60):
+            assert remaining() <= 1
+    assert remaining() is None
+
+
+def test_create_playlist_shares_one_budget(monkeypatch):
+    monkeypatch.setattr(Config, "MCP_TOOL_TIMEOUT", 2)
+    timeouts = []
+
+    def fake_request(self, method, url, headers=None, timeout=None, **kwargs):
+        timeouts.append(timeout)
+        if method == "GET":
+            time.sleep(0.5)
+            return DummyResponse({"id": "me"})
+        return DummyResponse({"id": "p1", "name": "Mix"})
+
+    monkeypatch.setattr(requests.Session, "request", fake_request)
+    server = MCPServer()
+    server.execute_tool("create_playlist", {"playlist_name": "Mix"})
+
+    assert len(timeouts) == 2
+    assert timeouts[0] <= 2
+    assert timeouts[1] <= 1.5
+
+
+def test_batch_deadline_reaches_worker_threads(monkeypatch):
+    monkeypatch.setattr(Config, "MCP_BATCH_TIMEOUT", 5)
+    monkeypatch.setattr(Config, "MCP_TOOL_TIMEOUT", 60)
+    server = MCPServer()
+    server.TOOL_HANDLERS["diagnose"] = lambda: f"{remaining():.0f}"
+
+    results = server._execute_calls(
+        [{"name": "diagnose", "arguments": {}}, {"name": "diagnose", "arguments": {}}]
+    )
+
+    assert [int(r["content"][0]["text"]) for r in results] == [5, 5]
@@ -0,0 +1,137 @@
+import io
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from mcp_spotify.auth.manager import TokenManager
+from mcp_spotify.auth.tokens import Tokens
+from mcp_spotify_player import warmup as warmup_module
+from mcp_spotify_player.http_pool import HttpPool
+from mcp_spotify_player.mcp_stdio_server import MCPServer
+from mcp_spotify_player.warmup import WARMUP_DONE, Warmup
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_HEAD(self):  # noqa: N802
+        self.send_response(404)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def do_GET(self):  # noqa: N802
+        body = b'{"ok": true}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args, **kwargs):
+        return
+
+
+class FakePool:
+    def __init__(self):
+        self.preconnected = []
+
+    def preconnect(self, url):
+        self.preconnected.append(url)
+
+
+@pytest.fixture
+def offline(monkeypatch):
+    resolved = []
+    pool = FakePool()
+    monkeypatch.setattr(
+        warmup_module.socket, "getaddrinfo", lambda host, port, **kw: resolved.append(host)
+    )
+    monkeypatch.setattr(warmup_module, "get_http_pool", lambda: pool)
+    return resolved, pool
+
+
+def _manager(expires_in, refreshes):
+    def refresher(tokens):
+        refreshes.append(tokens.access_token)
+        return Tokens("new", "refresh", int(time.time()) + 3600)
+
+    return TokenManager(
+        Tokens("old", "refresh", int(time.time()) + expires_in), refresher, renew_margin=120
+    )
+
+
+def test_preconnect_leaves_a_reusable_connection():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    url = f"http://127.0.0.1:{httpd.server_address[1]}/"
+    pool = HttpPool(pool_size=2, idle_timeout=60)
+    try:
+        pool.preconnect(url)
+        assert pool.request("GET", url).json() == {"ok": True}
+    finally:
+        pool.close()
+        httpd.shutdown()
+        thread.join()
+
+    assert pool.stats()["opened"] == 1
+    assert pool.stats()["requests"] == 2
+
+
+def test_warmup_resolves_connects_and_refreshes_an_expiring_token(offline):
+    resolved, pool = offline
+    refreshes = []
+    warmup = Warmup(_manager(30, refreshes))
+
+    assert warmup.start()
+    assert warmup.wait(5)
+    assert not warmup.start()
+
+    assert resolved == ["api.spotify.com", "accounts.spotify.com"]
+    assert pool.preconnected == ["https://api.spotify.com/", "https://accounts.spotify.com/"]
+    assert refreshes == ["old"]
+    stats = warmup.stats()
+    assert stats["state"] == WARMUP_DONE
+    assert stats["refreshed"] is True
+    assert stats["errors"] == 0
+    assert {"dns_ms", "connect_ms", "refresh_ms", "total_ms"} <= set(stats)
+
+
+def test_fresh_token_is_kept_and_failed_steps_do_not_stop_the_others(offline, monkeypatch):
+    _, pool = offline
+
+    def no_dns(host, port, **kwargs):
+        raise OSError("no network")
+
+    monkeypatch.setattr(warmup_module.socket, "getaddrinfo", no_dns)
+    refreshes = []
+    warmup = Warmup(_manager(3600, refreshes))
+    warmup.start()
+    warmup.wait(5)
+
+    assert warmup.errors == 1
+    assert len(pool.preconnected) == 2
+    assert refreshes == []
+    assert warmup.stats()["refreshed"] is False
+
+
+def test_initialize_starts_the_warmup_and_diagnose_reports_first_call(offline, monkeypatch):
+    monkeypatch.setattr(sys, "stdout", io.StringIO())
+    server = MCPServer()
+    server.controller.playback.get_devices = lambda: {"success": True, "devices": []}
+
+    server.handle_request({"jsonrpc": "2.0", "id": 1, "method": "initialize", "params": {}})
+    assert server.warmup.wait(5)
+    server.execute_tool("get_devices", {})
+
+    line = next(
+        line
+        for line in server.execute_tool("diagnose", {}).splitlines()
+        if line.startswith("warmup: ")
+    )
+    assert "state=done" in line
+    assert "first_call_ms=None" not in line
+    assert "first_call_ms=" in line